@@ -0,0 +1,133 @@
+import hashlib
+import io
+import json
+import os
+import re
+import tarfile
+import time
+import zipfile
+
+# Transkriptleri tek tek diske yazmadan doğrudan ZIP/TAR arşivine akıtır.
+# Her PDF hazır olur olmaz arşive eklenir; bellekte aynı anda yalnızca eklenen girdi durur.
+# Arşiv kapatılırken en sona manifest.json yazılır: girdi adı, boyut, SHA-256,
+# sayfa sayısı, genel ortalama ve üretilemeyen öğrenciler.
+# Biçim dosya uzantısından seçilir: .zip, .tar, .tar.gz / .tgz
+
+MANIFEST_NAME = 'manifest.json'
+ARCHIVE_FORMATS = [('.tar.gz', 'tar.gz'), ('.tgz', 'tar.gz'), ('.tar', 'tar'), ('.zip', 'zip')]
+
+
+def archive_format(path):
+    lower = path.lower()
+    for suffix, fmt in ARCHIVE_FORMATS:
+        if lower.endswith(suffix):
+            return fmt
+    raise ValueError(f"Desteklenmeyen arşiv biçimi: {os.path.basename(path)} "
+                     f"(.zip, .tar, .tar.gz)")
+
+
+def entry_name(student_info):
+    # "<öğrenci no>_<ad_soyad>.pdf"; dosya adına uygun olmayan karakterler '_' olur
+    parts = [student_info.get('student_id', ''), student_info.get('name', '')]
+    stem = '_'.join(re.sub(r'[^\w.-]+', '_', part).strip('_') for part in parts if part)
+    return f"{stem or 'ogrenci'}.pdf"
+
+
+class TranscriptArchive:
+    def __init__(self, path, compression=False):
+        # compression: ZIP girdilerini sıkıştır (fpdf akışları zaten sıkıştırılmış olduğundan
+        # varsayılan olarak kapalı)
+        self.path = path
+        self.format = archive_format(path)
+        self.entries = []
+        self.failures = []
+        self.bytes = 0
+        self._names = set()
+        if self.format == 'zip':
+            self._zip = zipfile.ZipFile(
+                path, 'w', zipfile.ZIP_DEFLATED if compression else zipfile.ZIP_STORED)
+            self._tar = None
+        else:
+            # Akış kipi ('w|'): geri dönüp yazmaz, çıktı yalnızca sona eklenir
+            self._zip = None
+            self._tar = tarfile.open(path, 'w|gz' if self.format == 'tar.gz' else 'w|')
+
+    def _unique(self, name):
+        # Aynı ada sahip öğrenciler için "_2", "_3"... eklenir
+        root, ext = os.path.splitext(name)
+        candidate = name
+        counter = 2
+        while candidate in self._names or candidate == MANIFEST_NAME:
+            candidate = f"{root}_{counter}{ext}"
+            counter += 1
+        self._names.add(candidate)
+        return candidate
+
+    def _write(self, name, data):
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = self._zip.compression
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def add(self, name, data, **metadata):
+        # data: PDF baytları; metadata manifeste aynen yazılır (student_id, pages, gpa...)
+        name = self._unique(name)
+        self._write(name, data)
+        self.bytes += len(data)
+        self.entries.append({'name': name, 'bytes': len(data),
+                             'sha256': hashlib.sha256(data).hexdigest(), **metadata})
+        return name
+
+    def add_transcript(self, transcript, name=None):
+        # Aynı süreçte çizilen transkript: bellekte üretilir, geçici dosya kullanılmaz
+        data = transcript.render_bytes()
+        info = transcript.student_info
+        return self.add(name or entry_name(info), data,
+                        student_id=info.get('student_id', ''), student_name=info.get('name', ''),
+                        pages=transcript.pdf.page_no(),
+                        gpa=transcript.calculate_gpa() if transcript.use_credits else None)
+
+    def add_failure(self, student_id, error):
+        self.failures.append({'student_id': student_id, 'error': error})
+
+    def manifest(self):
+        return {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'count': len(self.entries),
+            'bytes': self.bytes,
+            'pages': sum(entry.get('pages') or 0 for entry in self.entries),
+            'entries': self.entries,
+            'failed': self.failures
+        }
+
+    def close(self):
+        if self._zip is None and self._tar is None:
+            return
+        self._write(MANIFEST_NAME,
+                    json.dumps(self.manifest(), ensure_ascii=False, indent=2).encode('utf-8'))
+        self._close_file()
+
+    def _close_file(self):
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        self._zip = self._tar = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Yarım arşiv bırakılmaz
+            self._close_file()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        return False
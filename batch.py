@@ -0,0 +1,548 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import excel_export
+import generator_pool
+import gpa_engine
+import grade_scales
+import instrumentation
+import output_profiles
+import resource_cache
+from archive import TranscriptArchive, entry_name
+from catalog import load_catalog
+from cohort_writer import CohortPdfWriter
+from ingestion import (COURSE_SHEET, STUDENT_SHEET, CourseReader, clean_text,
+                       has_student_sheet, iter_students, parse_semester)
+from render_cache import cached_bytes, open_cache, render_cached
+from shards import Checkpoint, checkpoint_path, merge_checkpoints, parse_shard, select_shard
+from transcript_generator import TranscriptGenerator
+from validation import validate_students
+
+# Havuzda işçi başına bekletilen en fazla iş (bellekte biriken sonuçları sınırlar)
+IN_FLIGHT_PER_WORKER = 4
+
+
+def load_cohort(path, students_path=None, catalog=None):
+    # .xlsx: "Öğrenciler" ve "Dersler" sayfaları
+    # .csv/.parquet/.arrow: ders satırları; öğrenci bilgileri students_path dosyasından
+    # (yoksa yalnızca öğrenci numarası kullanılır)
+    # .json: {"system": {...}, "students": [{"student": {...}, "courses": [...]}]}
+    # catalog: catalog.CourseCatalog; yalnızca ders kodu olan satırlar katalogdan tamamlanır
+    system, students = _load_cohort(path, students_path)
+    if catalog is not None:
+        system = catalog.system_info(system)
+        catalog.apply(students)
+    return system, students
+
+
+def _load_cohort(path, students_path):
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        system = data['system']
+        students = [
+            ({k: clean_text(v) for k, v in entry['student'].items()}, entry.get('courses', []))
+            for entry in data['students']
+        ]
+        return system, students
+
+    if students_path is None and has_student_sheet(path):
+        students_path = path
+    reader = CourseReader(path, COURSE_SHEET if students_path == path else None)
+    # Sırasız dosyada bir öğrenci birden fazla grup halinde gelebilir
+    courses_by_student = {}
+    for student_id, rows in reader.iter_students():
+        courses_by_student.setdefault(student_id, []).extend(rows)
+
+    if students_path is None:
+        infos = [{'student_id': student_id} for student_id in courses_by_student]
+    else:
+        infos = list(iter_students(students_path,
+                                   STUDENT_SHEET if students_path == path else None))
+    students = [(info, courses_by_student.get(info['student_id'], [])) for info in infos]
+    return reader.system, students
+
+
+def compute_cohort_gpa(system, students):
+    # Tüm kohortun ortalamaları tek vektörel geçişte; yarıyılı okunamayan satırlar
+    # atlanır (o öğrenci zaten işçide hata ile raporlanır)
+    if not system['use_credits']:
+        return None
+    student_ids, semesters, credits, grades, ects = [], [], [], [], []
+    for student_info, courses in students:
+        for row in courses:
+            try:
+                semester = parse_semester(row['semester'])
+            except (KeyError, ValueError):
+                continue
+            student_ids.append(student_info['student_id'])
+            semesters.append(semester)
+            credits.append(row.get('credits'))
+            grades.append(clean_text(row.get('grade')))
+            ects.append(row.get('ects', 0))
+    if not student_ids:
+        return None
+    return gpa_engine.compute_gpa(student_ids, semesters, credits, grades,
+                                  system['grade_system'], ects)
+
+
+def _course_number(row, field, label):
+    # Eksik değer (ör. ders kodu katalogda bulunamadı) derse göre raporlanır
+    value = row.get(field)
+    if value is None or value == '':
+        course = clean_text(row.get('course_code')) or clean_text(row.get('course_name'))
+        raise ValueError(f"{course}: {label} değeri eksik")
+    return float(value)
+
+
+def build_generator(student_info, courses, system, options=None, gpa_summary=None,
+                    transcript=None):
+    # options: TranscriptGenerator yapıcısına aktarılan ayarlar (ör. output_profile)
+    # system['scales']: fakülteye özgü not ölçeklerinin tanımları (işçi süreçlere aktarılır)
+    # transcript: doldurulacak boş üretici (generator_pool); verilmezse yenisi kurulur
+    grade_scales.ensure_scales(system.get('scales', ()))
+    if transcript is None:
+        transcript = TranscriptGenerator(**(options or {}))
+    if gpa_summary is not None:
+        transcript.set_gpa_summary(gpa_summary)
+    transcript.add_student_info(**student_info)
+    transcript.set_system_info(
+        system['grade_system'],
+        system['use_credits'],
+        system['use_course_code'],
+        system['use_ects']
+    )
+
+    semesters = {}
+    for row in courses:
+        course_data = {}
+        if system['use_course_code']:
+            course_data['course_code'] = clean_text(row.get('course_code'))
+        course_data['course_name'] = clean_text(row.get('course_name'))
+        if system['use_credits']:
+            course_data['credits'] = _course_number(row, 'credits', 'kredi')
+        if system['use_ects']:
+            course_data['ects'] = _course_number(row, 'ects', 'AKTS')
+        course_data['grade'] = clean_text(row.get('grade'))
+        semesters.setdefault(parse_semester(row['semester']), []).append(course_data)
+
+    for semester, semester_courses in semesters.items():
+        transcript.add_semester_courses(semester, semester_courses)
+    return transcript
+
+
+def output_name(student_info):
+    student_id = re.sub(r'[^\w.-]', '_', student_info.get('student_id', ''))
+    return f"{student_id or 'ogrenci'}.pdf"
+
+
+def render_student(student_info, courses, system, output_dir, options=None, gpa_summary=None,
+                   cache=None, collect_metrics=False):
+    # Havuz işçisinde çalışır; hata öğrenci bazında geri döner, toplu işi durdurmaz.
+    # output_dir None ise PDF dosyaya yazılmaz, baytları sonuçla döner ('data')
+    # collect_metrics: aşama kayıtları sonuçla birlikte ana sürece döner ('metrics')
+    start = time.perf_counter()
+    student_id = student_info.get('student_id', '')
+    sink = None
+    if collect_metrics:
+        sink = instrumentation.MemorySink()
+        options = dict(options or {}, recorder=instrumentation.Recorder(sink))
+    result = _render_student(student_info, courses, system, output_dir, options, gpa_summary,
+                             cache, student_id, start)
+    if sink is not None:
+        result['metrics'] = sink.events
+    return result
+
+
+def _render_student(student_info, courses, system, output_dir, options, gpa_summary, cache,
+                    student_id, start):
+    # Üretici işçinin havuzundan alınır, sonuç hazırlanınca temizlenip iade edilir
+    pool = generator_pool.get_pool()
+    transcript = pool.acquire(options)
+    try:
+        build_generator(student_info, courses, system, options, gpa_summary, transcript)
+        if output_dir is None:
+            # Arşiv için: PDF baytları ana sürece döner, diske yazılmaz
+            if cache is not None:
+                data, cached = cached_bytes(transcript, cache)
+            else:
+                data, cached = transcript.render_bytes(), False
+            return {'student_id': student_id, 'ok': True, 'data': data, 'cached': cached,
+                    'bytes': len(data),
+                    'pages': transcript.pdf.page_no() or transcript.page_count(),
+                    'gpa': transcript.calculate_gpa() if transcript.use_credits else None,
+                    'seconds': time.perf_counter() - start}
+        path = os.path.join(output_dir, output_name(student_info))
+        cached = False
+        if cache is not None:
+            cached = render_cached(transcript, path, cache)
+        else:
+            transcript.generate_pdf(path)
+        return {'student_id': student_id, 'ok': True, 'path': path, 'cached': cached,
+                'bytes': os.path.getsize(path), 'seconds': time.perf_counter() - start}
+    except Exception as e:
+        return {'student_id': student_id, 'ok': False, 'error': f"{type(e).__name__}: {e}",
+                'seconds': time.perf_counter() - start}
+    finally:
+        pool.release(transcript)
+
+
+def run_batch(system, students, output_dir, workers=None, on_result=None, options=None,
+              cache=None, recorder=None, checkpoint=None):
+    # cache: render_cache.RenderCache; işçi süreçlerde aynı dizine açılır
+    # recorder: instrumentation kaydedicisi; işçilerin kayıtları burada toplanır
+    # checkpoint: shards.Checkpoint; başarılı her öğrenci bittiği anda kaydedilir
+    collect_metrics = recorder is not None and recorder.enabled
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    start = time.perf_counter()
+    cohort_gpa = compute_cohort_gpa(system, students)
+
+    for student_info, result in _render_pool(system, students, output_dir, workers, options,
+                                             cohort_gpa, cache, collect_metrics):
+        if 'metrics' in result:
+            recorder.replay(result.pop('metrics'))
+        if checkpoint is not None and result['ok']:
+            checkpoint.record(result)
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    return results, _summary(results, time.perf_counter() - start)
+
+
+def write_archive(system, students, path, workers=None, on_result=None, options=None,
+                  cache=None, recorder=None):
+    # PDF'ler işçilerde bellekte üretilir ve bitiş sırasıyla doğrudan arşive eklenir
+    # (archive.TranscriptArchive). Ara dosya yazılmaz; manifest arşivin sonundadır.
+    collect_metrics = recorder is not None and recorder.enabled
+    results = []
+    start = time.perf_counter()
+    cohort_gpa = compute_cohort_gpa(system, students)
+
+    with TranscriptArchive(path) as archive:
+        for student_info, result in _render_pool(system, students, None, workers, options,
+                                                 cohort_gpa, cache, collect_metrics):
+            if 'metrics' in result:
+                recorder.replay(result.pop('metrics'))
+            if result['ok']:
+                result['entry'] = archive.add(
+                    entry_name(student_info), result.pop('data'),
+                    student_id=result['student_id'], student_name=student_info.get('name', ''),
+                    pages=result['pages'], gpa=result['gpa'])
+            else:
+                archive.add_failure(result['student_id'], result['error'])
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    summary = _summary(results, time.perf_counter() - start)
+    summary['archive'] = path
+    summary['bytes'] = archive.bytes
+    return results, summary
+
+
+def _render_pool(system, students, output_dir, workers, options, cohort_gpa, cache,
+                 collect_metrics):
+    # (öğrenci bilgisi, sonuç) çiftlerini bitiş sırasıyla verir. Havuza aynı anda en fazla
+    # IN_FLIGHT_PER_WORKER * işçi sayısı iş verilir; dönen PDF baytları birikmez.
+    workers = workers or os.cpu_count()
+    students = iter(students)
+    with ProcessPoolExecutor(max_workers=workers, initializer=resource_cache.warm_up) as executor:
+        pending = {}
+
+        def submit(limit):
+            for student_info, courses in students:
+                future = executor.submit(
+                    render_student, student_info, courses, system, output_dir, options,
+                    cohort_gpa.for_student(student_info['student_id']) if cohort_gpa else None,
+                    cache, collect_metrics)
+                pending[future] = student_info
+                if len(pending) >= limit:
+                    break
+
+        limit = workers * IN_FLIGHT_PER_WORKER
+        submit(limit)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+            submit(limit)
+
+
+def _summary(results, elapsed):
+    succeeded = sum(1 for r in results if r['ok'])
+    pdf_bytes = sum(r.get('bytes', 0) for r in results if r['ok'])
+    return {
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'seconds': elapsed,
+        'throughput': len(results) / elapsed if elapsed > 0 else 0.0,
+        'cache_hits': sum(1 for r in results if r.get('cached')),
+        'pdf_bytes': pdf_bytes,
+        'bytes_per_transcript': pdf_bytes / succeeded if succeeded else 0.0
+    }
+
+
+def write_combined(system, students, path, on_result=None, options=None,
+                   students_per_volume=None):
+    # Tüm öğrenciler sırayla tek bir PDF'e (veya ciltlere) yazılır; sıra korunduğu
+    # için süreç havuzu kullanılmaz. Verisi hatalı öğrenci atlanır ve raporlanır.
+    results = []
+    start = time.perf_counter()
+    cohort_gpa = compute_cohort_gpa(system, students)
+
+    profile = (options or {}).get('output_profile')
+    with CohortPdfWriter(path, students_per_volume, profile) as writer:
+        for student_info, courses in students:
+            student_start = time.perf_counter()
+            student_id = student_info.get('student_id', '')
+            try:
+                transcript = build_generator(
+                    student_info, courses, system, options,
+                    cohort_gpa.for_student(student_id) if cohort_gpa else None)
+                writer.add(transcript)
+                result = {'student_id': student_id, 'ok': True,
+                          'seconds': time.perf_counter() - student_start}
+            except Exception as e:
+                result = {'student_id': student_id, 'ok': False,
+                          'error': f"{type(e).__name__}: {e}",
+                          'seconds': time.perf_counter() - student_start}
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    elapsed = time.perf_counter() - start
+    succeeded = sum(1 for r in results if r['ok'])
+    # Birleşik belgede font ve logo tüm öğrencilerce paylaşılır; ortalama cilt boyutundan
+    pdf_bytes = sum(os.path.getsize(volume) for volume in writer.paths)
+    summary = {
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'seconds': elapsed,
+        'throughput': len(results) / elapsed if elapsed > 0 else 0.0,
+        'files': writer.paths,
+        'pages': writer.page_count,
+        'pdf_bytes': pdf_bytes,
+        'bytes_per_transcript': pdf_bytes / succeeded if succeeded else 0.0
+    }
+    return results, summary
+
+
+def plan_cohort(system, students, options=None):
+    # Çizim yapmadan çıktı hacmi tahmini: yerleşim ön hesabıyla sayfa sayıları
+    pages = {}
+    failed = 0
+    for student_info, courses in students:
+        try:
+            transcript = build_generator(student_info, courses, system, options)
+            pages[student_info.get('student_id', '')] = transcript.page_count()
+        except Exception:
+            failed += 1
+    return {
+        'students': len(students),
+        'failed': failed,
+        'pages': sum(pages.values()),
+        'multi_page': sum(1 for count in pages.values() if count > 1),
+        'max_pages': max(pages.values(), default=0)
+    }
+
+
+def merge_report(paths, students, report_path=None):
+    merged = merge_checkpoints(paths, [info['student_id'] for info, _ in students])
+    print(f"{merged['expected']} öğrenci, {merged['rendered']} üretilmiş, "
+          f"{len(merged['missing'])} eksik, {len(merged['duplicates'])} birden fazla kez, "
+          f"{len(merged['unexpected'])} kohortta yok")
+    for student_id in merged['missing'][:20]:
+        print(f"EKSİK {student_id}", file=sys.stderr)
+    for student_id, records in list(merged['duplicates'].items())[:20]:
+        print(f"TEKRAR {student_id}: {', '.join(r['checkpoint'] for r in records)}",
+              file=sys.stderr)
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False, indent=2)
+    ok = not (merged['missing'] or merged['duplicates'] or merged['unexpected'])
+    return 0 if ok else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Kohort dosyasından arayüzsüz toplu transkript üretimi")
+    parser.add_argument('cohort',
+                        help="Kohort dosyası (.xlsx, .csv, .parquet, .arrow veya .json)")
+    parser.add_argument('--students',
+                        help="Öğrenci bilgileri dosyası (ders dosyası .csv/.parquet ise)")
+    parser.add_argument('-o', '--output-dir', default='transcripts',
+                        help="PDF'lerin yazılacağı klasör")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--report', help="Öğrenci bazlı sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--catalog',
+                        help="Ders kataloğu (.xlsx/.csv ya da derlenmiş .trcat); satırlarda "
+                             "yalnızca ders kodu yeterli olur")
+    parser.add_argument('--scales', metavar='JSON',
+                        help="Fakülteye özgü not ölçeklerini bu dosyadan yükle")
+    parser.add_argument('--grade-scale', metavar='ÖLÇEK',
+                        help="Not kolonunu bu ölçekle yorumla (ör. --scales ile yüklenen ölçek)")
+    parser.add_argument('--convert-to', metavar='ÖLÇEK',
+                        help="Notun yanında bu ölçekteki karşılığını göster (ör. letter)")
+    parser.add_argument('--output-profile', default=output_profiles.DEFAULT_PROFILE,
+                        choices=output_profiles.profile_names(),
+                        help="Çıktı boyutu profili: sıkıştırma, font ipuçları, logo çözünürlüğü "
+                             "(varsayılan: standard)")
+    parser.add_argument('--combined', metavar='PDF',
+                        help="Tüm öğrencileri yer imli tek bir PDF'e yaz (baskı için)")
+    parser.add_argument('--students-per-volume', type=int,
+                        help="--combined ile: bu sayıda öğrenciden sonra yeni cilde geç")
+    parser.add_argument('--archive', metavar='ARŞİV',
+                        help="PDF'leri klasör yerine doğrudan bu arşive yaz "
+                             "(.zip, .tar, .tar.gz; manifest.json ile)")
+    parser.add_argument('--shard', metavar='I/N',
+                        help="Yalnızca N parçadan I. parçayı üret (öğrenci numarasına göre sabit)")
+    parser.add_argument('--checkpoint', metavar='JSONL',
+                        help="Tamamlanan öğrencilerin kaydı; yeniden başlatınca bunlar atlanır "
+                             "(--shard ile varsayılan: klasörde checkpoint_IofN.jsonl)")
+    parser.add_argument('--merge-checkpoints', nargs='+', metavar='JSONL',
+                        help="Parçaların kayıtlarını birleştir ve her öğrencinin tam bir kez "
+                             "üretildiğini doğrula (PDF üretmez)")
+    parser.add_argument('--validate', action='store_true',
+                        help="PDF üretmeden tüm kohortu doğrula ve hataları listele")
+    parser.add_argument('--plan', action='store_true',
+                        help="PDF üretmeden toplam sayfa sayısını tahmin et")
+    parser.add_argument('--cache-dir',
+                        help="Girdisi değişmeyen transkriptleri bu önbellekten kopyala")
+    parser.add_argument('--cache-size-mb', type=int, default=512,
+                        help="Önbellek boyut sınırı (MB, varsayılan: 512)")
+    parser.add_argument('--results-xlsx', metavar='XLSX',
+                        help="Öğrenci bazlı sonuçların (GNO, yarıyıllar, dosya) yazılacağı Excel")
+    parser.add_argument('--metrics-jsonl',
+                        help="Aşama süre/sayaç kayıtlarını JSON satırı olarak bu dosyaya ekle")
+    parser.add_argument('--metrics-prom',
+                        help="Aşama toplamlarını Prometheus metin dosyasına yaz")
+    args = parser.parse_args(argv)
+    options = {'output_profile': args.output_profile}
+    scales = grade_scales.load_scales(args.scales) if args.scales else []
+    for name in (args.grade_scale, args.convert_to):
+        if name and name not in grade_scales.scale_names():
+            parser.error(f"Bilinmeyen not ölçeği: {name} "
+                         f"({', '.join(grade_scales.scale_names())})")
+    if args.convert_to:
+        options['grade_conversion'] = args.convert_to
+
+    catalog = load_catalog(args.catalog) if args.catalog else None
+    system, students = load_cohort(args.cohort, args.students, catalog)
+    if args.grade_scale:
+        system = dict(system, grade_system=args.grade_scale)
+    if scales:
+        system = dict(system, scales=[scale.to_dict() for scale in scales])
+
+    if args.merge_checkpoints:
+        return merge_report(args.merge_checkpoints, students, args.report)
+
+    # Hatalı hücreler üretimden önce tek raporda listelenir; hatalı öğrenciler yine de
+    # işçide öğrenci bazında atlanır
+    validation = validate_students(system, students)
+    if not validation.ok or args.validate:
+        print(validation.format(20), file=sys.stderr)
+    if args.validate:
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump({'validation': validation.to_dict()}, f, ensure_ascii=False, indent=2)
+        return 0 if validation.ok else 1
+
+    checkpoint = None
+    if args.shard or args.checkpoint:
+        if args.combined or args.archive:
+            parser.error("--shard/--checkpoint yalnızca klasöre üretimle kullanılabilir")
+        shard = None
+        if args.shard:
+            try:
+                index, count = parse_shard(args.shard)
+            except ValueError as e:
+                parser.error(str(e))
+            students = select_shard(students, index, count)
+            shard = args.shard
+        checkpoint = Checkpoint(args.checkpoint or checkpoint_path(args.output_dir, index, count),
+                                shard)
+        total = len(students)
+        students = checkpoint.pending(students)
+        print(f"{total} öğrenci, {total - len(students)} tanesi kontrol noktasından atlandı "
+              f"({checkpoint.path})")
+
+    if args.plan:
+        plan = plan_cohort(system, students, options)
+        print(f"{plan['students']} öğrenci, toplam {plan['pages']} sayfa "
+              f"({plan['multi_page']} öğrenci birden fazla sayfa, en fazla {plan['max_pages']}; "
+              f"{plan['failed']} öğrencinin verisi hatalı)")
+        return 0
+
+    def on_result(result):
+        if not result['ok']:
+            print(f"HATA {result['student_id']}: {result['error']}", file=sys.stderr)
+
+    sinks = []
+    if args.metrics_jsonl:
+        sinks.append(instrumentation.JsonLinesSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        sinks.append(instrumentation.PrometheusTextSink(args.metrics_prom))
+    recorder = instrumentation.Recorder(instrumentation.MultiSink(*sinks)) if sinks else None
+
+    if args.combined:
+        if recorder:
+            options = dict(options, recorder=recorder)
+        results, summary = write_combined(system, students, args.combined, on_result,
+                                          options, args.students_per_volume)
+    else:
+        cache = None
+        if args.cache_dir:
+            cache = open_cache(args.cache_dir, args.cache_size_mb * 1024 * 1024)
+        if args.archive:
+            results, summary = write_archive(system, students, args.archive, args.workers,
+                                             on_result, options, cache, recorder)
+        else:
+            results, summary = run_batch(system, students, args.output_dir, args.workers,
+                                         on_result, options, cache, recorder, checkpoint)
+    if recorder:
+        recorder.close()
+    if checkpoint:
+        checkpoint.close()
+
+    print(f"{summary['total']} transkript, {summary['succeeded']} başarılı, "
+          f"{summary['failed']} hatalı, {summary['seconds']:.1f} sn "
+          f"({summary['throughput']:.1f} transkript/sn)")
+    if summary['succeeded']:
+        print(f"Boyut: {summary['bytes_per_transcript'] / 1024:.1f} KB/transkript "
+              f"(toplam {summary['pdf_bytes'] / 1024 / 1024:.1f} MB, "
+              f"profil: {args.output_profile})")
+    if args.cache_dir and not args.combined:
+        print(f"Önbellek: {summary['cache_hits']} isabet, "
+              f"{summary['succeeded'] - summary['cache_hits']} yeni üretim")
+
+    if args.archive and not args.combined:
+        print(f"Arşiv: {summary['archive']} ({summary['bytes'] / 1024 / 1024:.1f} MB)")
+
+    if args.results_xlsx:
+        start = time.perf_counter()
+        export = excel_export.write_results(args.results_xlsx, students, results,
+                                            compute_cohort_gpa(system, students),
+                                            system['use_ects'])
+        print(f"Sonuç tablosu: {args.results_xlsx} ({export['departments']} bölüm, "
+              f"{time.perf_counter() - start:.1f} sn)")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'validation': validation.to_dict(),
+                       'results': results}, f, ensure_ascii=False, indent=2)
+
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from courses import Course
+
+# Ders başına bellek: sözlük kayıtları ile Course (__slots__ + interned metin) karşılaştırması.
+# Kullanım: python benchmarks/bench_course_memory.py -n 200000
+
+GRADES = ['AA', 'BA', 'BB', 'CB', 'CC', 'DC', 'DD', 'FF']
+
+
+def course_rows(count, distinct_courses):
+    # Excel'den okunan her hücre ayrı bir str nesnesidir; bunu taklit etmek için
+    # metinler her satırda yeniden üretilir
+    for i in range(count):
+        c = i % distinct_courses
+        yield {
+            'course_code': ''.join(['KIM', str(100 + c)]),
+            'course_name': ' '.join(['Genel Kimya Laboratuvarı', str(c)]),
+            'credits': float(3 + c % 3),
+            'ects': float(5 + c % 2),
+            'grade': ''.join(GRADES[i % len(GRADES)]),
+        }
+
+
+def measure(build, count, distinct_courses):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [build(row) for row in course_rows(count, distinct_courses)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--count', type=int, default=200000)
+    parser.add_argument('--distinct-courses', type=int, default=400)
+    args = parser.parse_args()
+
+    dict_bytes = measure(dict, args.count, args.distinct_courses)
+    course_bytes = measure(Course.from_data, args.count, args.distinct_courses)
+    print(f"dict    {dict_bytes:8.1f} bayt/ders")
+    print(f"Course  {course_bytes:8.1f} bayt/ders  ({dict_bytes / course_bytes:.1f}x daha küçük)")
+
+
+if __name__ == '__main__':
+    main()
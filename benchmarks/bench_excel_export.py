@@ -0,0 +1,78 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_export
+from batch import compute_cohort_gpa
+
+# Toplu sonuç tablosu ve bölüm şablonlarının yazım süresi (xlsxwriter constant_memory).
+# Yapay kohort: öğrenciler --departments bölüme dağıtılır, her öğrenciye yarıyıl x ders satırı.
+# Kullanım: python benchmarks/bench_excel_export.py -n 300000 --semesters 8 --courses 6
+
+SYSTEM = {'grade_system': 'letter', 'use_course_code': True, 'use_credits': True,
+          'use_ects': True}
+GRADES = ('AA', 'BA', 'BB', 'CB', 'CC', 'DC', 'DD', 'FF')
+
+
+def build(count, departments, semesters, courses_per_semester):
+    students, results = [], []
+    for index in range(count):
+        student_id = str(100000 + index)
+        department = f'Bölüm {index % departments + 1}'
+        info = {'student_id': student_id, 'name': f'Öğrenci {index}',
+                'faculty': 'Fen-Edebiyat Fakültesi', 'department': department,
+                'graduation_date': '2025', 'start_year': '2021',
+                'dean_name': 'Prof. Dr. Örnek Dekan', 'dean_title': 'Dekan'}
+        courses = [
+            {'semester': semester, 'course_code': f'DRS{semester}{c:02d}',
+             'course_name': f'Ders {semester}-{c}', 'credits': 3.0, 'ects': 5.0,
+             'grade': GRADES[(index + semester + c) % len(GRADES)]}
+            for semester in range(1, semesters + 1) for c in range(courses_per_semester)
+        ]
+        students.append((info, courses))
+        results.append({'student_id': student_id, 'ok': True,
+                        'path': f'transcripts/{student_id}.pdf'})
+    return students, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--count', type=int, default=300000)
+    parser.add_argument('--departments', type=int, default=40)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6)
+    parser.add_argument('--templates', action='store_true',
+                        help="Bölüm şablonlarını (tüm ders satırlarıyla) da yaz")
+    args = parser.parse_args(argv)
+
+    students, results = build(args.count, args.departments, args.semesters, args.courses)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        cohort_gpa = compute_cohort_gpa(SYSTEM, students)
+        gpa_seconds = time.perf_counter() - start
+
+        path = os.path.join(directory, 'sonuclar.xlsx')
+        start = time.perf_counter()
+        excel_export.write_results(path, students, results, cohort_gpa, SYSTEM['use_ects'])
+        elapsed = time.perf_counter() - start
+        print(f"Sonuç tablosu: {args.count} öğrenci, {args.departments} bölüm, "
+              f"{elapsed:.1f} sn ({args.count / elapsed:,.0f} satır/sn), "
+              f"{os.path.getsize(path) / 1024 / 1024:.1f} MB; GNO hesabı {gpa_seconds:.1f} sn")
+
+        if args.templates:
+            rows = args.count * args.semesters * args.courses
+            start = time.perf_counter()
+            paths = excel_export.write_department_templates(
+                os.path.join(directory, 'sablonlar'), SYSTEM, students)
+            elapsed = time.perf_counter() - start
+            print(f"Şablonlar: {len(paths)} dosya, {rows} ders satırı, {elapsed:.1f} sn "
+                  f"({rows / elapsed:,.0f} satır/sn)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
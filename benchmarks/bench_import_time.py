@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Soğuk başlangıç süresi: her modül ayrı bir `python -X importtime` sürecinde içe aktarılır.
+# Modül başına en iyi duvar saati süresi, -X importtime kümülatif süresi, en ağır
+# bağımlılıklar ve ağır kütüphanelerin (pandas, PyQt5, fpdf...) yüklenip yüklenmediği raporlanır.
+# Kullanım: python benchmarks/bench_import_time.py --max-ms 400 -o import_time.json
+
+MODULES = ['gpa_engine', 'ingestion', 'transcript_generator', 'batch', 'transcript']
+HEAVY = ['pandas', 'PyQt5', 'fpdf', 'fontTools', 'xlsxwriter', 'openpyxl', 'pyarrow', 'numpy']
+
+
+def measure(module):
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} içe aktarılamadı:\n{completed.stderr[-2000:]}")
+
+    # Satır biçimi: "import time:  self [us] | cumulative | imported package"
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        # Ad sütunundaki girinti iç içe içe aktarma düzeyini gösterir
+        imports.append((name[1:].rstrip(), int(cumulative_us)))
+
+    top_level = [(name, us) for name, us in imports if not name.startswith(' ')]
+    direct = [(name.strip(), us) for name, us in imports
+              if name.startswith('  ') and not name.startswith('   ')]
+    loaded = {name.strip().split('.')[0] for name, _ in imports}
+    own = next((us for name, us in top_level if name == module), 0)
+    return {
+        'wall_ms': wall * 1000,
+        'import_ms': own / 1000,
+        'heaviest': [[name, us / 1000] for name, us in
+                     sorted(direct, key=lambda item: -item[1])[:8]],
+        'heavy_loaded': [name for name in HEAVY if name in loaded]
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    parser.add_argument('--max-ms', type=float,
+                        help="Herhangi bir modülün en iyi süresi bunu aşarsa çıkış kodu 1")
+    parser.add_argument('-o', '--output', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run['import_ms'])
+        best['wall_ms'] = min(run['wall_ms'] for run in runs)
+        results[module] = best
+        print(f"{module:22s} {best['import_ms']:8.1f} ms içe aktarma  "
+              f"{best['wall_ms']:8.1f} ms süreç  "
+              f"ağır: {', '.join(best['heavy_loaded']) or '-'}")
+        for name, ms in best['heaviest'][:3]:
+            print(f"    {name:30s} {ms:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.max_ms is not None:
+        slow = [m for m, r in results.items() if r['import_ms'] > args.max_ms]
+        if slow:
+            print(f"Eşik ({args.max_ms:.0f} ms) aşıldı: {', '.join(slow)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
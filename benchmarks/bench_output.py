@@ -0,0 +1,105 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resource_cache
+from bench_pool import build
+
+# Bellek içi çıktı (render_bytes / render_to) ile dosya yoluna yazmayı karşılaştırır.
+# 'dosya+okuma', baytlara ihtiyaç duyan çağıranların (HTTP yanıtı, önbellek, arşiv)
+# eskiden yaptığı geçici dosyaya yazıp geri okuma yoludur.
+# Dosya yolları hem tmpfs (/dev/shm) hem disk dizininde ölçülür.
+# Kullanım: python benchmarks/bench_output.py -n 200 --disk-dir /var/tmp
+
+
+def to_path(transcript, directory, index):
+    transcript.generate_pdf(os.path.join(directory, f'{index}.pdf'))
+
+
+def to_path_and_read(transcript, directory, index):
+    path = os.path.join(directory, f'{index}.pdf')
+    transcript.generate_pdf(path)
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def to_bytes(transcript, directory, index):
+    return transcript.render_bytes()
+
+
+def to_buffer(transcript, directory, index):
+    buffer = io.BytesIO()
+    transcript.render_to(buffer)
+    return buffer
+
+
+def run(method, directory, count, semesters, courses):
+    transcripts = [build(i, semesters, courses) for i in range(count)]
+    start = time.perf_counter()
+    for index, transcript in enumerate(transcripts):
+        method(transcript, directory, index)
+    return time.perf_counter() - start
+
+
+def run_delivery(data, directory, count):
+    # Yalnızca teslim maliyeti: aynı baytlar count kez dosyaya ya da belleğe yazılır
+    start = time.perf_counter()
+    if directory is None:
+        for _ in range(count):
+            io.BytesIO().write(data)
+    else:
+        for index in range(count):
+            with open(os.path.join(directory, f'd{index}.pdf'), 'wb') as f:
+                f.write(data)
+    return time.perf_counter() - start
+
+
+def report(label, directory, cases, sample, args):
+    elapsed = run_delivery(sample, directory, args.count)
+    print(f"{label:6s} {'yalnız teslim':22s} {elapsed / args.count * 1e6:9.1f} µs/transkript")
+    for name, method in cases:
+        elapsed = run(method, directory, args.count, args.semesters, args.courses)
+        print(f"{label:6s} {name:22s} {elapsed / args.count * 1000:9.2f} ms/transkript  "
+              f"{args.count / elapsed:7.1f} transkript/sn")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--count', type=int, default=200)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6)
+    parser.add_argument('--tmpfs-dir', default='/dev/shm')
+    parser.add_argument('--disk-dir', default=os.path.dirname(os.path.abspath(__file__)),
+                        help="Diskteki ölçüm dizini (geçici alt dizin açılır)")
+    args = parser.parse_args(argv)
+
+    resource_cache.warm_up()
+    build(0, 1, 1).render_bytes()
+    sample = bytes(build(0, args.semesters, args.courses).render_bytes())
+
+    locations = [('bellek', None)]
+    for label, base in (('tmpfs', args.tmpfs_dir), ('disk', args.disk_dir)):
+        if os.path.isdir(base):
+            locations.append((label, base))
+        else:
+            print(f"{label}: {base} yok, atlandı")
+
+    print(f"{args.count} transkript, {len(sample)} bayt/transkript")
+    for label, base in locations:
+        if base is None:
+            report(label, None, [('render_bytes', to_bytes), ('render_to(BytesIO)', to_buffer)],
+                   sample, args)
+            continue
+        with tempfile.TemporaryDirectory(dir=base) as directory:
+            report(label, directory, [('generate_pdf', to_path), ('dosya+okuma', to_path_and_read)],
+                   sample, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
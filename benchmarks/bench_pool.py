@@ -0,0 +1,97 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resource_cache
+from generator_pool import GeneratorPool
+from transcript_generator import TranscriptGenerator
+
+# Her öğrenci için yeni TranscriptGenerator ile havuzdan alınıp reset() edilen üreticiyi
+# karşılaştırır: gecikme dağılımı (p50/p99) ve bellekte kalan/tepe ayırma.
+# Kullanım: python benchmarks/bench_pool.py -n 300
+
+
+def fill(transcript, index, semesters, courses_per_semester):
+    # Örnek öğrenci (diğer ölçümler de build ile kullanır)
+    transcript.add_student_info(
+        name=f'Öğrenci {index}', student_id=str(100000 + index),
+        faculty='Fen-Edebiyat Fakültesi', department='Kimya',
+        start_year='2021', graduation_date='2025',
+        dean_name='Prof. Dr. Örnek Dekan', dean_title='Fen-Edebiyat Fakültesi Dekanı'
+    )
+    transcript.set_system_info('letter', True, True, True)
+    for semester in range(1, semesters + 1):
+        transcript.add_semester_courses(semester, [
+            {'course_code': f'KIM{semester}{c:02d}', 'course_name': f'Kimya Dersi {semester}-{c}',
+             'credits': 3.0, 'ects': 5.0, 'grade': 'BB'}
+            for c in range(courses_per_semester)
+        ])
+
+
+def build(index, semesters, courses_per_semester):
+    transcript = TranscriptGenerator()
+    fill(transcript, index, semesters, courses_per_semester)
+    return transcript
+
+
+def fresh(index, semesters, courses, pool):
+    return build(index, semesters, courses).render_bytes()
+
+
+def pooled(index, semesters, courses, pool):
+    with pool.generator() as transcript:
+        fill(transcript, index, semesters, courses)
+        return transcript.render_bytes()
+
+
+def run(method, count, semesters, courses):
+    pool = GeneratorPool()
+    timings = []
+    for index in range(count):
+        start = time.perf_counter()
+        method(index, semesters, courses, pool)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings, pool.stats()
+
+
+def measure_memory(method, count, semesters, courses):
+    # tracemalloc çizimi yavaşlattığı için süre ölçümünden ayrı, daha az transkriptle
+    pool = GeneratorPool()
+    tracemalloc.start()
+    for index in range(count):
+        method(index, semesters, courses, pool)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--count', type=int, default=300)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6)
+    parser.add_argument('--memory-count', type=int, default=20,
+                        help="Bellek ölçümündeki transkript sayısı")
+    args = parser.parse_args(argv)
+
+    resource_cache.warm_up()
+    fresh(0, 1, 1, None)
+    for name, method in (('yeni nesne', fresh), ('havuz', pooled)):
+        timings, stats = run(method, args.count, args.semesters, args.courses)
+        current, peak = measure_memory(method, args.memory_count, args.semesters, args.courses)
+        p50 = timings[len(timings) // 2] * 1000
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+        extra = (f"  havuz: {stats['created']} kuruldu, {stats['reused']} yeniden"
+                 if method is pooled else '')
+        print(f"{name:10s} p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  "
+              f"kalan {current / 1024:8.0f} KB  tepe {peak / 1024:8.0f} KB{extra}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
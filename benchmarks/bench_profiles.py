@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import output_profiles
+import resource_cache
+from bench_pool import build
+
+# Çıktı profillerinin boyut/CPU dengesi: transkript başına bayt ve üretim süresi,
+# ayrıca --cohort sayıda transkriptin arşivde kaplayacağı tahmini alan.
+# Süreç başına bir kez yapılan hazırlık (ipuçsuz font, logo) ayrı ölçülür.
+# Kullanım: python benchmarks/bench_profiles.py -n 200 --cohort 300000
+
+
+def render(profile, count, semesters, courses):
+    total_bytes = 0
+    start = time.perf_counter()
+    for index in range(count):
+        transcript = build(index, semesters, courses)
+        transcript.output_profile = profile
+        total_bytes += len(transcript.render_bytes())
+    return time.perf_counter() - start, total_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--count', type=int, default=200)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6)
+    parser.add_argument('--cohort', type=int, default=300000,
+                        help="Arşiv boyutu tahmini için transkript sayısı")
+    parser.add_argument('--profiles', nargs='+', default=output_profiles.profile_names())
+    args = parser.parse_args(argv)
+
+    resource_cache.warm_up()
+    print(f"{args.count} transkript, {args.semesters} yarıyıl x {args.courses} ders")
+    baseline = None
+    for name in args.profiles:
+        profile = output_profiles.get_profile(name)
+        setup, _ = render(profile, 1, 1, 1)
+        elapsed, total_bytes = render(profile, args.count, args.semesters, args.courses)
+        per_transcript = total_bytes / args.count
+        baseline = baseline or per_transcript
+        print(f"{name:10s} {per_transcript / 1024:7.1f} KB/transkript "
+              f"({per_transcript / baseline:5.1%})  "
+              f"{elapsed / args.count * 1000:7.2f} ms/transkript  "
+              f"hazırlık {setup * 1000:6.0f} ms  "
+              f"{args.cohort} transkript: {per_transcript * args.cohort / 1024 ** 3:6.2f} GB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# service.py için yerel yük istemcisi. Her bağlantı keep-alive ile sırayla istek gönderir;
+# durum kodları, verim ve p50/p99 gecikme raporlanır, ardından /metrics okunur.
+# Kullanım:
+#   python benchmarks/bench_service.py --spawn -j 4 -c 32 -n 500
+#   python benchmarks/bench_service.py --port 8080 -c 16 -n 200   (çalışan servise)
+
+LETTERS = ['AA', 'BA', 'BB', 'CB', 'CC', 'DC', 'DD', 'FF']
+
+
+def make_payload(index, semesters, courses):
+    rng = random.Random(index)
+    return {
+        'system': {'grade_system': 'letter', 'use_credits': True,
+                   'use_course_code': True, 'use_ects': True},
+        'student': {'student_id': str(100000 + index), 'name': f'Öğrenci {index}',
+                    'faculty': 'Fen-Edebiyat Fakültesi', 'department': 'Kimya',
+                    'start_year': '2021', 'graduation_date': '2025',
+                    'dean_name': 'Prof. Dr. Örnek Dekan',
+                    'dean_title': 'Fen-Edebiyat Fakültesi Dekanı'},
+        'courses': [
+            {'semester': s, 'course_code': f'KIM{s}{c:02d}',
+             'course_name': f'Kimya Dersi {s}-{c}', 'credits': rng.choice((2, 3, 4)),
+             'ects': rng.choice((4, 5, 6)), 'grade': rng.choice(LETTERS)}
+            for s in range(1, semesters + 1) for c in range(courses)
+        ]
+    }
+
+
+async def request(reader, writer, method, path, body=b''):
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+                 .encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def client(host, port, bodies, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while bodies:
+            body = bodies.pop()
+            start = time.perf_counter()
+            status, data = await request(reader, writer, 'POST', '/transcripts', body)
+            results.append((status, time.perf_counter() - start, len(data)))
+    finally:
+        writer.close()
+
+
+async def run(host, port, concurrency, count, semesters, courses):
+    bodies = [json.dumps(make_payload(i, semesters, courses)).encode('utf-8')
+              for i in range(count)]
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, bodies, results) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await request(reader, writer, 'GET', '/metrics')
+    writer.close()
+    return results, elapsed, json.loads(metrics)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(host, port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Servis başlamadı")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--spawn', action='store_true', help="Servisi bu betik başlatsın")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--queue-size', type=int, default=16)
+    parser.add_argument('-c', '--concurrency', type=int, default=16)
+    parser.add_argument('-n', '--requests', type=int, default=200)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6)
+    args = parser.parse_args(argv)
+
+    process = None
+    port = args.port
+    if args.spawn:
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'service.py'), '--host', args.host,
+             '--port', str(port), '-j', str(args.workers),
+             '--queue-size', str(args.queue_size)], cwd=ROOT)
+    try:
+        wait_for(args.host, port)
+        results, elapsed, metrics = asyncio.run(
+            run(args.host, port, args.concurrency, args.requests, args.semesters, args.courses))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    statuses = {}
+    for status, _, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = sorted(seconds for status, seconds, _ in results if status == 200)
+    ok = len(latencies)
+    print(f"{len(results)} istek, {elapsed:.1f} sn, durumlar: {statuses}")
+    if ok:
+        print(f"başarılı: {ok / elapsed:.1f} PDF/sn  "
+              f"p50 {latencies[ok // 2] * 1000:.0f} ms  "
+              f"p99 {latencies[min(ok - 1, int(ok * 0.99))] * 1000:.0f} ms")
+    print(f"sunucu: {json.dumps(metrics, ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
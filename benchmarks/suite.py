@@ -0,0 +1,283 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch
+import ingestion
+import resource_cache
+from gpa_engine import NUMERIC_SCALES, LETTER_GRADE_POINTS
+
+# Sentetik kohortlarla aşama aşama performans ölçümü.
+# Aşamalar: Excel okuma, tablo doldurma, ortalama hesabı, PDF yerleşimi, PDF serileştirme.
+# Sonuçlar JSON olarak yazılır; --compare ile önceki bir sonuca göre yavaşlama
+# eşiği aşılırsa çıkış kodu 1 olur.
+#
+# Kullanım:
+#   python benchmarks/suite.py --students 200 -o sonuc.json
+#   python benchmarks/suite.py --students 200 --compare sonuc.json --threshold 0.15
+
+GRADE_SYSTEMS = ['letter', 'five', 'ten', 'hundred']
+STAGES = ['excel_parse', 'table_population', 'gpa', 'pdf_layout', 'pdf_serialize']
+LETTERS = sorted(LETTER_GRADE_POINTS)
+
+
+def grade_header(grade_system):
+    return next(h for h, s in ingestion.GRADE_COLUMNS.items() if s == grade_system)
+
+
+def make_cohort(students, semesters, courses, grade_system, use_course_code=True,
+                use_credits=True, use_ects=True, seed=0):
+    # batch.load_cohort ile aynı iki sayfalık düzen (Türkçe başlıklar)
+    import pandas as pd
+
+    rng = random.Random(seed)
+    header = grade_header(grade_system)
+    top = 0 if grade_system == 'letter' else int(round(4 * NUMERIC_SCALES[grade_system]))
+    student_rows, course_rows = [], []
+    for i in range(students):
+        student_id = str(100000 + i)
+        student_rows.append({
+            'Öğrenci No': student_id,
+            'Adı Soyadı': f'Öğrenci {i}',
+            'Fakülte': 'Fen-Edebiyat Fakültesi',
+            'Bölüm': 'Kimya',
+            'Mezuniyet Tarihi': '2025',
+            'Başlangıç Yılı': '2021',
+            'Dekan Adı': 'Prof. Dr. Örnek Dekan',
+            'Dekan Ünvanı': 'Fen-Edebiyat Fakültesi Dekanı'
+        })
+        for semester in range(1, semesters + 1):
+            for c in range(courses):
+                row = {'Öğrenci No': student_id, 'Yarıyıl': semester}
+                if use_course_code:
+                    row['Ders Kodu'] = f'KIM{semester}{c:02d}'
+                row['Ders Adı'] = f'Kimya Dersi {semester}-{c}'
+                if use_credits:
+                    row['Kredi'] = rng.choice((2, 3, 4))
+                if use_ects:
+                    row['AKTS'] = rng.choice((4, 5, 6))
+                row[header] = rng.choice(LETTERS) if top == 0 else rng.randint(top // 2, top)
+                course_rows.append(row)
+    return pd.DataFrame(student_rows), pd.DataFrame(course_rows)
+
+
+def write_cohort(path, student_df, course_df):
+    import pandas as pd
+
+    with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
+        student_df.to_excel(writer, sheet_name=ingestion.STUDENT_SHEET, index=False)
+        course_df.to_excel(writer, sheet_name=ingestion.COURSE_SHEET, index=False)
+
+
+def timed(fn, repeat):
+    # Her tekrar ayrı ölçülür; karşılaştırmada gürültüye en az duyarlı olan min kullanılır
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def stage_result(times, items):
+    best = min(times)
+    return {
+        'seconds_min': best,
+        'seconds_median': statistics.median(times),
+        'items': items,
+        'per_item_ms': best / items * 1000 if items else None
+    }
+
+
+def populate_table(headers, columns):
+    try:
+        from course_model import CourseTableModel
+    except ImportError:
+        return None
+
+    def run():
+        model = CourseTableModel()
+        model.set_columns(headers, columns)
+        # Görünür pencere kadar hücre metni üretilir
+        for row in range(min(50, model.rowCount())):
+            for col in range(model.columnCount()):
+                model.data(model.index(row, col))
+        return model
+    return run
+
+
+def run_scenario(config, repeat, render_limit):
+    from fpdf import FPDF
+
+    student_df, course_df = make_cohort(**config)
+    course_count = len(course_df)
+    stages = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'kohort.xlsx')
+        write_cohort(path, student_df, course_df)
+
+        times, (system, students) = timed(lambda: batch.load_cohort(path), repeat)
+        stages['excel_parse'] = stage_result(times, course_count)
+
+        headers, columns = ingestion.read_table(path, ingestion.COURSE_SHEET)
+        populate = populate_table(headers, columns)
+        if populate is None:
+            stages['table_population'] = {'skipped': 'PyQt5 yok'}
+        else:
+            times, _ = timed(populate, repeat)
+            stages['table_population'] = stage_result(times, course_count)
+
+        times, cohort_gpa = timed(lambda: batch.compute_cohort_gpa(system, students), repeat)
+        stages['gpa'] = stage_result(times, course_count)
+
+    sample = students[:render_limit] if render_limit else students
+
+    def layout():
+        documents = []
+        for student_info, courses in sample:
+            summary = cohort_gpa.for_student(student_info['student_id']) if cohort_gpa else None
+            transcript = batch.build_generator(student_info, courses, system,
+                                               gpa_summary=summary)
+            pdf = FPDF()
+            transcript.render_into(pdf)
+            documents.append(pdf)
+        return documents
+
+    layout_times = []
+    serialize_times = []
+    total_bytes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        documents = layout()
+        layout_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        total_bytes = sum(len(pdf.output()) for pdf in documents)
+        serialize_times.append(time.perf_counter() - start)
+    stages['pdf_layout'] = stage_result(layout_times, len(sample))
+    stages['pdf_serialize'] = stage_result(serialize_times, len(sample))
+    stages['pdf_serialize']['bytes_per_item'] = total_bytes / len(sample) if sample else 0
+    return stages
+
+
+def scenario_name(config):
+    flags = ''.join(flag for flag, key in (('k', 'use_course_code'), ('c', 'use_credits'),
+                                           ('e', 'use_ects')) if config[key]) or '-'
+    return (f"{config['grade_system']}/{flags}/"
+            f"{config['students']}x{config['semesters']}x{config['courses']}")
+
+
+def build_scenarios(args):
+    if args.matrix:
+        flag_sets = list(itertools.product((True, False), repeat=3))
+    else:
+        flag_sets = [(args.course_code, args.credits, args.ects)]
+    scenarios = []
+    for grade_system in args.grade_system or GRADE_SYSTEMS:
+        for use_course_code, use_credits, use_ects in flag_sets:
+            scenarios.append({
+                'students': args.students,
+                'semesters': args.semesters,
+                'courses': args.courses,
+                'grade_system': grade_system,
+                'use_course_code': use_course_code,
+                'use_credits': use_credits,
+                'use_ects': use_ects,
+                'seed': args.seed
+            })
+    return scenarios
+
+
+def compare(current, baseline, threshold):
+    # Aynı adlı senaryo/aşama çiftleri karşılaştırılır; yavaşlayanlar döner
+    regressions = []
+    baseline_scenarios = {s['name']: s for s in baseline['scenarios']}
+    for scenario in current['scenarios']:
+        previous = baseline_scenarios.get(scenario['name'])
+        if previous is None:
+            continue
+        for stage in STAGES:
+            new = scenario['stages'].get(stage, {}).get('seconds_min')
+            old = previous['stages'].get(stage, {}).get('seconds_min')
+            if not new or not old:
+                continue
+            ratio = new / old
+            status = 'YAVAŞLAMA' if ratio > 1 + threshold else 'ok'
+            print(f"{scenario['name']:32s} {stage:18s} {old * 1000:10.1f} ms -> "
+                  f"{new * 1000:10.1f} ms  {ratio:6.2f}x  {status}")
+            if status != 'ok':
+                regressions.append((scenario['name'], stage, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik kohort performans ölçümü")
+    parser.add_argument('--students', type=int, default=100)
+    parser.add_argument('--semesters', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=6, help="Yarıyıl başına ders")
+    parser.add_argument('--grade-system', action='append', choices=GRADE_SYSTEMS,
+                        help="Tekrarlanabilir; varsayılan: tüm not sistemleri")
+    parser.add_argument('--course-code', action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument('--credits', action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument('--ects', action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument('--matrix', action='store_true',
+                        help="Ders kodu/kredi/AKTS kolonlarının tüm kombinasyonları")
+    parser.add_argument('--render-limit', type=int, default=0,
+                        help="PDF aşamalarında kullanılacak en fazla öğrenci (0: hepsi)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--compare', metavar='JSON', help="Karşılaştırılacak önceki sonuç")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="İzin verilen yavaşlama oranı (varsayılan: 0.10)")
+    args = parser.parse_args(argv)
+
+    resource_cache.warm_up()
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'scenarios': []
+    }
+    for config in build_scenarios(args):
+        name = scenario_name(config)
+        stages = run_scenario(config, args.repeat, args.render_limit)
+        results['scenarios'].append({'name': name, 'config': config, 'stages': stages})
+        print(name)
+        for stage in STAGES:
+            result = stages[stage]
+            if 'skipped' in result:
+                print(f"  {stage:18s} atlandı ({result['skipped']})")
+            else:
+                print(f"  {stage:18s} {result['seconds_min'] * 1000:10.1f} ms  "
+                      f"{result['per_item_ms']:8.3f} ms/öğe")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} aşamada eşik (%{args.threshold * 100:.0f}) aşıldı",
+                  file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+
+from ingestion import clean_text, has_sheet, open_rows, to_number
+
+# Ders kataloğu: ders kodu -> ders adı, kredi, AKTS (programa özgü istisnalarla).
+# Kohort dosyalarında satırlar yalnızca ders kodunu taşıyabilir; ad ve krediler
+# katalogdan tamamlanır.
+#
+# Kaynak (.xlsx/.csv/...) bir kez derlenip sıkıştırılmış ikili dosyaya (.trcat) yazılır ve
+# mmap ile açılır; arama, sıralı anahtar tablosunda ikili aramadır. Derlenmiş dosya
+# kaynaktan eskiyse load_catalog onu yeniden üretir.
+#
+# Dosya düzeni (küçük uçlu):
+#   başlık:  MAGIC (8 bayt), kayıt sayısı (uint32), bayraklar (uint32)
+#   kayıtlar: anahtar ofseti, anahtar uzunluğu, ad ofseti, ad uzunluğu, kredi, AKTS
+#             (IHIHdd); anahtar = program + "\0" + ders kodu, baytça sıralı
+#   metin bloğu: UTF-8 anahtarlar ve ders adları
+# Boş kredi/AKTS NaN olarak saklanır; programa özgü kayıtta boş bırakılan alanlar
+# genel (programsız) kayıttan alınır.
+
+CATALOG_COLUMNS = {
+    'Ders Kodu': 'course_code',
+    'Ders Adı': 'course_name',
+    'Kredi': 'credits',
+    'AKTS': 'ects',
+    'Program': 'program'
+}
+CATALOG_SHEET = 'Katalog'
+COMPILED_EXT = '.trcat'
+
+MAGIC = b'TRCAT001'
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<IHIHdd')
+HAS_CREDITS = 1
+HAS_ECTS = 2
+
+_lock = threading.Lock()
+_catalogs = {}
+
+
+def _key(program, code):
+    return f"{program}\0{code}".encode('utf-8')
+
+
+def _number(value):
+    value = to_number(value)
+    if value is None:
+        return math.nan
+    if isinstance(value, str):
+        raise ValueError(f"Sayı bekleniyordu: {value!r}")
+    return value
+
+
+def read_source(path, sheet=None):
+    # (program, ders kodu, ad, kredi, AKTS) satırları
+    if sheet is None and has_sheet(path, CATALOG_SHEET):
+        sheet = CATALOG_SHEET
+    headers, chunks = open_rows(path, sheet)
+    fields = {CATALOG_COLUMNS[h]: i for i, h in enumerate(headers) if h in CATALOG_COLUMNS}
+    if 'course_code' not in fields:
+        raise ValueError("Katalogda 'Ders Kodu' kolonu bulunamadı!")
+
+    def cell(row, field):
+        index = fields.get(field)
+        return row[index] if index is not None and index < len(row) else None
+
+    entries = []
+    line = 1
+    for chunk in chunks:
+        for row in chunk:
+            line += 1
+            code = clean_text(cell(row, 'course_code'))
+            if not code:
+                continue
+            try:
+                entries.append((clean_text(cell(row, 'program')), code,
+                                clean_text(cell(row, 'course_name')),
+                                _number(cell(row, 'credits')), _number(cell(row, 'ects'))))
+            except ValueError as e:
+                raise ValueError(f"Katalog satırı {line} ({code}): {e}")
+    return entries
+
+
+def write_catalog(entries, path):
+    records = {}
+    for program, code, name, credits, ects in entries:
+        key = _key(program, code)
+        if key in records:
+            where = f" ({program})" if program else ''
+            raise ValueError(f"Katalogda {code}{where} birden fazla kez tanımlı")
+        records[key] = (name.encode('utf-8'), credits, ects)
+
+    flags = 0
+    blob = bytearray()
+    table = bytearray()
+    for key in sorted(records):
+        name, credits, ects = records[key]
+        if not math.isnan(credits):
+            flags |= HAS_CREDITS
+        if not math.isnan(ects):
+            flags |= HAS_ECTS
+        key_offset = len(blob)
+        blob += key
+        name_offset = len(blob)
+        blob += name
+        table += RECORD.pack(key_offset, len(key), name_offset, len(name), credits, ects)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(records), flags))
+            f.write(table)
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(records)
+
+
+def compile_catalog(source, path=None, sheet=None):
+    path = path or os.path.splitext(source)[0] + COMPILED_EXT
+    write_catalog(read_source(source, sheet), path)
+    return path
+
+
+class CatalogEntry:
+    __slots__ = ('course_code', 'course_name', 'credits', 'ects')
+
+    def __init__(self, course_code, course_name, credits, ects):
+        self.course_code = course_code
+        self.course_name = course_name
+        self.credits = credits
+        self.ects = ects
+
+    def __repr__(self):
+        return (f"CatalogEntry({self.course_code!r}, {self.course_name!r}, "
+                f"{self.credits!r}, {self.ects!r})")
+
+
+class CourseCatalog:
+    def __init__(self, path, source=None):
+        # source: derlenmiş dosyanın kaynağı; süreçler arası aktarımda yeniden açmak için
+        self.path = path
+        self.source = source or path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, flags = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Geçersiz katalog dosyası: {path}")
+        self.has_credits = bool(flags & HAS_CREDITS)
+        self.has_ects = bool(flags & HAS_ECTS)
+        self._blob = HEADER.size + self._count * RECORD.size
+        # Çözümlenen (program, kod) sonuçları: aynı ders binlerce öğrencide aranır
+        self._resolved = {}
+
+    def __reduce__(self):
+        # İşçi süreçlere dosya yolu gider; her süreç katalogu bir kez açar
+        return load_catalog, (self.source,)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, code):
+        return self.lookup(code) is not None
+
+    def _record(self, index):
+        return RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+
+    def _find(self, key):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length = self._record(middle)[:2]
+            start = self._blob + key_offset
+            current = self._map[start:start + key_length]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return self._record(middle)
+        return None
+
+    def _entry(self, record):
+        _, _, name_offset, name_length, credits, ects = record
+        start = self._blob + name_offset
+        name = self._map[start:start + name_length].decode('utf-8')
+        return (sys.intern(name) if name else None,
+                None if math.isnan(credits) else credits,
+                None if math.isnan(ects) else ects)
+
+    def lookup(self, code, program=None):
+        # Programa özgü kayıt varsa boş olmayan alanları genel kaydın üzerine yazılır
+        program = program or ''
+        cache_key = (program, code)
+        if cache_key in self._resolved:
+            return self._resolved[cache_key]
+        base = self._find(_key('', code))
+        override = self._find(_key(program, code)) if program else None
+        entry = None
+        if base is not None or override is not None:
+            name, credits, ects = self._entry(base) if base else (None, None, None)
+            if override is not None:
+                o_name, o_credits, o_ects = self._entry(override)
+                name = o_name or name
+                credits = credits if o_credits is None else o_credits
+                ects = ects if o_ects is None else o_ects
+            entry = CatalogEntry(sys.intern(code), name, credits, ects)
+        self._resolved[cache_key] = entry
+        return entry
+
+    def resolve(self, course, program=None):
+        # Ders sözlüğü (ya da Course) -> eksik ad/kredi/AKTS katalogdan doldurulmuş sözlük.
+        # Girdide açıkça verilen değerler korunur.
+        data = course.to_dict() if hasattr(course, 'to_dict') else dict(course)
+        code = clean_text(data.get('course_code'))
+        if not code:
+            return data
+        entry = self.lookup(code, program)
+        if entry is None:
+            raise KeyError(f"{code} ders kataloğunda yok")
+        for field in ('course_name', 'credits', 'ects'):
+            if data.get(field) in (None, '') and getattr(entry, field) is not None:
+                data[field] = getattr(entry, field)
+        return data
+
+    def apply(self, students, program_field='department'):
+        # Kohort satırlarını yerinde tamamlar; program öğrencinin bölümüdür.
+        # Katalogda olmayan ders hatası öğrenci bazında işçide raporlansın diye atlanır.
+        for student_info, courses in students:
+            program = student_info.get(program_field)
+            for i, row in enumerate(courses):
+                try:
+                    courses[i] = self.resolve(row, program)
+                except KeyError:
+                    continue
+
+    def system_info(self, system):
+        # Ders dosyasında kredi/AKTS kolonu olmasa da katalogdan gelir
+        return dict(system, use_credits=system['use_credits'] or self.has_credits,
+                    use_ects=system['use_ects'] or self.has_ects)
+
+    def close(self):
+        self._map.close()
+
+
+def load_catalog(path):
+    # Süreç başına tek örnek. Kaynak dosya verilirse yanındaki .trcat gerektiğinde yenilenir.
+    path = os.path.abspath(path)
+    catalog = _catalogs.get(path)
+    if catalog is not None:
+        return catalog
+    with _lock:
+        catalog = _catalogs.get(path)
+        if catalog is None:
+            compiled = path
+            if not path.endswith(COMPILED_EXT):
+                compiled = os.path.splitext(path)[0] + COMPILED_EXT
+                if (not os.path.exists(compiled)
+                        or os.path.getmtime(compiled) < os.path.getmtime(path)):
+                    compile_catalog(path, compiled)
+            catalog = CourseCatalog(compiled, path)
+            _catalogs[path] = catalog
+    return catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ders kataloğunu ikili biçime derle")
+    parser.add_argument('source', help="Katalog dosyası (.xlsx, .csv, .parquet, .arrow)")
+    parser.add_argument('-o', '--output', help="Derlenmiş dosya (varsayılan: <kaynak>.trcat)")
+    args = parser.parse_args(argv)
+    try:
+        path = compile_catalog(args.source, args.output)
+    except ValueError as e:
+        print(f"Katalog derlenemedi: {e}", file=sys.stderr)
+        return 1
+    catalog = CourseCatalog(path)
+    print(f"{len(catalog)} kayıt -> {path} ({os.path.getsize(path)} bayt)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import os
+
+from fpdf import FPDF
+
+import output_profiles
+import resource_cache
+
+# Birden fazla öğrencinin transkriptini tek bir PDF'e art arda yazar (baskı için).
+# Fontlar ve logo tüm belge boyunca tek kopya olarak paylaşılır; her öğrenci için
+# belgenin ana hattına (outline) bir yer imi eklenir.
+#
+# fpdf2 belgeyi output() çağrılana kadar bellekte tutar ve sayfa sayfa diske
+# akıtamaz. Belleği sınırlamak için students_per_volume verilirse belge bu sayıda
+# öğrenciden sonra diske yazılır ve yeni bir cilde geçilir:
+# mezunlar.pdf -> mezunlar_001.pdf, mezunlar_002.pdf, ...
+
+
+class CohortPdfWriter:
+    def __init__(self, path, students_per_volume=None, output_profile=None):
+        self.path = path
+        self.students_per_volume = students_per_volume
+        self.output_profile = output_profiles.get_profile(output_profile)
+        self.paths = []
+        self.student_count = 0
+        self.page_count = 0
+        self._pdf = None
+        self._volume_students = 0
+
+    def volume_path(self, volume):
+        if not self.students_per_volume:
+            return self.path
+        root, ext = os.path.splitext(self.path)
+        return f"{root}_{volume:03d}{ext or '.pdf'}"
+
+    def _new_document(self):
+        pdf = FPDF()
+        pdf.set_title("Transkriptler")
+        resource_cache.install_fonts(pdf)
+        return pdf
+
+    def add(self, transcript, bookmark=None):
+        # transcript: öğrenci bilgileri ve dersleri eklenmiş TranscriptGenerator
+        if self._pdf is None:
+            self._pdf = self._new_document()
+        if bookmark is None:
+            info = transcript.student_info
+            bookmark = f"{info.get('student_id', '')} - {info.get('name', '')}".strip(' -')
+        transcript.render_into(self._pdf, bookmark=bookmark or None)
+        self._volume_students += 1
+        self.student_count += 1
+        if self.students_per_volume and self._volume_students >= self.students_per_volume:
+            self.flush()
+
+    def flush(self):
+        # Açık cildi diske yazar ve belleği serbest bırakır
+        if self._pdf is None:
+            return None
+        path = self.volume_path(len(self.paths) + 1)
+        with output_profiles.applied(self.output_profile, self._pdf):
+            self._pdf.output(path)
+        self.page_count += self._pdf.page_no()
+        self.paths.append(path)
+        self._pdf = None
+        self._volume_students = 0
+        return path
+
+    def close(self):
+        self.flush()
+        return self.paths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._pdf = None
+        return False
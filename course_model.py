@@ -0,0 +1,138 @@
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from ingestion import parse_number
+
+
+def _to_python(value):
+    # NumPy skalerlerini Python tiplerine çevirir, boş hücreler None olur
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def read_course(column, row, fields):
+    # Bir tablo satırı -> (yarıyıl, ders verisi). column(indeks) kolon dizisini verir
+    # (model.column ya da iş parçacığına aktarılan anlık kopya); fields: alan -> indeks
+    def value(field):
+        return _to_python(column(fields[field])[row])
+
+    def text(field):
+        cell = value(field)
+        return '' if cell is None else str(cell)
+
+    semester = value('semester')
+    if isinstance(semester, (int, float)):
+        semester_num = int(semester)
+    else:
+        semester = str(semester)
+        semester_num = int(semester.split('.')[0] if '.' in semester else semester)
+
+    course_data = {}
+    if 'course_code' in fields:
+        course_data['course_code'] = text('course_code')
+    course_data['course_name'] = text('course_name')
+    if 'credits' in fields:
+        course_data['credits'] = parse_number(value('credits'))
+    if 'ects' in fields:
+        course_data['ects'] = parse_number(value('ects'))
+    grade = value('grade')
+    course_data['grade'] = '' if grade is None else grade
+    return semester_num, course_data
+
+
+class CourseTableModel(QAbstractTableModel):
+    # Ders tablosu verisini kolon dizileri halinde tutar.
+    # Hücre metinleri yalnızca görünüm istediğinde (görünür hücreler) üretilir;
+    # transkript oluşturma typed değerleri value() ile doğrudan okur.
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._columns = []
+        self._row_count = 0
+
+    def set_headers(self, headers):
+        # Veri yokken boş tablo başlıkları (şablon kolonları)
+        if self._row_count:
+            return
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._columns = [np.empty(0, dtype=object) for _ in self._headers]
+        self.endResetModel()
+
+    def set_columns(self, headers, columns):
+        # ingestion.read_table çıktısı: başlıklar ve eşit uzunlukta kolon dizileri
+        self.beginResetModel()
+        self._headers = [str(header) for header in headers]
+        self._columns = list(columns)
+        self._row_count = len(columns[0]) if columns else 0
+        self.endResetModel()
+
+    def set_frame(self, df):
+        self.set_columns(df.columns, [df[col].to_numpy() for col in df.columns])
+
+    def clear(self):
+        self.beginResetModel()
+        self._columns = [np.empty(0, dtype=object) for _ in self._headers]
+        self._row_count = 0
+        self.endResetModel()
+
+    def headers(self):
+        return list(self._headers)
+
+    def column(self, col):
+        return self._columns[col]
+
+    def value(self, row, col):
+        return _to_python(self._columns[col][row])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        value = self.value(index.row(), index.column())
+        return '' if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        column = self._columns[col]
+        text = str(value).strip()
+
+        if column.dtype.kind in 'iuf':
+            try:
+                number = parse_number(text)
+                if column.dtype.kind in 'iu' and not number.is_integer():
+                    raise ValueError(text)
+                column[row] = number
+            except ValueError:
+                # Sayısal kolona metin girildi: kolon nesne dizisine yükseltilir
+                column = column.astype(object)
+                self._columns[col] = column
+                column[row] = text
+        else:
+            column[row] = text
+
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
@@ -0,0 +1,67 @@
+import sys
+
+COURSE_FIELDS = ('semester', 'course_code', 'course_name', 'credits', 'ects', 'grade')
+
+
+def _intern(value):
+    # Aynı ders kodu/adı/harf notu binlerce öğrencide tekrar eder; tek kopya tutulur
+    return sys.intern(value) if type(value) is str else value
+
+
+class Course:
+    # Ders kaydı: sözlük yerine sabit alanlı (__slots__) nesne.
+    # Eski sözlük tabanlı kodla uyum için get/[]/in desteklenir;
+    # tanımlı alanlar dışındaki anahtarlar yalnızca varsa 'extra' sözlüğünde tutulur.
+    __slots__ = COURSE_FIELDS + ('extra',)
+
+    def __init__(self, course_code=None, course_name=None, credits=None, ects=None,
+                 grade=None, semester=None, **extra):
+        self.semester = semester
+        self.course_code = _intern(course_code)
+        self.course_name = _intern(course_name)
+        self.credits = credits
+        self.ects = ects
+        self.grade = _intern(grade)
+        self.extra = extra or None
+
+    @classmethod
+    def from_data(cls, data):
+        if isinstance(data, Course):
+            return data
+        return cls(**data)
+
+    def get(self, key, default=None):
+        if key in COURSE_FIELDS:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key) if self.extra else None
+        return default if value is None else value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def to_dict(self):
+        data = {key: getattr(self, key) for key in COURSE_FIELDS
+                if getattr(self, key) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Course):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ', '.join(f'{key}={value!r}' for key, value in self.to_dict().items())
+        return f'Course({fields})'
+
+
+def to_courses(courses):
+    return [Course.from_data(course) for course in courses]
@@ -0,0 +1,304 @@
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+from excel_template import template_headers
+from ingestion import COURSE_COLUMNS, COURSE_SHEET, STUDENT_COLUMNS, STUDENT_SHEET
+
+# Büyük kohortlar için akışlı Excel çıktıları (xlsxwriter constant_memory kipi):
+#   write_results: toplu iş sonrası her öğrencinin GNO'su, yarıyıl ortalamaları, kredi ve
+#       AKTS toplamları ile çıktı dosyası; her bölüm ayrı sayfada, başta bölüm özeti.
+#   write_department_templates: bölüm başına öğrenci bilgileri (varsa dersleri de)
+#       doldurulmuş ders şablonu.
+# constant_memory kipinde her satır bir sonrakine geçilince geçici dosyaya yazılır; bellek
+# kullanımı satır sayısından bağımsızdır. Yazılan hücre geri okunamadığından kolon
+# genişlikleri satırlar yazılırken artımlı izlenir (ColumnWidths) ve kapanışta uygulanır.
+# Yarıyıl değerleri kohort GNO dizilerinden (gpa_engine.CohortGPA) tek geçişte
+# öğrenci x yarıyıl matrisine dizilir; boş hücreler hiç yazılmaz.
+
+SUMMARY_SHEET = 'Özet'
+NO_DEPARTMENT = 'Bölümsüz'
+SHEET_NAME_LIMIT = 31
+MAX_COLUMN_WIDTH = 60
+WORKBOOK_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_numbers': False,
+    'strings_to_formulas': False,
+    'strings_to_urls': False
+}
+HEADER_FORMAT = {
+    'bold': True,
+    'bg_color': '#D3D3D3',
+    'border': 1
+}
+
+STATUS_OK = 'Üretildi'
+STATUS_FAILED = 'Hatalı'
+STATUS_MISSING = 'Üretilmedi'
+
+
+class ColumnWidths:
+    # Kolon başına en uzun değerin uzunluğu; başlıkla başlar
+    def __init__(self, headers):
+        self.widths = [len(header) for header in headers]
+
+    def update(self, col, length):
+        if length > self.widths[col]:
+            self.widths[col] = length
+
+    def apply(self, worksheet):
+        for col, width in enumerate(self.widths):
+            worksheet.set_column(col, col, min(width + 2, MAX_COLUMN_WIDTH))
+
+
+class SheetWriter:
+    # Tek sayfa: başlık, sıradaki satır ve kolon genişlikleri
+    def __init__(self, workbook, name, headers, header_format):
+        self.worksheet = workbook.add_worksheet(name)
+        self.widths = ColumnWidths(headers)
+        self.row = 1
+        for col, header in enumerate(headers):
+            self.worksheet.write_string(0, col, header, header_format)
+        self.worksheet.freeze_panes(1, 0)
+
+    def write_text(self, col, value):
+        if value:
+            text = str(value)
+            self.worksheet.write_string(self.row, col, text)
+            self.widths.update(col, len(text))
+
+    def write_numbers(self, col, values, formats):
+        # Ardışık sayı kolonları; NaN hücre yazılmaz. Biçimli sayılar başlıklarından kısa
+        # olduğundan genişlik izlenmez (hücre başına maliyetin çoğu xlsxwriter'dadır).
+        write_number = self.worksheet.write_number
+        row = self.row
+        for offset, value in enumerate(values):
+            if value == value:
+                write_number(row, col + offset, value, formats[offset % len(formats)])
+
+    def write_value(self, col, value, cell_format=None):
+        # Sayılar sayı, diğerleri metin olarak; boş/NaN hücre yazılmaz
+        if value is None or value == '':
+            return
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if value == value:
+                self.worksheet.write_number(self.row, col, value, cell_format)
+        else:
+            self.write_text(col, value)
+
+    def next_row(self):
+        self.row += 1
+
+    def close(self):
+        self.widths.apply(self.worksheet)
+        if self.row > 1:
+            self.worksheet.autofilter(0, 0, self.row - 1, len(self.widths.widths) - 1)
+
+
+def sheet_name(name, used):
+    # Excel sayfa adı: en fazla 31 karakter, []:*?/\ içermez, büyük/küçük harf duyarsız tekil
+    name = re.sub(r'[\[\]:*?/\\]', ' ', str(name or '')).strip().strip("'") or NO_DEPARTMENT
+    candidate = name[:SHEET_NAME_LIMIT]
+    number = 2
+    while candidate.lower() in used:
+        suffix = f" ({number})"
+        candidate = name[:SHEET_NAME_LIMIT - len(suffix)] + suffix
+        number += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def group_by_department(students, department_field='department'):
+    # Bölüm -> öğrenci listesi; bölümler ada göre, öğrenciler girdi sırasıyla
+    groups = {}
+    for student_info, courses in students:
+        department = student_info.get(department_field) or NO_DEPARTMENT
+        groups.setdefault(department, []).append((student_info, courses))
+    return dict(sorted(groups.items()))
+
+
+def semester_table(cohort_gpa, use_ects):
+    # (öğrenci, yarıyıl) dizileri -> öğrenci başına [YNO, kredi, (AKTS), ...] satırları
+    semesters = np.unique(cohort_gpa.semesters)
+    columns = np.searchsorted(semesters, cohort_gpa.semesters)
+    values = [cohort_gpa.semester_gpa, cohort_gpa.semester_credits]
+    if use_ects:
+        values.append(cohort_gpa.semester_ects)
+    table = np.full((len(cohort_gpa), len(semesters), len(values)), np.nan)
+    for k, column in enumerate(values):
+        table[cohort_gpa.semester_student_index, columns, k] = column
+    return semesters.tolist(), table.reshape(len(cohort_gpa), -1).tolist()
+
+
+def results_headers(semesters, use_ects):
+    headers = ['Öğrenci No', 'Adı Soyadı', 'Durum', 'Dosya', 'GNO', 'Toplam Kredi']
+    if use_ects:
+        headers.append('Toplam AKTS')
+    for semester in semesters:
+        headers += [f'{semester}. Yarıyıl YNO', f'{semester}. Yarıyıl Kredi']
+        if use_ects:
+            headers.append(f'{semester}. Yarıyıl AKTS')
+    headers.append('Hata')
+    return headers
+
+
+def write_results(path, students, results, cohort_gpa=None, use_ects=False,
+                  department_field='department'):
+    # students: (öğrenci bilgisi, dersler) listesi; results: toplu iş sonuçları (herhangi
+    # bir sırada); cohort_gpa: batch.compute_cohort_gpa sonucu (kredisiz sistemde None)
+    import xlsxwriter
+
+    by_id = {result['student_id']: result for result in results}
+    semesters, semester_rows = [], None
+    if cohort_gpa is not None and len(cohort_gpa):
+        semesters, semester_rows = semester_table(cohort_gpa, use_ects)
+        totals = [cohort_gpa.gpa, cohort_gpa.credits] + ([cohort_gpa.ects] if use_ects else [])
+        totals = np.column_stack(totals).tolist()
+    headers = results_headers(semesters, use_ects)
+    first_semester_col = 7 if use_ects else 6
+    error_col = len(headers) - 1
+    groups = group_by_department(students, department_field)
+
+    workbook = xlsxwriter.Workbook(path, WORKBOOK_OPTIONS)
+    header_format = workbook.add_format(HEADER_FORMAT)
+    gpa_format = workbook.add_format({'num_format': '0.00'})
+    number_format = workbook.add_format({'num_format': '0.##'})
+    # GNO/YNO, kredi, (AKTS) üçlüsü hem toplamlarda hem yarıyıllarda aynı sırada
+    value_formats = [gpa_format] + [number_format] * (2 if use_ects else 1)
+    # Özet sayfası ilk sırada açılır, satırları en sonda yazılır
+    summary_sheet = SheetWriter(workbook, SUMMARY_SHEET,
+                                ['Bölüm', 'Sayfa', 'Öğrenci', 'Üretildi', 'Hatalı',
+                                 'Ortalama GNO'], header_format)
+    used = {SUMMARY_SHEET.lower()}
+    summary = []
+    for department, department_students in groups.items():
+        sheet = SheetWriter(workbook, sheet_name(department, used), headers, header_format)
+        succeeded = failed = 0
+        gpa_total = gpa_count = 0
+        for student_info, _ in department_students:
+            student_id = student_info.get('student_id', '')
+            result = by_id.get(student_id)
+            sheet.write_text(0, student_id)
+            sheet.write_text(1, student_info.get('name'))
+            if result is None:
+                sheet.write_text(2, STATUS_MISSING)
+            elif result['ok']:
+                succeeded += 1
+                sheet.write_text(2, STATUS_OK)
+                sheet.write_text(3, result.get('path') or result.get('entry'))
+            else:
+                failed += 1
+                sheet.write_text(2, STATUS_FAILED)
+                sheet.write_text(error_col, result['error'])
+            index = cohort_gpa.index_of(student_id) if semester_rows is not None else None
+            if index is not None:
+                gpa_total += totals[index][0]
+                gpa_count += 1
+                sheet.write_numbers(4, totals[index], value_formats)
+                sheet.write_numbers(first_semester_col, semester_rows[index], value_formats)
+            sheet.next_row()
+        sheet.close()
+        summary.append((department, sheet.worksheet.name, len(department_students),
+                        succeeded, failed, gpa_total / gpa_count if gpa_count else None))
+
+    for department, name, count, succeeded, failed, average in summary:
+        summary_sheet.write_text(0, department)
+        summary_sheet.write_text(1, name)
+        for col, value in ((2, count), (3, succeeded), (4, failed)):
+            summary_sheet.write_value(col, value)
+        summary_sheet.write_value(5, average, gpa_format)
+        summary_sheet.next_row()
+    summary_sheet.close()
+    workbook.close()
+    return {'departments': len(groups), 'students': len(students)}
+
+
+def template_filename(department, used):
+    # Farklı bölüm adları aynı dosya adına inebilir ("Fizik/Astro", "Fizik Astro"):
+    # ad büyük/küçük harf duyarsız tekilleştirilir, şablonlar birbirinin üzerine yazılmaz
+    stem = re.sub(r'[^\w.-]+', '_', department).strip('_.') or NO_DEPARTMENT
+    candidate = stem
+    number = 2
+    while candidate.lower() in used:
+        candidate = f"{stem}_{number}"
+        number += 1
+    used.add(candidate.lower())
+    return candidate + '.xlsx'
+
+
+def write_department_templates(directory, system, students, department_field='department'):
+    # Bölüm başına <klasör>/<bölüm>.xlsx: "Öğrenciler" sayfası öğrenci bilgileriyle,
+    # "Dersler" sayfası öğrencinin mevcut dersleriyle (yoksa yalnızca öğrenci numarasıyla)
+    # doldurulur. Dosyalar load_cohort ile doğrudan okunabilir.
+    import xlsxwriter
+
+    os.makedirs(directory, exist_ok=True)
+    student_headers = list(STUDENT_COLUMNS)
+    student_fields = list(STUDENT_COLUMNS.values())
+    course_headers = ['Öğrenci No'] + template_headers(
+        system.get('grade_system'), system.get('use_course_code'),
+        system.get('use_credits'), system.get('use_ects'))
+    # Not kolonu (Harf Notu, Not (100)...) ders satırında 'grade' alanıdır
+    course_fields = [COURSE_COLUMNS.get(header, 'grade') for header in course_headers]
+
+    paths = []
+    used = set()
+    for department, department_students in group_by_department(
+            students, department_field).items():
+        path = os.path.join(directory, template_filename(department, used))
+        workbook = xlsxwriter.Workbook(path, WORKBOOK_OPTIONS)
+        header_format = workbook.add_format(HEADER_FORMAT)
+        student_sheet = SheetWriter(workbook, STUDENT_SHEET, student_headers, header_format)
+        course_sheet = SheetWriter(workbook, COURSE_SHEET, course_headers, header_format)
+        for student_info, courses in department_students:
+            for col, field in enumerate(student_fields):
+                student_sheet.write_text(col, student_info.get(field))
+            student_sheet.next_row()
+            for row in courses or [{}]:
+                row = dict(row, student_id=student_info.get('student_id'))
+                for col, field in enumerate(course_fields):
+                    course_sheet.write_value(col, row.get(field))
+                course_sheet.next_row()
+        student_sheet.close()
+        course_sheet.close()
+        workbook.close()
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    from batch import load_cohort
+    from ingestion import GRADE_COLUMNS, has_sheet, iter_students
+
+    parser = argparse.ArgumentParser(
+        description="Bölüm başına öğrenci bilgileri doldurulmuş ders şablonları üret")
+    parser.add_argument('students',
+                        help="Öğrenci listesi ya da kohort dosyası (.xlsx, .csv, .json...)")
+    parser.add_argument('-o', '--output-dir', default='sablonlar',
+                        help="Şablonların yazılacağı klasör")
+    parser.add_argument('--grade-system', default='letter', choices=list(GRADE_COLUMNS.values()),
+                        help="Ders listesi olmayan dosyada not kolonu (varsayılan: letter)")
+    parser.add_argument('--no-course-code', action='store_true', help="Ders kodu kolonu olmasın")
+    parser.add_argument('--no-credits', action='store_true', help="Kredi kolonu olmasın")
+    parser.add_argument('--no-ects', action='store_true', help="AKTS kolonu olmasın")
+    args = parser.parse_args(argv)
+
+    path = args.students
+    if path.lower().endswith('.json') or has_sheet(path, COURSE_SHEET):
+        # Kohort dosyası: mevcut dersler ve not sistemi şablona taşınır
+        system, students = load_cohort(path)
+    else:
+        system = {'grade_system': args.grade_system, 'use_course_code': not args.no_course_code,
+                  'use_credits': not args.no_credits, 'use_ects': not args.no_ects}
+        sheet = STUDENT_SHEET if has_sheet(path, STUDENT_SHEET) else None
+        students = [(info, []) for info in iter_students(path, sheet)]
+    paths = write_department_templates(args.output_dir, system, students)
+    print(f"{len(students)} öğrenci, {len(paths)} bölüm şablonu -> {args.output_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
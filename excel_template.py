@@ -0,0 +1,78 @@
+from ingestion import GRADE_COLUMNS
+
+# Ders şablonu başlıkları ve örnek satırları (arayüzden bağımsız).
+# xlsxwriter yalnızca şablon yazılırken içe aktarılır.
+
+GRADE_HEADERS = {system: header for header, system in GRADE_COLUMNS.items()}
+GRADE_EXAMPLES = {
+    'letter': "BB",
+    'five': "3",
+    'ten': "7",
+    'hundred': "75"
+}
+
+
+def template_headers(grade_system, use_course_code, use_credits, use_ects):
+    headers = ["Yarıyıl"]
+    if use_course_code:
+        headers.append("Ders Kodu")
+    headers.append("Ders Adı")
+    if use_credits:
+        headers.append("Kredi")
+    if use_ects:
+        headers.append("AKTS")
+    if grade_system:
+        headers.append(GRADE_HEADERS[grade_system])
+    return headers
+
+
+def template_rows(grade_system, use_course_code, use_credits, use_ects):
+    # Örnek satırlar doğrulamadan geçmeli: aynı yarıyılda aynı ders tekrar etmez
+    examples = [("1", "MAT101", "Matematik I"), ("1", "FİZ101", "Fizik I"),
+                ("2", "MAT102", "Matematik II")]
+    example_data = [[semester] for semester, _, _ in examples]
+
+    if use_course_code:
+        for row, (_, code, _) in zip(example_data, examples):
+            row.append(code)
+
+    for row, (_, _, name) in zip(example_data, examples):
+        row.append(name)
+
+    if use_credits:
+        for row in example_data:
+            row.append("3")
+
+    if use_ects:
+        for row in example_data:
+            row.append("5")
+
+    if grade_system:
+        for row in example_data:
+            row.append(GRADE_EXAMPLES[grade_system])
+    return example_data
+
+
+def write_template(file_name, headers, rows):
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(file_name)
+    worksheet = workbook.add_worksheet('Dersler')
+
+    header_format = workbook.add_format({
+        'bold': True,
+        'bg_color': '#D3D3D3',
+        'border': 1
+    })
+
+    for col_num, value in enumerate(headers):
+        worksheet.write(0, col_num, value, header_format)
+    for row_num, row in enumerate(rows, 1):
+        for col_num, value in enumerate(row):
+            worksheet.write_string(row_num, col_num, value)
+
+    for idx, col in enumerate(headers):
+        max_length = max([len(str(row[idx])) for row in rows] + [len(col)]) + 2
+        worksheet.set_column(idx, idx, max_length)
+
+    workbook.close()
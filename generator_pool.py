@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager
+
+import instrumentation
+import output_profiles
+from transcript_generator import TranscriptGenerator
+
+# Süreç (işçi) başına küçük TranscriptGenerator havuzu.
+# Uzun süre çalışan toplu iş ve servis işçileri her öğrenci için yeni nesne kurmak yerine
+# havuzdan alır; iade edilen nesne reset() ile temizlenip aynı ayarlarla yeniden kullanılır.
+# Nesneler yapıcı ayarlarına (şablon, not dönüşümü, çıktı profili) göre ayrı tutulur;
+# kaydedici (recorder) her alımda yeniden atanır.
+
+DEFAULT_SIZE = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _key(options):
+    return (options.get('grade_conversion'),
+            output_profiles.get_profile(options.get('output_profile')).name)
+
+
+class GeneratorPool:
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.created = 0
+        self.reused = 0
+        self._free = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, options=None):
+        options = options or {}
+        key = _key(options)
+        with self._lock:
+            free = self._free.get(key)
+            transcript = free.pop() if free else None
+            if transcript is not None:
+                self.reused += 1
+            else:
+                self.created += 1
+        if transcript is None:
+            transcript = TranscriptGenerator(**options)
+            transcript._pool_key = key
+        else:
+            transcript.recorder = options.get('recorder') or instrumentation.get_recorder()
+        return transcript
+
+    def release(self, transcript):
+        # Belge ve öğrenci verisi hemen bırakılır; havuz doluysa nesne atılır
+        transcript.reset()
+        with self._lock:
+            free = self._free.setdefault(transcript._pool_key, [])
+            if len(free) < self.size:
+                free.append(transcript)
+
+    @contextmanager
+    def generator(self, options=None):
+        transcript = self.acquire(options)
+        try:
+            yield transcript
+        finally:
+            self.release(transcript)
+
+    def stats(self):
+        with self._lock:
+            idle = sum(len(free) for free in self._free.values())
+        return {'created': self.created, 'reused': self.reused, 'idle': idle}
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = GeneratorPool()
+    return _pool
@@ -0,0 +1,301 @@
+import numpy as np
+
+# Not ölçekleri ve dönüşümleri grade_scales modülünde; eski adlar buradan da kullanılabilir
+from grade_scales import LETTER_GRADE_POINTS, NUMERIC_SCALES, get_scale
+from grade_scales import to_float as _to_float
+
+
+def grade_points(grades, grade_system):
+    # Tüm not kolonu için 4'lük katsayılar (ölçeğin derlenmiş tablolarıyla tek geçiş)
+    return get_scale(grade_system).points(grades)
+
+
+def _safe_divide(numerator, denominator):
+    result = np.zeros_like(numerator, dtype=float)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+class CohortGPA:
+    # compute_gpa sonucu: öğrenci bazlı ve (öğrenci, yarıyıl) bazlı kolon dizileri.
+    # Yarıyıl dizileri öğrenci sırasına, öğrenci içinde yarıyıla göre sıralıdır.
+
+    def __init__(self, student_ids, gpa, credits, ects,
+                 semester_student_index, semesters, semester_gpa,
+                 semester_credits, semester_ects, cumulative_gpa):
+        self.student_ids = student_ids
+        self.gpa = gpa
+        self.credits = credits
+        self.ects = ects
+        self.semester_student_index = semester_student_index
+        self.semesters = semesters
+        self.semester_gpa = semester_gpa
+        self.semester_credits = semester_credits
+        self.semester_ects = semester_ects
+        self.cumulative_gpa = cumulative_gpa
+        self._index = None
+
+    def __len__(self):
+        return len(self.student_ids)
+
+    def index_of(self, student_id):
+        if self._index is None:
+            self._index = {sid: i for i, sid in enumerate(self.student_ids.tolist())}
+        return self._index.get(student_id)
+
+    def for_student(self, student_id):
+        i = self.index_of(student_id)
+        if i is None:
+            return None
+        start, end = np.searchsorted(self.semester_student_index, [i, i + 1])
+        semesters = {}
+        for j in range(start, end):
+            semesters[int(self.semesters[j])] = {
+                'gpa': float(self.semester_gpa[j]),
+                'credits': float(self.semester_credits[j]),
+                'ects': float(self.semester_ects[j]),
+                'cumulative_gpa': float(self.cumulative_gpa[j])
+            }
+        return {
+            'gpa': float(self.gpa[i]),
+            'credits': float(self.credits[i]),
+            'ects': float(self.ects[i]),
+            'semesters': semesters
+        }
+
+
+def compute_gpa(student_ids, semesters, credits, grades, grade_system, ects=None):
+    # Tüm kohort için tek geçişte genel ortalama, yarıyıl ortalaması,
+    # yarıyıl sonu kümülatif ortalama ve kredi/AKTS toplamları.
+    # Kredisi veya notu sayıya çevrilemeyen satırlar hesaba katılmaz.
+    student_ids = np.asarray(student_ids)
+    semesters = np.asarray(semesters, dtype=np.int64)
+    credits = _to_float(credits)
+    points = grade_points(grades, grade_system)
+    ects = np.zeros(len(credits)) if ects is None else np.nan_to_num(_to_float(ects))
+
+    valid = ~(np.isnan(credits) | np.isnan(points))
+    credits = np.where(valid, credits, 0.0)
+    weighted = np.where(valid, credits * points, 0.0)
+
+    unique_students, student_index = np.unique(student_ids, return_inverse=True)
+    student_index = student_index.reshape(-1)
+    n_students = len(unique_students)
+
+    # (öğrenci, yarıyıl) grupları: birleşik anahtar sıralı tekilleştirilir
+    semester_min = semesters.min() if len(semesters) else 0
+    semester_span = (semesters.max() - semester_min + 1) if len(semesters) else 1
+    group_key = student_index * semester_span + (semesters - semester_min)
+    group_keys, group_index = np.unique(group_key, return_inverse=True)
+    group_index = group_index.reshape(-1)
+    n_groups = len(group_keys)
+
+    semester_credits = np.bincount(group_index, weights=credits, minlength=n_groups)
+    semester_weighted = np.bincount(group_index, weights=weighted, minlength=n_groups)
+    semester_ects = np.bincount(group_index, weights=ects, minlength=n_groups)
+    group_student = group_keys // semester_span
+    group_semester = group_keys % semester_span + semester_min
+
+    # Öğrenci içinde yarıyıl sonu kümülatif toplamlar
+    group_starts = np.searchsorted(group_student, np.arange(n_students))
+    running_credits = np.cumsum(semester_credits)
+    running_weighted = np.cumsum(semester_weighted)
+    offset_credits = np.concatenate(([0.0], running_credits))[group_starts][group_student]
+    offset_weighted = np.concatenate(([0.0], running_weighted))[group_starts][group_student]
+    cumulative_gpa = _safe_divide(running_weighted - offset_weighted,
+                                  running_credits - offset_credits)
+
+    total_credits = np.bincount(student_index, weights=credits, minlength=n_students)
+    total_weighted = np.bincount(student_index, weights=weighted, minlength=n_students)
+    total_ects = np.bincount(student_index, weights=ects, minlength=n_students)
+
+    return CohortGPA(
+        student_ids=unique_students,
+        gpa=_safe_divide(total_weighted, total_credits),
+        credits=total_credits,
+        ects=total_ects,
+        semester_student_index=group_student,
+        semesters=group_semester,
+        semester_gpa=_safe_divide(semester_weighted, semester_credits),
+        semester_credits=semester_credits,
+        semester_ects=semester_ects,
+        cumulative_gpa=cumulative_gpa
+    )
+
+
+def grade_point(grade, grade_system):
+    # Tek bir not için katsayı (düzenleme anında kullanılır)
+    return get_scale(grade_system).point(grade)
+
+
+class RunningGPA:
+    # Ders ekleme/silme/güncellemede O(1) güncellenen kredi ve ağırlıklı puan toplamları.
+    # Dersler çağıranın verdiği anahtarla (tablo satırı, (yarıyıl, sıra) ...) tutulur.
+    # Ham değerler saklandığından not sistemi değişince toplamlar yeniden kurulur.
+
+    def __init__(self, grade_system=None):
+        self.grade_system = grade_system
+        self._raw = {}          # anahtar -> (yarıyıl, kredi, not, akts)
+        self._courses = {}      # anahtar -> (yarıyıl, kredi, ağırlıklı puan, akts)
+        self._semesters = {}    # yarıyıl -> [kredi, ağırlıklı puan, akts, ders sayısı]
+        self.credits = 0.0
+        self.weighted = 0.0
+        self.ects = 0.0
+
+    def __len__(self):
+        return len(self._courses)
+
+    def __contains__(self, key):
+        return key in self._courses
+
+    def _contribution(self, semester, credits, grade, ects):
+        if self.grade_system is None:
+            return None
+        try:
+            credits = float(credits)
+            points = grade_point(grade, self.grade_system)
+            semester = int(semester)
+        except (TypeError, ValueError):
+            return None
+        if credits != credits or points != points:
+            return None
+        try:
+            ects = float(ects or 0)
+        except (TypeError, ValueError):
+            ects = 0.0
+        return semester, credits, credits * points, ects
+
+    def add(self, key, semester, credits, grade, ects=0):
+        if key in self._raw:
+            self.remove(key)
+        self._raw[key] = (semester, credits, grade, ects)
+        contribution = self._contribution(semester, credits, grade, ects)
+        if contribution is None:
+            return
+        semester, credits, weighted, ects = contribution
+        self._courses[key] = contribution
+        totals = self._semesters.get(semester)
+        if totals is None:
+            totals = self._semesters[semester] = [0.0, 0.0, 0.0, 0]
+        totals[0] += credits
+        totals[1] += weighted
+        totals[2] += ects
+        totals[3] += 1
+        self.credits += credits
+        self.weighted += weighted
+        self.ects += ects
+
+    update = add
+
+    def remove(self, key):
+        self._raw.pop(key, None)
+        contribution = self._courses.pop(key, None)
+        if contribution is None:
+            return
+        semester, credits, weighted, ects = contribution
+        totals = self._semesters[semester]
+        totals[3] -= 1
+        if totals[3] == 0:
+            del self._semesters[semester]
+        else:
+            totals[0] -= credits
+            totals[1] -= weighted
+            totals[2] -= ects
+        if self._courses:
+            self.credits -= credits
+            self.weighted -= weighted
+            self.ects -= ects
+        else:
+            # Kayan nokta birikimini sıfırla
+            self.credits = self.weighted = self.ects = 0.0
+
+    def clear(self):
+        self._raw.clear()
+        self._courses.clear()
+        self._semesters.clear()
+        self.credits = self.weighted = self.ects = 0.0
+
+    def load(self, keys, semesters, credits, grades, ects=None):
+        # Toplu yükleme (ör. Excel içe aktarma): katsayılar vektörel hesaplanır
+        self.clear()
+        keys = list(keys)
+        if ects is None:
+            ects = [0] * len(keys)
+        for key, raw in zip(keys, zip(semesters, credits, grades, ects)):
+            self._raw[key] = raw
+        if self.grade_system is None or not keys:
+            return
+        semester_values = _to_float(semesters)
+        credit_values = _to_float(credits)
+        ects_values = np.nan_to_num(_to_float(ects))
+        weighted_values = credit_values * grade_points(grades, self.grade_system)
+        for key, semester, credit, weighted, ect in zip(
+                keys, semester_values.tolist(), credit_values.tolist(),
+                weighted_values.tolist(), ects_values.tolist()):
+            if weighted == weighted and semester == semester:
+                self._courses[key] = (int(semester), credit, weighted, ect)
+        self._rebuild_totals()
+
+    def set_grade_system(self, grade_system):
+        if grade_system == self.grade_system:
+            return
+        self.grade_system = grade_system
+        raw = self._raw
+        self._raw = {}
+        self._courses.clear()
+        self._semesters.clear()
+        self.credits = self.weighted = self.ects = 0.0
+        for key, (semester, credits, grade, ects) in raw.items():
+            self.add(key, semester, credits, grade, ects)
+
+    def _rebuild_totals(self):
+        self._semesters.clear()
+        self.credits = self.weighted = self.ects = 0.0
+        for semester, credits, weighted, ects in self._courses.values():
+            totals = self._semesters.get(semester)
+            if totals is None:
+                totals = self._semesters[semester] = [0.0, 0.0, 0.0, 0]
+            totals[0] += credits
+            totals[1] += weighted
+            totals[2] += ects
+            totals[3] += 1
+            self.credits += credits
+            self.weighted += weighted
+            self.ects += ects
+
+    def gpa(self):
+        return self.weighted / self.credits if self.credits > 0 else 0.0
+
+    def semester(self, semester):
+        totals = self._semesters.get(semester)
+        if totals is None:
+            return None
+        credits, weighted, ects, _ = totals
+        return {
+            'gpa': weighted / credits if credits > 0 else 0.0,
+            'credits': credits,
+            'ects': ects
+        }
+
+    def summary(self):
+        # CohortGPA.for_student ile aynı yapı; yarıyıl sayısı kadar iş yapar
+        if not self._courses:
+            return None
+        semesters = {}
+        running_credits = running_weighted = 0.0
+        for semester in sorted(self._semesters):
+            credits, weighted, ects, _ = self._semesters[semester]
+            running_credits += credits
+            running_weighted += weighted
+            semesters[semester] = {
+                'gpa': weighted / credits if credits > 0 else 0.0,
+                'credits': credits,
+                'ects': ects,
+                'cumulative_gpa': running_weighted / running_credits if running_credits > 0 else 0.0
+            }
+        return {
+            'gpa': self.gpa(),
+            'credits': self.credits,
+            'ects': self.ects,
+            'semesters': semesters
+        }
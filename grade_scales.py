@@ -0,0 +1,203 @@
+import json
+
+import numpy as np
+
+# Tanımlanabilir not ölçekleri. Her ölçek arama tablolarına derlenir:
+#   harf ölçeği: sıralı harf dizisi + katsayı dizisi (searchsorted ile arama) ve
+#                100'lük karşılık alt sınırları (sayısal -> harf dönüşümü için eşik dizisi)
+#   sayısal ölçek: en yüksek not; katsayı = not / (en yüksek / 4)
+# Ölçekler arası dönüşüm 100'lük karşılık üzerinden tek geçişte yapılır:
+#   kaynak.to_percent(notlar) -> hedef.from_percent(yüzdeler)
+# Fakülteye özgü ölçekler JSON dosyasından yüklenip (load_scales) adla kullanılır.
+
+LETTER_GRADE_POINTS = {
+    'AA': 4.0, 'BA': 3.5, 'BB': 3.0, 'CB': 2.5,
+    'CC': 2.0, 'DC': 1.5, 'DD': 1.0, 'FF': 0.0
+}
+# Harf notlarının 100'lük karşılık alt sınırları
+LETTER_BANDS = {
+    'AA': 90, 'BA': 85, 'BB': 80, 'CB': 75,
+    'CC': 70, 'DC': 65, 'DD': 60, 'FF': 0
+}
+# Sayısal sistemlerde not / bölen = 4'lük katsayı
+NUMERIC_SCALES = {
+    'five': 1.25,
+    'ten': 2.5,
+    'hundred': 25.0
+}
+
+_scales = {}
+
+
+def to_float(values):
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        result = np.empty(len(values))
+        for i, value in enumerate(values):
+            try:
+                result[i] = float(value)
+            except (TypeError, ValueError):
+                result[i] = np.nan
+        return result
+
+
+class LetterScale:
+    kind = 'letter'
+
+    def __init__(self, name, points, bands=None):
+        # points: harf -> 4'lük katsayı; bands: harf -> 100'lük karşılık alt sınırı
+        # (verilmezse katsayıdan: katsayı / 4 * 100)
+        self.name = name
+        self.grade_points = dict(points)
+        self.bands = dict(bands) if bands else {
+            label: point / 4 * 100 for label, point in points.items()}
+        missing = set(self.grade_points) - set(self.bands)
+        if missing:
+            raise ValueError(f"{name}: {', '.join(sorted(missing))} için karşılık sınırı yok")
+        self.labels = np.array(sorted(self.grade_points))
+        self.label_points = np.array([self.grade_points[g] for g in self.labels])
+        self.label_percent = np.array([float(self.bands[g]) for g in self.labels])
+        order = sorted(self.bands, key=lambda label: self.bands[label])
+        self.band_bounds = np.array([float(self.bands[g]) for g in order])
+        self.band_labels = np.array(order, dtype=object)
+
+    def __reduce__(self):
+        return LetterScale, (self.name, self.grade_points, self.bands)
+
+    def _lookup(self, grades):
+        # Notlar tekilleştirilir, yalnızca tekil değerler tabloda aranır
+        grades = np.asarray(grades, dtype=object).astype(str)
+        uniques, inverse = np.unique(grades, return_inverse=True)
+        positions = np.searchsorted(self.labels, uniques)
+        positions = np.minimum(positions, len(self.labels) - 1)
+        found = self.labels[positions] == uniques
+        inverse = inverse.reshape(-1)
+        return positions[inverse], found[inverse]
+
+    def points(self, grades):
+        # Tabloda olmayan notlar 0 sayılır (calculate_gpa ile aynı davranış)
+        positions, found = self._lookup(grades)
+        return np.where(found, self.label_points[positions], 0.0)
+
+    def point(self, grade):
+        return self.grade_points.get(str(grade), 0.0)
+
+    def valid(self, grades):
+        return self._lookup(grades)[1]
+
+    def to_percent(self, grades):
+        positions, found = self._lookup(grades)
+        return np.where(found, self.label_percent[positions], np.nan)
+
+    def from_percent(self, percent):
+        # Eşik dizisinde sağdan arama: yüzdenin ulaştığı en yüksek alt sınır
+        percent = to_float(percent)
+        positions = np.searchsorted(self.band_bounds, percent, side='right') - 1
+        result = self.band_labels[np.maximum(positions, 0)]
+        result[(positions < 0) | np.isnan(percent)] = None
+        return result
+
+    def format(self, values):
+        return ['' if value is None else str(value) for value in values]
+
+    def to_dict(self):
+        return {'name': self.name, 'type': 'letter', 'points': self.grade_points,
+                'bands': self.bands}
+
+
+class NumericScale:
+    kind = 'numeric'
+
+    def __init__(self, name, maximum):
+        self.name = name
+        self.maximum = float(maximum)
+        self.divisor = self.maximum / 4
+
+    def __reduce__(self):
+        return NumericScale, (self.name, self.maximum)
+
+    def points(self, grades):
+        return to_float(grades) / self.divisor
+
+    def point(self, grade):
+        return float(grade) / self.divisor
+
+    def valid(self, grades):
+        values = to_float(grades)
+        with np.errstate(invalid='ignore'):
+            return (values >= 0) & (values <= self.maximum)
+
+    def to_percent(self, grades):
+        return to_float(grades) / self.maximum * 100
+
+    def from_percent(self, percent):
+        return to_float(percent) * self.maximum / 100
+
+    def format(self, values):
+        return ['' if value != value else f"{round(float(value), 2):g}" for value in values]
+
+    def to_dict(self):
+        return {'name': self.name, 'type': 'numeric', 'max': self.maximum}
+
+
+def register_scale(scale):
+    _scales[scale.name] = scale
+    return scale
+
+
+def get_scale(name):
+    # Ad ya da doğrudan ölçek nesnesi kabul edilir
+    if isinstance(name, (LetterScale, NumericScale)):
+        return name
+    scale = _scales.get(name)
+    if scale is None:
+        raise ValueError(f"Bilinmeyen not sistemi: {name}")
+    return scale
+
+
+def scale_names():
+    return list(_scales)
+
+
+def scale_from_dict(data):
+    # {"name": ..., "type": "letter", "points": {...}, "bands": {...}}
+    # {"name": ..., "type": "numeric", "max": 100}
+    if data.get('type') == 'numeric':
+        return NumericScale(data['name'], data['max'])
+    if data.get('type') == 'letter':
+        return LetterScale(data['name'], data['points'], data.get('bands'))
+    raise ValueError(f"Bilinmeyen ölçek türü: {data.get('type')}")
+
+
+def load_scales(path):
+    # JSON: tek ölçek nesnesi ya da liste; ölçekler adlarıyla kaydedilir
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return [register_scale(scale_from_dict(entry))
+            for entry in (data if isinstance(data, list) else [data])]
+
+
+def ensure_scales(definitions):
+    # Süreçler arası aktarılan tanımlar (ör. toplu işte system['scales']) eksikse kaydedilir
+    for definition in definitions:
+        scale = _scales.get(definition['name'])
+        if scale is None or scale.to_dict() != definition:
+            register_scale(scale_from_dict(definition))
+
+
+def convert(grades, source, target):
+    # Bir not kolonunu kaynak ölçekten hedef ölçeğe dönüştürür (harf: etiket dizisi,
+    # sayısal: float dizisi; dönüştürülemeyen değerler None/NaN)
+    return get_scale(target).from_percent(get_scale(source).to_percent(grades))
+
+
+def convert_labels(grades, source, target):
+    # Görüntüleme için: dönüştürülmüş notların metinleri ('' dönüştürülemeyen)
+    target = get_scale(target)
+    return target.format(convert(grades, source, target))
+
+
+register_scale(LetterScale('letter', LETTER_GRADE_POINTS, LETTER_BANDS))
+for _name, _divisor in NUMERIC_SCALES.items():
+    register_scale(NumericScale(_name, _divisor * 4))
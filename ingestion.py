@@ -0,0 +1,327 @@
+import csv
+import os
+from itertools import islice
+
+# Kohort dosyalarını satır satır (akış halinde) okur; pandas kullanılmaz.
+# .xlsx openpyxl salt okunur kipte, .csv parça parça, .parquet/.arrow pyarrow
+# kayıt grupları halinde okunur. Kolonlar generate_template'in Türkçe başlıklarıyla
+# eşlenir, değerler türüne çevrilir ve dersler öğrenci bazında gruplanarak verilir.
+
+# Kohort dosyasındaki öğrenci sayfası başlıkları -> add_student_info anahtarları
+STUDENT_COLUMNS = {
+    'Öğrenci No': 'student_id',
+    'Adı Soyadı': 'name',
+    'Fakülte': 'faculty',
+    'Bölüm': 'department',
+    'Mezuniyet Tarihi': 'graduation_date',
+    'Başlangıç Yılı': 'start_year',
+    'Dekan Adı': 'dean_name',
+    'Dekan Ünvanı': 'dean_title'
+}
+
+# Ders sayfası başlıkları (generate_template ile aynı isimler)
+COURSE_COLUMNS = {
+    'Öğrenci No': 'student_id',
+    'Yarıyıl': 'semester',
+    'Ders Kodu': 'course_code',
+    'Ders Adı': 'course_name',
+    'Kredi': 'credits',
+    'AKTS': 'ects'
+}
+
+GRADE_COLUMNS = {
+    'Harf Notu': 'letter',
+    'Not (5)': 'five',
+    'Not (10)': 'ten',
+    'Not (100)': 'hundred'
+}
+
+STUDENT_SHEET = 'Öğrenciler'
+COURSE_SHEET = 'Dersler'
+
+CHUNK_SIZE = 10000
+
+FILE_FORMATS = {
+    '.xlsx': 'xlsx',
+    '.xlsm': 'xlsx',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow'
+}
+
+
+def clean_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def parse_semester(value):
+    semester = clean_text(value)
+    return int(semester.split('.')[0] if '.' in semester else semester)
+
+
+def parse_number(value):
+    # Tek sayı çözümleyici (dosya okuma, doğrulama ve arayüz): tek virgül ondalık
+    # ayırıcı kabul edilir ("3,5"); çevrilemezse ValueError
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = str(value).strip()
+    if text.count(',') == 1 and '.' not in text:
+        text = text.replace(',', '.')
+    return float(text)
+
+
+def to_number(value):
+    # Sayıya çevrilemeyen değer olduğu gibi (metin) bırakılır; hata, o öğrencinin
+    # transkripti üretilirken öğrenci bazında raporlanır
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return parse_number(text)
+    except ValueError:
+        return text
+
+
+def _semester_value(value):
+    try:
+        return parse_semester(value)
+    except ValueError:
+        return clean_text(value)
+
+
+def detect_system_info(columns):
+    grade_system = None
+    for header, system in GRADE_COLUMNS.items():
+        if header in columns:
+            grade_system = system
+            break
+    return {
+        'grade_system': grade_system,
+        'use_credits': 'Kredi' in columns,
+        'use_course_code': 'Ders Kodu' in columns,
+        'use_ects': 'AKTS' in columns
+    }
+
+
+def file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FILE_FORMATS:
+        raise ValueError(f"Desteklenmeyen dosya türü: {ext or path}")
+    return FILE_FORMATS[ext]
+
+
+def _chunked(rows, chunk_size):
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _xlsx_sheet_names(path):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def _xlsx_chunks(path, sheet, chunk_size):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet is None:
+            sheet = COURSE_SHEET if COURSE_SHEET in workbook.sheetnames else None
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        headers = [clean_text(h) for h in next(rows, ())]
+        while headers and not headers[-1]:
+            headers.pop()
+        yield headers
+        width = len(headers)
+        # Salt okunur kipte biçimlendirilmiş boş satırlar da gelir; atlanır
+        rows = (row[:width] for row in rows
+                if any(v is not None and v != '' for v in row))
+        yield from _chunked(rows, chunk_size)
+    finally:
+        workbook.close()
+
+
+def _csv_chunks(path, chunk_size):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        rows = csv.reader(f, dialect)
+        yield [h.strip() for h in next(rows, [])]
+        rows = ([v if v != '' else None for v in row] for row in rows if any(row))
+        yield from _chunked(rows, chunk_size)
+
+
+def _arrow_chunks(path, fmt, chunk_size):
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    if fmt == 'parquet':
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        yield list(parquet_file.schema_arrow.names)
+        batches = parquet_file.iter_batches(batch_size=chunk_size)
+    else:
+        reader = pyarrow.ipc.open_file(path)
+        yield list(reader.schema.names)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    for batch in batches:
+        columns = [column.to_pylist() for column in batch.columns]
+        yield list(zip(*columns))
+
+
+def open_rows(path, sheet=None, chunk_size=CHUNK_SIZE):
+    # (başlıklar, satır parçaları üreteci) döner; satırlar başlık sırasında demetlerdir
+    fmt = file_format(path)
+    if fmt == 'xlsx':
+        chunks = _xlsx_chunks(path, sheet, chunk_size)
+    elif fmt == 'csv':
+        chunks = _csv_chunks(path, chunk_size)
+    else:
+        chunks = _arrow_chunks(path, fmt, chunk_size)
+    headers = next(chunks)
+    return headers, chunks
+
+
+class CourseReader:
+    # Ders satırlarını tür dönüşümüyle okur.
+    # iter_students(): öğrenci numarasına göre sıralı dosyada (kayıt sistemi çıktıları)
+    # her öğrencinin satırları ardışıktır ve akış halinde verilir; bellekte her an yalnızca
+    # bir öğrencinin dersleri bulunur. Sırasız dosyada daha önce verilmiş bir öğrenci
+    # yeniden görülürse yalnızca bu geç satırlar biriktirilir ve sonda o öğrenci için
+    # ikinci bir grup olarak verilir; çağıran grupları öğrenci numarasıyla birleştirir.
+
+    def __init__(self, path, sheet=None, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.headers, self._chunks = open_rows(path, sheet, chunk_size)
+        self.system = detect_system_info(self.headers)
+        if self.system['grade_system'] is None:
+            raise ValueError("Ders sayfasında not kolonu bulunamadı!")
+
+        grade_system = self.system['grade_system']
+        converters = {
+            'student_id': clean_text,
+            'semester': _semester_value,
+            'course_code': clean_text,
+            'course_name': clean_text,
+            'credits': to_number,
+            'ects': to_number,
+            'grade': clean_text if grade_system == 'letter' else to_number
+        }
+        fields = dict(COURSE_COLUMNS)
+        fields.update({h: 'grade' for h, s in GRADE_COLUMNS.items() if s == grade_system})
+        self.fields = [
+            (index, fields[header], converters[fields[header]])
+            for index, header in enumerate(self.headers) if header in fields
+        ]
+
+    def iter_chunks(self):
+        fields = self.fields
+        for chunk in self._chunks:
+            yield [
+                {field: convert(row[index] if index < len(row) else None)
+                 for index, field, convert in fields}
+                for row in chunk
+            ]
+
+    def iter_rows(self):
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def iter_students(self):
+        # (öğrenci no, ders satırları) çiftleri; öğrenci no kolonu yoksa tek öğrenci ('')
+        current_id = None
+        current_rows = []
+        done = set()
+        late_rows = {}
+        for row in self.iter_rows():
+            student_id = row.pop('student_id', '')
+            if student_id != current_id:
+                if current_rows:
+                    yield current_id, current_rows
+                    done.add(current_id)
+                current_id = student_id
+                current_rows = []
+            if student_id in done:
+                late_rows.setdefault(student_id, []).append(row)
+            else:
+                current_rows.append(row)
+        if current_rows:
+            yield current_id, current_rows
+        yield from late_rows.items()
+
+
+def iter_students(path, sheet=None, chunk_size=CHUNK_SIZE):
+    # Öğrenci bilgisi satırlarını add_student_info anahtarlarıyla verir
+    headers, chunks = open_rows(path, sheet, chunk_size)
+    fields = [(index, STUDENT_COLUMNS[h]) for index, h in enumerate(headers)
+              if h in STUDENT_COLUMNS]
+    for chunk in chunks:
+        for row in chunk:
+            info = {key: '' for key in STUDENT_COLUMNS.values()}
+            info.update({key: clean_text(row[index] if index < len(row) else None)
+                         for index, key in fields})
+            yield info
+
+
+def has_sheet(path, sheet):
+    return file_format(path) == 'xlsx' and sheet in _xlsx_sheet_names(path)
+
+
+def has_student_sheet(path):
+    return has_sheet(path, STUDENT_SHEET)
+
+
+def column_array(values):
+    # Kolon değerlerinden numpy dizisi: tamamen tam sayı/sayı ise sayısal dtype
+    # (pandas.read_excel ile aynı), aksi halde nesne dizisi
+    import numpy as np
+
+    types = {type(v) for v in values}
+    if types and types <= {int}:
+        return np.array(values, dtype=np.int64)
+    if types and types <= {int, float, type(None)} and types != {type(None)}:
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def read_table(path, sheet=None, chunk_size=CHUNK_SIZE, progress=None):
+    # Arayüz tablosu için: (başlıklar, kolon dizileri); hücreler ham değerleriyle
+    headers, chunks = open_rows(path, sheet, chunk_size)
+    width = len(headers)
+    columns = [[] for _ in range(width)]
+    rows_read = 0
+    for chunk in chunks:
+        for row in chunk:
+            for index in range(width):
+                columns[index].append(row[index] if index < len(row) else None)
+        rows_read += len(chunk)
+        if progress:
+            progress('rows', rows_read, 0)
+    return headers, [column_array(values) for values in columns]
@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# TranscriptGenerator aşamaları için süre (span) ve sayaç kayıtları.
+# Varsayılan kaydedici NullRecorder'dır: span() paylaşılan boş bir bağlam döner,
+# count() hiçbir şey yapmaz; böylece kapalıyken maliyet yok denecek kadar azdır.
+# Kayıtlar takılabilir bir hedefe (sink) gider: bellek, JSON satırları, Prometheus metni.
+
+_NULL_SPAN = nullcontext()
+
+
+class NullRecorder:
+    enabled = False
+
+    def span(self, name, **attrs):
+        return _NULL_SPAN
+
+    def count(self, name, value=1, **labels):
+        pass
+
+    def close(self):
+        pass
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'attrs', 'start')
+
+    def __init__(self, recorder, name, attrs):
+        self.recorder = recorder
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.recorder.sink.record_span(self.name, seconds, self.attrs)
+        return False
+
+
+class Recorder:
+    enabled = True
+
+    def __init__(self, sink):
+        self.sink = sink
+
+    def span(self, name, **attrs):
+        return _Span(self, name, attrs)
+
+    def count(self, name, value=1, **labels):
+        self.sink.record_count(name, value, labels)
+
+    def replay(self, events):
+        # Başka bir süreçte MemorySink ile toplanmış kayıtları bu hedefe aktarır
+        for kind, name, value, attrs in events:
+            if kind == 'span':
+                self.sink.record_span(name, value, attrs)
+            else:
+                self.sink.record_count(name, value, attrs)
+
+    def close(self):
+        self.sink.close()
+
+
+class MemorySink:
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def record_span(self, name, seconds, attrs):
+        with self._lock:
+            self.events.append(('span', name, seconds, attrs))
+
+    def record_count(self, name, value, labels):
+        with self._lock:
+            self.events.append(('count', name, value, labels))
+
+    def spans(self, name=None):
+        return [e for e in self.events if e[0] == 'span' and (name is None or e[1] == name)]
+
+    def counters(self):
+        totals = {}
+        for kind, name, value, _ in self.events:
+            if kind == 'count':
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def summary(self):
+        # Aşama adı -> adet, toplam, p50, p99 (saniye)
+        durations = {}
+        for kind, name, seconds, _ in self.events:
+            if kind == 'span':
+                durations.setdefault(name, []).append(seconds)
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            result[name] = {
+                'count': len(values),
+                'total': sum(values),
+                'p50': values[(len(values) - 1) // 2],
+                'p99': values[min(len(values) - 1, int(len(values) * 0.99))]
+            }
+        return result
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    # Her kayıt bir JSON satırı olarak eklenir
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+
+    def record_span(self, name, seconds, attrs):
+        self._write({'type': 'span', 'name': name, 'seconds': seconds, 'time': time.time(),
+                     **attrs})
+
+    def record_count(self, name, value, labels):
+        self._write({'type': 'count', 'name': name, 'value': value, 'time': time.time(),
+                     **labels})
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class PrometheusTextSink:
+    # node_exporter textfile biçimi; aşamalar yalnızca ada göre toplanır
+    # (yarıyıl, öğrenci gibi öznitelikler etiket sayısını patlatmasın diye atılır)
+    def __init__(self, path, prefix='transcript'):
+        self.path = path
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._span_sum = {}
+        self._span_count = {}
+        self._counters = {}
+
+    def record_span(self, name, seconds, attrs):
+        with self._lock:
+            self._span_sum[name] = self._span_sum.get(name, 0.0) + seconds
+            self._span_count[name] = self._span_count.get(name, 0) + 1
+
+    def record_count(self, name, value, labels):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def render(self):
+        lines = [f"# TYPE {self.prefix}_stage_seconds summary"]
+        for name in sorted(self._span_sum):
+            lines.append(f'{self.prefix}_stage_seconds_sum{{stage="{name}"}} '
+                         f'{self._span_sum[name]:.9f}')
+            lines.append(f'{self.prefix}_stage_seconds_count{{stage="{name}"}} '
+                         f'{self._span_count[name]}')
+        for name in sorted(self._counters):
+            lines.append(f"# TYPE {self.prefix}_{name}_total counter")
+            lines.append(f"{self.prefix}_{name}_total {self._counters[name]}")
+        return '\n'.join(lines) + '\n'
+
+    def close(self):
+        # Okuyucu yarım dosya görmesin diye geçici dosya + os.replace
+        with self._lock:
+            text = self.render()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, self.path)
+
+
+class MultiSink:
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def record_span(self, name, seconds, attrs):
+        for sink in self.sinks:
+            sink.record_span(name, seconds, attrs)
+
+    def record_count(self, name, value, labels):
+        for sink in self.sinks:
+            sink.record_count(name, value, labels)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+NULL_RECORDER = NullRecorder()
+_default_recorder = NULL_RECORDER
+
+
+def get_recorder():
+    return _default_recorder
+
+
+def set_recorder(recorder):
+    # Süreç geneli varsayılan; None verilirse kayıt kapatılır
+    global _default_recorder
+    _default_recorder = recorder or NULL_RECORDER
@@ -0,0 +1,222 @@
+import functools
+
+import resource_cache
+
+# Çizimden önce transkript yerleşimini hesaplar: metin genişlikleri font/punto başına
+# önbelleğe alınmış glif genişlik tablolarıyla ölçülür, uzun ders adları sarılır ya da
+# kısaltılır, satır yükseklikleri ve sayfa sonları belirlenir.
+# Sonuç (TranscriptLayout) render_into tarafından aynen çizilir;
+# TranscriptGenerator.page_count() ise çizim yapmadan sayfa sayısını verir (toplu iş planlaması).
+
+PT_PER_MM = 72 / 25.4
+PAGE_WIDTH = 210.0
+PAGE_HEIGHT = 297.0
+MARGIN = 10.0
+# fpdf hücre iç boşluğu (c_margin): metin her iki yanda bu kadar içeriden başlar
+CELL_MARGIN = 1.0
+BODY_BOTTOM = PAGE_HEIGHT - MARGIN
+
+SEMESTER_HEADER_HEIGHT = 6
+TABLE_HEADER_HEIGHT = 4
+ROW_HEIGHT = 5
+# Sarılan ders adında ek satırların aralığı
+LINE_HEIGHT = 3.5
+SEMESTER_GAP = 1
+MAX_NAME_LINES = 2
+
+GPA_GAP = 5
+GPA_HEIGHT = 6
+DEAN_Y = 279
+# Devam sayfalarının başındaki öğrenci/sayfa satırı
+CONTINUATION_HEIGHT = 8
+
+COURSE_FONT_SIZE = 7
+ELLIPSIS = '…'
+
+_char_widths = {}
+
+
+class _WidthTable(dict):
+    # Karakter -> mm genişlik; ilk sorulduğunda fontun glif genişliğinden hesaplanır
+    def __init__(self, font, size):
+        super().__init__()
+        self.cw = font.cw
+        self.default = font.cw.default_factory() if font.cw.default_factory else 0
+        self.scale = size / 1000 / PT_PER_MM
+
+    def __missing__(self, char):
+        # Paylaşılan defaultdict'e yazmamak için get ile okunur
+        width = self.cw.get(ord(char), self.default) * self.scale
+        self[char] = width
+        return width
+
+
+def char_widths(style, size):
+    # Font/punto başına tek tablo
+    table = _char_widths.get((style, size))
+    if table is None:
+        table = _char_widths.setdefault(
+            (style, size), _WidthTable(resource_cache.get_font(style), size))
+    return table
+
+
+@functools.lru_cache(maxsize=65536)
+def text_width(text, style='', size=COURSE_FONT_SIZE):
+    # Aynı ders adları binlerce öğrencide tekrar eder; sonuç da önbelleğe alınır
+    widths = char_widths(style, size)
+    return sum(widths[char] for char in text)
+
+
+def truncate(text, width, style='', size=COURSE_FONT_SIZE):
+    if text_width(text, style, size) <= width:
+        return text
+    widths = char_widths(style, size)
+    limit = width - widths[ELLIPSIS]
+    used = 0.0
+    for i, char in enumerate(text):
+        used += widths[char]
+        if used > limit:
+            return text[:i].rstrip() + ELLIPSIS
+    return text
+
+
+def wrap(text, width, style='', size=COURSE_FONT_SIZE, max_lines=MAX_NAME_LINES):
+    # Kelime sınırlarından sarar; sığmayan son satır üç nokta ile kısaltılır
+    if text_width(text, style, size) <= width:
+        return [text]
+    lines = []
+    current = ''
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if not current or text_width(candidate, style, size) <= width:
+            current = candidate
+        else:
+            lines.append(current)
+            current = word
+    lines.append(current)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines - 1] + [' '.join(lines[max_lines - 1:])]
+    return [truncate(line, width, style, size) for line in lines]
+
+
+class ColumnWidths:
+    def __init__(self, use_course_code, page_width=PAGE_WIDTH - 2 * MARGIN):
+        self.column = page_width / 2
+        if use_course_code:
+            self.code = self.column * 0.2
+            self.name = self.column * 0.6
+        else:
+            self.code = 0
+            self.name = self.column * 0.8
+        self.grade = self.column * 0.2
+
+
+class CourseCell:
+    __slots__ = ('code', 'name_lines', 'grade')
+
+    def __init__(self, code, name_lines, grade):
+        self.code = code
+        self.name_lines = name_lines
+        self.grade = grade
+
+
+class Row:
+    __slots__ = ('left', 'right', 'height')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        lines = max(len(cell.name_lines) for cell in (left, right) if cell is not None)
+        self.height = ROW_HEIGHT + (lines - 1) * LINE_HEIGHT
+
+
+class TranscriptLayout:
+    # pages: her sayfa için (tür, y, veri) listesi. Türler:
+    # 'continuation' (devam sayfası başlığı), 'semester' (veri: (yarıyıl, devam mı)),
+    # 'table_header', 'row' (veri: Row), 'semester_end' (veri: yarıyıl; çizilmez),
+    # 'gpa', 'dean'
+    def __init__(self, widths):
+        self.widths = widths
+        self.pages = [[]]
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+
+def course_cell(course, widths, use_course_code, grade=None):
+    # grade: gösterilecek not metni (ör. dönüşümlü "85 (BA)"); verilmezse dersin notu
+    text_space = 2 * CELL_MARGIN
+    code = ''
+    if use_course_code:
+        code = truncate(course.course_code or '', widths.code - text_space, 'B')
+    name_lines = wrap(course.course_name or '', widths.name - text_space)
+    if grade is None:
+        grade = str(course.get('grade', ''))
+    grade = truncate(grade, widths.grade - text_space, 'B')
+    return CourseCell(code, name_lines, grade)
+
+
+def semester_rows(courses, widths, use_course_code, grades=None):
+    # İki kolon: ilk yarı solda, kalan sağda (mevcut düzenle aynı sıra)
+    grades = grades or [None] * len(courses)
+    cells = [course_cell(course, widths, use_course_code, grade)
+             for course, grade in zip(courses, grades)]
+    per_column = (len(cells) + 1) // 2
+    return [
+        Row(cells[i], cells[i + per_column] if i + per_column < len(cells) else None)
+        for i in range(per_column)
+    ]
+
+
+def layout_transcript(transcript, first_top, show_gpa):
+    # first_top: ilk sayfada öğrenci bilgilerinden sonra derslerin başladığı y (mm)
+    widths = ColumnWidths(transcript.use_course_code)
+    result = TranscriptLayout(widths)
+    page = result.pages[0]
+    y = first_top
+    body_start = first_top
+
+    def new_page():
+        page = [('continuation', MARGIN, None)]
+        result.pages.append(page)
+        return page, MARGIN + CONTINUATION_HEIGHT
+
+    semesters = sorted(transcript.semester_courses)
+    grade_labels = transcript.grade_labels() or {}
+    for index, semester in enumerate(semesters):
+        rows = semester_rows(transcript.semester_courses[semester], widths,
+                             transcript.use_course_code, grade_labels.get(semester))
+        # Yarıyıl başlığı en az ilk satırıyla aynı sayfada kalır
+        head_height = SEMESTER_HEADER_HEIGHT + TABLE_HEADER_HEIGHT
+        first_height = rows[0].height if rows else 0
+        if y + head_height + first_height > BODY_BOTTOM and y > body_start:
+            page, y = new_page()
+            body_start = y
+        page.append(('semester', y, (semester, False)))
+        y += SEMESTER_HEADER_HEIGHT
+        page.append(('table_header', y, None))
+        y += TABLE_HEADER_HEIGHT
+        for row in rows:
+            if y + row.height > BODY_BOTTOM:
+                page, y = new_page()
+                body_start = y
+                page.append(('semester', y, (semester, True)))
+                y += SEMESTER_HEADER_HEIGHT
+                page.append(('table_header', y, None))
+                y += TABLE_HEADER_HEIGHT
+            page.append(('row', y, row))
+            y += row.height
+        page.append(('semester_end', y, semester))
+        if index < len(semesters) - 1:
+            y += SEMESTER_GAP
+
+    # Ortalama ve dekan bilgisi son sayfada; sığmazsa yeni sayfaya geçilir
+    footer_height = GPA_GAP + GPA_HEIGHT if show_gpa else 0
+    if y + footer_height > DEAN_Y:
+        page, y = new_page()
+    if show_gpa:
+        page.append(('gpa', y + GPA_GAP, None))
+    page.append(('dean', DEAN_Y, None))
+    return result
+
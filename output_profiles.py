@@ -0,0 +1,96 @@
+import threading
+from contextlib import contextmanager
+
+from fpdf.syntax import PDFContentStream
+
+import resource_cache
+
+# Çıktı profilleri: arşivlenen her transkriptin boyutunu belirleyen ayarlar.
+#   compression_level: içerik ve font akışlarının zlib düzeyi (-1: zlib varsayılanı, 0-9)
+#   font_hinting: False ise gömülü font alt kümesi ipuçsuz (hinting) font verisinden
+#                 üretilir; ekranda/baskıda görünüm değişmez, font akışı küçülür
+#   logo_dpi: logo basıldığı genişlikte (resource_cache.LOGO_WIDTH) bu çözünürlüğe
+#             küçültülür; None: özgün görüntü
+#   logo_format: 'png' (kayıpsız) ya da 'jpeg' (logo_quality ile); None: özgün biçim
+# fpdf2 fontları her zaman alt kümeleyerek gömer; font ve logo her belgede tek kopya
+# yazılır ve birleşik çıktıda (cohort_writer) tüm öğrenciler arasında paylaşılır.
+# 'standard' profil önceki çıktıyla bayt bayt aynıdır.
+
+
+class OutputProfile:
+    def __init__(self, name, compression_level=-1, font_hinting=True, logo_dpi=None,
+                 logo_format=None, logo_quality=85):
+        if not -1 <= compression_level <= 9:
+            raise ValueError(f"{name}: sıkıştırma düzeyi -1 ile 9 arasında olmalı")
+        if logo_format not in (None, 'png', 'jpeg'):
+            raise ValueError(f"{name}: bilinmeyen logo biçimi: {logo_format}")
+        self.name = name
+        self.compression_level = compression_level
+        self.font_hinting = font_hinting
+        self.logo_dpi = logo_dpi
+        self.logo_format = logo_format
+        self.logo_quality = logo_quality
+
+    def logo_variant(self):
+        # resource_cache.get_logo anahtarı; özgün logo için None
+        if self.logo_dpi is None and self.logo_format is None:
+            return None
+        return (self.logo_dpi, self.logo_format or 'png', self.logo_quality,
+                self.compression_level)
+
+    def to_dict(self):
+        return {'name': self.name, 'compression_level': self.compression_level,
+                'font_hinting': self.font_hinting, 'logo_dpi': self.logo_dpi,
+                'logo_format': self.logo_format, 'logo_quality': self.logo_quality}
+
+
+PROFILES = {}
+DEFAULT_PROFILE = 'standard'
+
+# fpdf'in sıkıştırma düzeyi sınıf düzeyinde; çıktı süresince ayarlanıp geri alınır
+_output_lock = threading.Lock()
+
+
+def register_profile(profile):
+    PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name=None):
+    # Ad ya da doğrudan profil nesnesi kabul edilir
+    if isinstance(name, OutputProfile):
+        return name
+    profile = PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        raise ValueError(f"Bilinmeyen çıktı profili: {name}")
+    return profile
+
+
+def profile_names():
+    return list(PROFILES)
+
+
+@contextmanager
+def applied(profile, pdf):
+    # pdf.output() çağrısını sarar: sıkıştırma düzeyi ve ipuçsuz font verisi
+    profile = get_profile(profile)
+    if not profile.font_hinting:
+        resource_cache.strip_hinting(pdf)
+    # Düzey sınıf özniteliğidir: varsayılan (-1) profil de kilidi alıp düzeyi açıkça
+    # kurar, yoksa eşzamanlı başka bir profilin düzeyiyle yazılabilir
+    with _output_lock:
+        previous = PDFContentStream._COMPRESSION_LEVEL
+        PDFContentStream._COMPRESSION_LEVEL = profile.compression_level
+        try:
+            yield
+        finally:
+            PDFContentStream._COMPRESSION_LEVEL = previous
+
+
+register_profile(OutputProfile('standard'))
+# Uzun süreli arşiv: kayıpsız, en yüksek sıkıştırma, baskı kalitesinde logo
+register_profile(OutputProfile('archive', compression_level=9, font_hinting=False,
+                               logo_dpi=200, logo_format='png'))
+# En küçük dosya: ekran kalitesinde JPEG logo
+register_profile(OutputProfile('compact', compression_level=9, font_hinting=False,
+                               logo_dpi=120, logo_format='jpeg', logo_quality=75))
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import resource_cache
+from transcript_generator import TEMPLATE_VERSION
+
+# İçerik adresli transkript önbelleği.
+# Anahtar, generate_pdf çıktısını belirleyen her şeyin (öğrenci bilgileri, dersler,
+# sistem ayarları, şablon/font sürümü ve belgede basılan tarih) SHA-256 özetidir.
+# Girdileri değişmeyen öğrenciler için kayıtlı PDF baytları aynen döndürülür.
+# Dosyalar diskte <dizin>/<ilk iki karakter>/<anahtar>.pdf olarak tutulur;
+# boyut sınırı aşılınca en uzun süredir kullanılmayanlar silinir. Boyut ve kullanım
+# sırası bellekteki bir dizinde (LRU) tutulur; silme sınırın altına, LOW_WATER
+# oranına kadar iner ki her yazımda yeniden silme (ve dizin taraması) gerekmesin.
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Silme, toplam boyut max_bytes * LOW_WATER altına inene kadar sürer
+LOW_WATER = 0.9
+# Diğer süreçlerin yazdıklarını/sildiklerini görmek için bu kadar yazımda bir dizin
+# yeniden taranır (sıra dosyaların mtime'ından kurulur)
+RESCAN_EVERY = 100
+
+_open_caches = {}
+_open_lock = threading.Lock()
+
+
+def cache_key(transcript):
+    payload = {
+        'template': TEMPLATE_VERSION,
+        'assets': resource_cache.assets_digest(),
+        'date': transcript.document_date(),
+        'output_profile': transcript.output_profile.to_dict(),
+        'system': [transcript.grade_system, transcript.use_credits,
+                   transcript.use_course_code, transcript.use_ects],
+        'scales': transcript.scale_definitions(),
+        'student_info': transcript.student_info,
+        'courses': [course.to_dict() for course in transcript.courses],
+        'semesters': [
+            [semester, [course.to_dict() for course in courses]]
+            for semester, courses in sorted(transcript.semester_courses.items(),
+                                            key=lambda item: str(item[0]))
+        ],
+        'gpa_summary': transcript.gpa_summary
+    }
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'),
+                      default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def open_cache(directory, max_bytes=DEFAULT_MAX_BYTES):
+    # Süreç başına dizin başına tek nesne (toplu işte havuz işçileri bunu paylaşır)
+    directory = os.path.abspath(directory)
+    with _open_lock:
+        cache = _open_caches.get((directory, max_bytes))
+        if cache is None:
+            cache = RenderCache(directory, max_bytes)
+            _open_caches[(directory, max_bytes)] = cache
+    return cache
+
+
+class RenderCache:
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # yol -> boyut; en eski kullanılan başta
+        self._index = None
+        self._size = 0
+        self._writes = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __reduce__(self):
+        # Süreçler arası aktarımda alıcı sürecin ortak nesnesi kullanılır
+        return open_cache, (self.directory, self.max_bytes)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def _entries(self):
+        entries = []
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith('.pdf'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _rescan(self):
+        self._index = OrderedDict((path, size) for _, size, path in sorted(self._entries()))
+        self._size = sum(self._index.values())
+
+    def _touch(self, path, size):
+        if self._index is None:
+            self._rescan()
+        previous = self._index.pop(path, None)
+        if previous is not None:
+            self._size -= previous
+        self._index[path] = size
+        self._size += size
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Son kullanım zamanı: LRU silme sırası mtime'a göre
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._touch(path, len(data))
+        return data
+
+    def put(self, key, data):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Yarım yazılmış dosya okunmasın diye geçici dosya + os.replace
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            if self._writes % RESCAN_EVERY == 0:
+                self._index = None
+            self._touch(path, len(data))
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Dizin taraması yok: bellekteki LRU sırasıyla alt sınıra kadar silinir
+        low_water = self.max_bytes * LOW_WATER
+        while self._index and self._size > low_water:
+            path, size = self._index.popitem(last=False)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._index = OrderedDict()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'bytes': self._size if self._index is not None else
+                sum(size for _, size, _ in self._entries())
+            }
+
+
+def cached_bytes(transcript, cache, progress=None):
+    # (PDF baytları, önbellekten mi) döner; yoksa üretilip önbelleğe eklenir
+    key = cache_key(transcript)
+    data = cache.get(key)
+    if data is not None:
+        return data, True
+    data = transcript.render_bytes(progress)
+    cache.put(key, data)
+    return data, False
+
+
+def render_cached(transcript, filename, cache, progress=None):
+    # Önbellekte varsa kayıtlı baytları yazar, yoksa üretip önbelleğe ekler.
+    # Önbellekten gelindiyse True döner.
+    data, hit = cached_bytes(transcript, cache, progress)
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return hit
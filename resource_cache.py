@@ -0,0 +1,219 @@
+import copy
+import hashlib
+import io
+import os
+import threading
+
+from fontTools import ttLib
+from fpdf import FPDF, image_parsing
+from fpdf.fonts import SubsetMap, TTFFont
+from fpdf.image_parsing import preload_image
+from PIL import Image
+
+# Süreç genelinde paylaşılan font ve logo önbelleği.
+# TTF dosyaları ve logo bir kez çözümlenir; her yeni FPDF belgesine
+# yalnızca belgeye özgü durum (alt küme haritası, kullanım sayaçları) kopyalanır.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_FAMILY = 'Roboto'
+FONT_FILES = {
+    '': 'Roboto-Regular.ttf',
+    'B': 'Roboto-Bold.ttf'
+}
+LOGO_PATH = os.path.join(BASE_DIR, 'logo.png')
+# Logonun sayfada basıldığı genişlik (mm)
+LOGO_WIDTH = 40
+# İpuçsuz (hinting) font verisinde atılan tablolar
+HINTING_TABLES = ('fpgm', 'prep', 'cvt ', 'hdmx', 'VDMX', 'LTSH')
+
+_lock = threading.Lock()
+_fonts = {}
+_font_data = {}
+_unhinted_data = {}
+_logos = {}
+_assets_digest = None
+
+
+def get_font(style=''):
+    font = _fonts.get(style)
+    if font is None:
+        with _lock:
+            font = _fonts.get(style)
+            if font is None:
+                font_path = os.path.join(BASE_DIR, FONT_FILES[style])
+                fontkey = f"{FONT_FAMILY.lower()}{style}"
+                # TTFFont yapıcısı yalnızca fonts ve render_color_fonts alanlarına bakar
+                font = TTFFont(FPDF(), font_path, fontkey, style)
+                with open(font_path, 'rb') as f:
+                    _font_data[fontkey] = f.read()
+                _fonts[style] = font
+    return font
+
+
+def clone_font(template, index):
+    # Glif genişlikleri, cmap ve tanımlayıcı paylaşılır. pdf.output() fontu
+    # yerinde alt kümelediği için her belge kendi (tembel) TTFont nesnesini alır;
+    # bellekteki dosya verisinden açmak yalnızca tablo dizinini okur.
+    font = copy.copy(template)
+    font.i = index
+    font.ttfont = ttLib.TTFont(io.BytesIO(_font_data[template.fontkey]),
+                               recalcTimestamp=False, lazy=True)
+    font.biggest_size_pt = 0
+    font.missing_glyphs = []
+    font.subset = SubsetMap(font)
+    return font
+
+
+def install_fonts(pdf):
+    # add_font yerine: çözümlenmiş glif/metrik tabloları paylaşılır
+    for style in FONT_FILES:
+        template = get_font(style)
+        if template.fontkey in pdf.fonts:
+            continue
+        font = clone_font(template, len(pdf.fonts) + 1)
+        pdf.fonts[font.fontkey] = font
+        if font.is_cff and font.is_cid_keyed:
+            pdf._set_min_pdf_version("1.6")
+
+
+def unhinted_font_data(fontkey):
+    # Glif sırası ve kimlikleri korunur; yalnızca TrueType ipucu programları atılır
+    data = _unhinted_data.get(fontkey)
+    if data is None:
+        with _lock:
+            data = _unhinted_data.get(fontkey)
+            if data is None:
+                font = ttLib.TTFont(io.BytesIO(_font_data[fontkey]), recalcTimestamp=False)
+                for tag in HINTING_TABLES:
+                    if tag in font:
+                        del font[tag]
+                if 'glyf' in font:
+                    glyf = font['glyf']
+                    for name in font.getGlyphOrder():
+                        glyf[name].removeHinting()
+                    maxp = font['maxp']
+                    for field in ('maxTwilightPoints', 'maxStorage', 'maxFunctionDefs',
+                                  'maxInstructionDefs', 'maxStackElements',
+                                  'maxSizeOfInstructions'):
+                        setattr(maxp, field, 0)
+                output = io.BytesIO()
+                font.save(output)
+                data = output.getvalue()
+                _unhinted_data[fontkey] = data
+    return data
+
+
+def strip_hinting(pdf):
+    # pdf.output() öncesi: alt küme ipuçsuz font verisinden çıkarılır. Glif kimlikleri
+    # değişmediği için belgenin alt küme haritası aynen geçerlidir.
+    for font in pdf.fonts.values():
+        if font.fontkey in _font_data:
+            font.ttfont = ttLib.TTFont(io.BytesIO(unhinted_font_data(font.fontkey)),
+                                       recalcTimestamp=False, lazy=True)
+
+
+def logo_name(variant=None):
+    # Belgenin görsel önbelleğindeki ad; pdf.image() bu adla önbellekten okur
+    if variant is None:
+        return LOGO_PATH
+    dpi, image_format, quality, level = variant
+    return f"{LOGO_PATH}#{dpi or 'orig'}dpi-{image_format}{quality}-z{level}"
+
+
+def encode_logo(variant):
+    # Logo basıldığı genişlikte dpi çözünürlüğe küçültülüp yeniden kodlanır
+    dpi, image_format, quality, _ = variant
+    with Image.open(LOGO_PATH) as image:
+        image.load()
+    if dpi:
+        width = round(LOGO_WIDTH / 25.4 * dpi)
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+    output = io.BytesIO()
+    if image_format == 'jpeg':
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        image.convert('RGB').save(output, 'JPEG', quality=quality, optimize=True)
+    else:
+        image.save(output, 'PNG', optimize=True)
+    output.seek(0)
+    return output
+
+
+def get_logo(variant=None):
+    # variant: output_profiles.OutputProfile.logo_variant(); None özgün logo
+    if variant in _logos:
+        return _logos[variant]
+    with _lock:
+        if variant not in _logos:
+            logo = None
+            if os.path.exists(LOGO_PATH):
+                scratch = FPDF()
+                if variant is None:
+                    _, _, info = preload_image(scratch.image_cache, LOGO_PATH)
+                else:
+                    # Kayıpsız biçimlerin zlib düzeyi görüntü eklenirken uygulanır
+                    previous = image_parsing.SETTINGS.compression_level
+                    image_parsing.SETTINGS.compression_level = variant[3]
+                    try:
+                        _, _, info = preload_image(scratch.image_cache, encode_logo(variant))
+                    finally:
+                        image_parsing.SETTINGS.compression_level = previous
+                logo = (info, dict(scratch.image_cache.icc_profiles))
+            _logos[variant] = logo
+    return _logos[variant]
+
+
+def install_logo(pdf, variant=None):
+    # Çözülmüş logo bilgisini belgenin görsel önbelleğine yerleştirir.
+    # Logo yoksa None döner; varsa pdf.image() ile kullanılacak adı döner.
+    logo = get_logo(variant)
+    if logo is None:
+        return None
+    info, icc_profiles = logo
+    name = logo_name(variant)
+    images = pdf.image_cache.images
+    if name not in images:
+        entry = copy.copy(info)
+        entry['i'] = len(images) + 1
+        entry['usages'] = 0
+        for profile, index in icc_profiles.items():
+            pdf.image_cache.icc_profiles.setdefault(profile, index)
+        images[name] = entry
+    return name
+
+
+def assets_digest():
+    # Font ve logo dosyalarının özeti: dosyalar değişince render_cache anahtarı da değişir
+    global _assets_digest
+    if _assets_digest is None:
+        digest = hashlib.sha256()
+        paths = [os.path.join(BASE_DIR, FONT_FILES[style]) for style in sorted(FONT_FILES)]
+        for path in paths + [LOGO_PATH]:
+            digest.update(os.path.basename(path).encode('utf-8'))
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        _assets_digest = digest.hexdigest()
+    return _assets_digest
+
+
+def warm_up():
+    # Havuz işçilerinin başlangıcında çağrılır (ProcessPoolExecutor initializer)
+    for style in FONT_FILES:
+        get_font(style)
+    get_logo()
+
+
+def clear():
+    global _assets_digest
+    with _lock:
+        _fonts.clear()
+        _font_data.clear()
+        _unhinted_data.clear()
+        _logos.clear()
+        _assets_digest = None
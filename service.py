@@ -0,0 +1,361 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import grade_scales
+import resource_cache
+from validation import validate_students
+
+# Yerel transkript servisi (yalnızca standart kütüphane: asyncio + elle HTTP/1.1).
+#   POST /transcripts  {"system": {...}, "student": {...}, "courses": [...]} -> application/pdf
+#   GET  /health       -> durum ve kuyruk derinliği
+#   GET  /metrics      -> kuyruk derinliği, sayaçlar, p50/p99 gecikmeler (JSON)
+# Çizim sınırlı bir süreç havuzunda yapılır. Havuzdaki ve sırada bekleyen istek sayısı
+# workers + queue_size'a ulaşınca yeni istekler 429 ile geri çevrilir.
+# Kullanım: python service.py --port 8080 -j 4 --queue-size 16
+
+MAX_BODY = 5 * 1024 * 1024
+STREAM_CHUNK = 64 * 1024
+LATENCY_WINDOW = 1000
+SYSTEM_FLAGS = ('use_credits', 'use_course_code', 'use_ects')
+
+REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    429: 'Too Many Requests',
+    500: 'Internal Server Error'
+}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message, details=None):
+        super().__init__(message)
+        self.status = status
+        self.details = details or []
+
+
+def _request_scales(system, server_scales, errors):
+    # system.scales: isteğe özgü ölçek tanımları. Havuz işçileri istekler arasında
+    # paylaşıldığından mevcut bir ölçeğin adı yeniden tanımlanamaz.
+    definitions = system.get('scales', [])
+    if not isinstance(definitions, list):
+        errors.append("system.scales: liste olmalı")
+        return {}
+    taken = set(grade_scales.scale_names()) | {d['name'] for d in server_scales}
+    scales = {}
+    for index, definition in enumerate(definitions):
+        try:
+            scale = grade_scales.scale_from_dict(definition)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            errors.append(f"system.scales[{index}]: ölçek tanımı okunamadı ({e})")
+            continue
+        if scale.name in taken or scale.name in scales:
+            errors.append(f"system.scales[{index}]: '{scale.name}' adlı ölçek zaten var")
+            continue
+        scales[scale.name] = scale
+    return scales
+
+
+def validate_request(data, server_scales=()):
+    # Yapı (JSON türleri) burada, ders içerikleri toplu iş ve arayüzle aynı kurallarla
+    # (validation.validate_students, grade_scales.get_scale) denetlenir.
+    # server_scales: servise --scales ile yüklenen ölçek tanımları.
+    # Hatalar toplanır ve tek seferde döner (400)
+    if not isinstance(data, dict):
+        raise RequestError(400, "İstek gövdesi bir JSON nesnesi olmalı")
+    errors = []
+    system = data.get('system')
+    student = data.get('student')
+    courses = data.get('courses')
+
+    if not isinstance(system, dict):
+        errors.append("system: nesne olmalı")
+        system = {}
+    for flag in SYSTEM_FLAGS:
+        if not isinstance(system.get(flag, False), bool):
+            errors.append(f"system.{flag}: true/false olmalı")
+    request_scales = _request_scales(system, server_scales, errors)
+    grade_system = system.get('grade_system')
+    scale = request_scales.get(grade_system) if isinstance(grade_system, str) else None
+    if scale is None:
+        try:
+            scale = grade_scales.get_scale(grade_system if isinstance(grade_system, str)
+                                           else None)
+        except ValueError:
+            errors.append(f"system.grade_system: {', '.join(grade_scales.scale_names())} "
+                          f"ya da system.scales içindeki bir ölçek olmalı")
+
+    if not isinstance(student, dict):
+        errors.append("student: nesne olmalı")
+        student = {}
+    elif not all(isinstance(v, (str, int, float)) for v in student.values()):
+        errors.append("student: alanlar metin ya da sayı olmalı")
+
+    if not isinstance(courses, list) or not courses:
+        errors.append("courses: boş olmayan bir liste olmalı")
+        courses = []
+    elif not all(isinstance(course, dict) for course in courses):
+        errors.append("courses: her ders bir nesne olmalı")
+        courses = []
+    if errors:
+        raise RequestError(400, "Geçersiz istek", errors)
+
+    flags = {flag: system.get(flag, False) for flag in SYSTEM_FLAGS}
+    student = {k: str(v) for k, v in student.items()}
+    # Ölçek nesnesi doğrudan verilir: isteğe özgü ölçek bu süreçte kaydedilmez
+    report = validate_students(dict(flags, grade_system=scale), [(student, courses)])
+    if not report.ok:
+        raise RequestError(400, "Geçersiz istek",
+                           [f"courses: {error}" for error in report.errors])
+    system = {'grade_system': grade_system, **flags}
+    definitions = list(server_scales) + [s.to_dict() for s in request_scales.values()]
+    if definitions:
+        # İşçide build_generator tarafından kaydedilir
+        system['scales'] = definitions
+    return system, student, courses
+
+
+def render_request(student, courses, system):
+    # Havuz işçisinde çalışır: (PDF baytları, çizim süresi)
+    # Üretici işçinin havuzundan alınır (generator_pool); istekler arasında yeniden kullanılır
+    from batch import build_generator
+    from generator_pool import get_pool
+
+    start = time.perf_counter()
+    with get_pool().generator() as transcript:
+        build_generator(student, courses, system, transcript=transcript)
+        data = transcript.render_bytes()
+    return data, time.perf_counter() - start
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class TranscriptService:
+    def __init__(self, workers=None, queue_size=16, scales=()):
+        self.workers = workers or os.cpu_count()
+        # --scales ile yüklenen ölçeklerin tanımları (her isteğin system.scales'ine eklenir)
+        self.scales = [scale.to_dict() for scale in scales]
+        self.queue_size = queue_size
+        self.capacity = self.workers + queue_size
+        self.executor = None
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.invalid = 0
+        self.started = time.time()
+        self.render_seconds = deque(maxlen=LATENCY_WINDOW)
+        self.latency_seconds = deque(maxlen=LATENCY_WINDOW)
+
+    def start(self):
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            initializer=resource_cache.warm_up)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    @property
+    def queue_depth(self):
+        # Havuzda çalışanlar dışında sırada bekleyen istekler
+        return max(0, self.pending - self.workers)
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'pending': self.pending,
+            'queue_depth': self.queue_depth,
+            'capacity': self.capacity,
+            'uptime_seconds': time.time() - self.started
+        }
+
+    def metrics(self):
+        def ms(value):
+            return None if value is None else value * 1000
+
+        return {
+            'queue_depth': self.queue_depth,
+            'pending': self.pending,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'invalid': self.invalid,
+            'render_ms': {'p50': ms(_percentile(self.render_seconds, 0.5)),
+                          'p99': ms(_percentile(self.render_seconds, 0.99))},
+            'latency_ms': {'p50': ms(_percentile(self.latency_seconds, 0.5)),
+                           'p99': ms(_percentile(self.latency_seconds, 0.99))}
+        }
+
+    async def render(self, body):
+        try:
+            data = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self.invalid += 1
+            raise RequestError(400, f"JSON çözümlenemedi: {e}")
+        try:
+            system, student, courses = validate_request(data, self.scales)
+        except RequestError:
+            self.invalid += 1
+            raise
+
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise RequestError(429, "Kuyruk dolu, daha sonra tekrar deneyin")
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            pdf_bytes, render_seconds = await loop.run_in_executor(
+                self.executor, render_request, student, courses, system)
+        except Exception as e:
+            self.failed += 1
+            raise RequestError(500, f"PDF oluşturulurken hata: {type(e).__name__}: {e}")
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        self.render_seconds.append(render_seconds)
+        self.latency_seconds.append(time.perf_counter() - start)
+        return pdf_bytes
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._dispatch(writer, method, path, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader, writer):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, target, _ = line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            await self._send_json(writer, 400, {'error': "Geçersiz istek satırı"}, False)
+            return None
+        headers = {}
+        while True:
+            header = await reader.readline()
+            if header in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = header.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            await self._send_json(writer, 400, {'error': "Geçersiz Content-Length"}, False)
+            return None
+        if length > MAX_BODY:
+            await self._send_json(writer, 413, {'error': "İstek gövdesi çok büyük"}, False)
+            return None
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target.split('?', 1)[0], headers, body
+
+    async def _dispatch(self, writer, method, path, body, keep_alive):
+        if path == '/health' and method == 'GET':
+            await self._send_json(writer, 200, self.health(), keep_alive)
+        elif path == '/metrics' and method == 'GET':
+            await self._send_json(writer, 200, self.metrics(), keep_alive)
+        elif path == '/transcripts':
+            if method != 'POST':
+                await self._send_json(writer, 405, {'error': "Yalnızca POST"}, keep_alive)
+                return
+            try:
+                pdf_bytes = await self.render(body)
+            except RequestError as e:
+                payload = {'error': str(e)}
+                if e.details:
+                    payload['details'] = e.details
+                extra = {'Retry-After': '1'} if e.status == 429 else None
+                await self._send_json(writer, e.status, payload, keep_alive, extra)
+                return
+            await self._send(writer, 200, 'application/pdf', pdf_bytes, keep_alive)
+        else:
+            await self._send_json(writer, 404, {'error': "Bulunamadı"}, keep_alive)
+
+    async def _send_json(self, writer, status, payload, keep_alive, extra_headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        await self._send(writer, status, 'application/json; charset=utf-8', body, keep_alive,
+                         extra_headers)
+
+    async def _send(self, writer, status, content_type, body, keep_alive, extra_headers=None):
+        headers = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        headers += [f"{name}: {value}" for name, value in (extra_headers or {}).items()]
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1'))
+        # Gövde parça parça yazılır; yavaş istemcide drain() ile geri basınç uygulanır
+        view = memoryview(body)
+        for offset in range(0, len(view), STREAM_CHUNK):
+            writer.write(view[offset:offset + STREAM_CHUNK])
+            await writer.drain()
+        await writer.drain()
+
+
+async def serve(host, port, workers, queue_size, scales=()):
+    service = TranscriptService(workers, queue_size, scales)
+    service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Transkript servisi http://{host}:{port} ({service.workers} işçi, "
+          f"kuyruk {queue_size})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel transkript oluşturma servisi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--queue-size', type=int, default=16,
+                        help="İşçiler doluyken bekletilecek en fazla istek (sonrası 429)")
+    parser.add_argument('--scales', metavar='JSON',
+                        help="Fakülteye özgü not ölçekleri (grade_scales.load_scales biçimi)")
+    args = parser.parse_args(argv)
+    scales = grade_scales.load_scales(args.scales) if args.scales else []
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size, scales))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
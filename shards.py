@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import time
+
+# Büyük kohortlar için parçalı ve kaldığı yerden devam edebilen toplu iş.
+# Öğrenciler öğrenci numarasının özetine göre sabit parçalara ayrılır; aynı girdiyle her
+# makinede aynı dağılım çıkar. Her parça tamamlanan öğrencileri ekleme kipinde bir
+# kontrol noktası dosyasına (JSON satırları) yazar; yeniden başlatılınca bu öğrenciler atlanır.
+# merge_checkpoints tüm parçaların kayıtlarını birleştirip her öğrencinin tam bir kez
+# üretildiğini doğrular.
+
+
+def shard_of(student_id, shard_count):
+    # hash() süreçten sürece değiştiği için sabit bir özet kullanılır
+    digest = hashlib.sha1(str(student_id).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def parse_shard(text):
+    # "2/8" -> (1, 8): kullanıcıya 1'den başlayan parça numarası gösterilir
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise ValueError(f"Parça '{text}' okunamadı (ör. 2/8)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Parça numarası 1 ile {count} arasında olmalı: {text}")
+    return index - 1, count
+
+
+def select_shard(students, index, count):
+    return [(info, courses) for info, courses in students
+            if shard_of(info['student_id'], count) == index]
+
+
+def checkpoint_path(output_dir, index, count):
+    return os.path.join(output_dir, f"checkpoint_{index + 1}of{count}.jsonl")
+
+
+class Checkpoint:
+    # Ekleme kipinde JSON satırları: {"student_id", "path", "shard", "seconds", "time"}
+    # Her satır yazıldıktan sonra flush edilir; süreç çökse de kayıtlı öğrenciler kaybolmaz.
+    def __init__(self, path, shard=None):
+        self.path = path
+        self.shard = shard
+        self.records = read_checkpoint(path) if os.path.exists(path) else []
+        self.done = {record['student_id']: record for record in self.records}
+        self._file = None
+
+    def is_done(self, student_id):
+        # Çıktısı silinmiş öğrenci yeniden üretilir
+        record = self.done.get(student_id)
+        return record is not None and (not record.get('path') or os.path.exists(record['path']))
+
+    def pending(self, students):
+        return [(info, courses) for info, courses in students
+                if not self.is_done(info['student_id'])]
+
+    def record(self, result):
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            truncate_partial_line(self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        record = {'student_id': result['student_id'], 'path': result.get('path'),
+                  'shard': self.shard, 'seconds': round(result.get('seconds', 0.0), 4),
+                  'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.records.append(record)
+        self.done[record['student_id']] = record
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def truncate_partial_line(path):
+    # Çökme anında yarım kalan son satır kesilir; yoksa sonraki kayıt onun devamına
+    # eklenir ve birleşen satır okunurken iki kayıt birden kaybolur
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            f.truncate(position)
+
+
+def read_checkpoint(path):
+    # Çökme anında yarım kalan son satır yok sayılır
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def merge_checkpoints(paths, student_ids):
+    # Tüm kontrol noktalarındaki kayıtlar beklenen öğrenci listesiyle karşılaştırılır
+    # Aynı dosyada bir öğrencinin birden fazla kaydı, silinen çıktının kaldığı yerden
+    # devamda yeniden üretilmesidir: son kayıt geçerlidir. Tekrar yalnızca farklı
+    # kontrol noktası dosyaları (parçalar) arasında sayılır.
+    expected = set(student_ids)
+    seen = {}
+    for path in dict.fromkeys(paths):
+        latest = {record['student_id']: record for record in read_checkpoint(path)}
+        for student_id, record in latest.items():
+            seen.setdefault(student_id, []).append(dict(record, checkpoint=path))
+    return {
+        'expected': len(expected),
+        'rendered': sum(1 for student_id in seen if student_id in expected),
+        'missing': sorted(expected - set(seen)),
+        'duplicates': {student_id: records for student_id, records in seen.items()
+                       if len(records) > 1},
+        'unexpected': sorted(set(seen) - expected),
+        'records': [records[0] for student_id, records in sorted(seen.items())]
+    }
@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shards import Checkpoint, merge_checkpoints, read_checkpoint
+
+
+def test_restart_after_partial_last_line(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    with Checkpoint(path) as checkpoint:
+        checkpoint.record({'student_id': '1', 'seconds': 0.1})
+    # Çökme: ikinci kayıt yarım yazılmış
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'student_id': '2', 'path': None})[:10])
+
+    with Checkpoint(path) as checkpoint:
+        assert set(checkpoint.done) == {'1'}
+        checkpoint.record({'student_id': '3', 'seconds': 0.1})
+
+    assert [record['student_id'] for record in read_checkpoint(path)] == ['1', '3']
+
+
+def test_partial_only_line_is_dropped(tmp_path):
+    path = str(tmp_path / 'checkpoint.jsonl')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"student_id": "1"')
+    with Checkpoint(path) as checkpoint:
+        checkpoint.record({'student_id': '2', 'seconds': 0.1})
+    assert [record['student_id'] for record in read_checkpoint(path)] == ['2']
+
+
+def test_rerendered_deleted_pdf_is_not_a_duplicate(tmp_path):
+    pdf = tmp_path / '100005.pdf'
+    pdf.write_bytes(b'%PDF')
+    path = str(tmp_path / 'checkpoint_1of2.jsonl')
+    with Checkpoint(path, '1/2') as checkpoint:
+        checkpoint.record({'student_id': '100005', 'path': str(pdf), 'seconds': 0.1})
+    other = str(tmp_path / 'checkpoint_2of2.jsonl')
+    with Checkpoint(other, '2/2') as checkpoint:
+        checkpoint.record({'student_id': '100006', 'path': None, 'seconds': 0.1})
+
+    # Çıktı silindi: kaldığı yerden devamda yeniden üretilir ve aynı dosyaya yazılır
+    pdf.unlink()
+    with Checkpoint(path, '1/2') as checkpoint:
+        assert not checkpoint.is_done('100005')
+        pdf.write_bytes(b'%PDF')
+        checkpoint.record({'student_id': '100005', 'path': str(pdf), 'seconds': 0.2})
+
+    merged = merge_checkpoints([path, other], ['100005', '100006'])
+    assert merged['duplicates'] == {}
+    assert merged['missing'] == []
+    assert [record['seconds'] for record in merged['records']] == [0.2, 0.1]
+
+
+def test_student_in_two_shards_is_a_duplicate(tmp_path):
+    paths = [str(tmp_path / f'checkpoint_{i}of2.jsonl') for i in (1, 2)]
+    for path in paths:
+        with Checkpoint(path) as checkpoint:
+            checkpoint.record({'student_id': '7', 'seconds': 0.1})
+    merged = merge_checkpoints(paths, ['7'])
+    assert [record['checkpoint'] for record in merged['duplicates']['7']] == paths
@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import validate_students
+
+SYSTEM = {'grade_system': 'letter', 'use_course_code': False, 'use_credits': True,
+          'use_ects': False}
+
+
+def errors(courses):
+    report = validate_students(SYSTEM, [({'student_id': '1'}, courses)])
+    return [(error.row, error.field, error.message) for error in report.errors]
+
+
+def course(semester, name='Ders', credits=3, grade='BB'):
+    return {'semester': semester, 'course_name': name, 'credits': credits, 'grade': grade}
+
+
+def test_whole_semesters_pass():
+    assert errors([course(1, 'A'), course(2.0, 'B'), course('3', 'C')]) == []
+
+
+def test_fractional_semester_is_rejected():
+    assert errors([course(1.5, 'A'), course('2.5', 'B')]) == [
+        (1, 'semester', "yarıyıl 1 veya daha büyük bir tam sayı olmalı"),
+        (2, 'semester', "yarıyıl 1 veya daha büyük bir tam sayı olmalı"),
+    ]
+
+
+def test_decimal_comma_credits_pass():
+    assert errors([course(1, credits='3,5')]) == []
+
+
+def test_invalid_letter_grade_is_reported():
+    assert errors([course(1, grade='XX')])[0][:2] == (1, 'grade')
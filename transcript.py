@@ -1,16 +1,35 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                           QComboBox, QTableWidget, QTableWidgetItem, 
+                           QComboBox, QTableView, QProgressBar,
                            QMessageBox, QFileDialog, QCheckBox, QGroupBox)
-from PyQt5.QtCore import Qt
-import pandas as pd
+from PyQt5.QtCore import Qt, QThreadPool
 from datetime import datetime
-from transcript_generator import TranscriptGenerator
+from course_model import CourseTableModel, read_course
+from excel_template import template_headers, template_rows
+import gpa_engine
+from workers import Worker, read_table_task, write_template_task, generate_transcript_task
+
+# İlerleme aşamalarının durum çubuğundaki adları
+STAGE_LABELS = {
+    'rows': 'satır',
+    'semesters': 'yarıyıl',
+    'pages': 'sayfa'
+}
+
+
+def format_number(value):
+    value = round(value, 2)
+    return str(int(value)) if value.is_integer() else f"{value:.2f}".rstrip('0')
+
 
 class TranscriptUI(QMainWindow):
     def __init__(self):
         super().__init__()
+        self.thread_pool = QThreadPool.globalInstance()
+        self.active_workers = set()
+        # Tablodaki dersler için canlı ortalama/kredi/AKTS toplamları
+        self.live_gpa = gpa_engine.RunningGPA()
         self.initUI()
         self.courses = []
         
@@ -108,12 +127,35 @@ class TranscriptUI(QMainWindow):
         generate_transcript_btn.clicked.connect(self.generate_transcript)
         button_group.addWidget(generate_transcript_btn)
         
+        self.cancel_btn = QPushButton("İptal")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_tasks)
+        button_group.addWidget(self.cancel_btn)
+        
         main_layout.addLayout(button_group)
         
-        # Ders Listesi Tablosu
-        self.course_table = QTableWidget()
+        # Arka plan işlerinin ilerlemesi
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        main_layout.addWidget(self.progress_bar)
+        
+        # Ders Listesi Tablosu (kolon dizileri üzerinde model; hücreler görünür oldukça çizilir)
+        self.course_model = CourseTableModel(self)
+        self.course_table = QTableView()
+        self.course_table.setModel(self.course_model)
         self.update_table_headers()
         main_layout.addWidget(self.course_table)
+        
+        # Canlı GNO / kredi / AKTS göstergesi
+        self.live_gpa_label = QLabel()
+        self.live_gpa_label.setAlignment(Qt.AlignRight)
+        main_layout.addWidget(self.live_gpa_label)
+        
+        self.course_model.dataChanged.connect(self.on_course_data_changed)
+        self.course_model.modelReset.connect(self.rebuild_live_gpa)
+        for checkbox in (self.credit_checkbox, self.course_code_checkbox, self.ects_checkbox):
+            checkbox.stateChanged.connect(self.rebuild_live_gpa)
+        self.update_live_gpa_label()
 
     def on_grade_system_change(self):
         sender = self.sender()
@@ -122,35 +164,75 @@ class TranscriptUI(QMainWindow):
                 if checkbox != sender:
                     checkbox.setChecked(False)
         self.update_table_headers()
+        self.live_gpa.set_grade_system(self.get_selected_grade_system())
+        self.update_live_gpa_label()
         
     def update_table_headers(self):
-        headers = ["Yarıyıl"]
+        headers = template_headers(
+            self.get_selected_grade_system(),
+            self.course_code_checkbox.isChecked(),
+            self.credit_checkbox.isChecked(),
+            self.ects_checkbox.isChecked()
+        )
+        self.course_model.set_headers(headers)
         
+    def course_columns(self):
+        # Seçili kolon seçeneklerine göre alan -> kolon indeksi
+        columns = {'semester': 0}
+        col_index = 1
         if self.course_code_checkbox.isChecked():
-            headers.append("Ders Kodu")
-            
-        headers.append("Ders Adı")
-        
+            columns['course_code'] = col_index
+            col_index += 1
+        columns['course_name'] = col_index
+        col_index += 1
         if self.credit_checkbox.isChecked():
-            headers.append("Kredi")
-            
+            columns['credits'] = col_index
+            col_index += 1
         if self.ects_checkbox.isChecked():
-            headers.append("AKTS")
-            
-        for system, checkbox in self.grade_systems.items():
-            if checkbox.isChecked():
-                if system == 'letter':
-                    headers.append("Harf Notu")
-                elif system == 'five':
-                    headers.append("Not (5)")
-                elif system == 'ten':
-                    headers.append("Not (10)")
-                elif system == 'hundred':
-                    headers.append("Not (100)")
-                break
-                
-        self.course_table.setColumnCount(len(headers))
-        self.course_table.setHorizontalHeaderLabels(headers)
+            columns['ects'] = col_index
+            col_index += 1
+        columns['grade'] = col_index
+        return columns
+        
+    def read_course_row(self, row, columns):
+        return read_course(self.course_model.column, row, columns)
+        
+    def on_course_data_changed(self, top_left, bottom_right, roles=None):
+        # Düzenlenen her satır için O(1) güncelleme
+        columns = self.course_columns()
+        if 'credits' not in columns:
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            try:
+                semester, course = self.read_course_row(row, columns)
+            except (TypeError, ValueError, IndexError):
+                self.live_gpa.remove(row)
+                continue
+            self.live_gpa.update(row, semester, course['credits'], course['grade'],
+                                 course.get('ects', 0))
+        self.update_live_gpa_label()
+        
+    def rebuild_live_gpa(self):
+        model = self.course_model
+        columns = self.course_columns()
+        self.live_gpa.clear()
+        if 'credits' in columns and model.rowCount() and columns['grade'] < model.columnCount():
+            self.live_gpa.load(
+                range(model.rowCount()),
+                model.column(columns['semester']),
+                model.column(columns['credits']),
+                model.column(columns['grade']),
+                model.column(columns['ects']) if 'ects' in columns else None
+            )
+        self.update_live_gpa_label()
+        
+    def update_live_gpa_label(self):
+        if not self.credit_checkbox.isChecked() or not len(self.live_gpa):
+            self.live_gpa_label.setText('')
+            return
+        self.live_gpa_label.setText(
+            f"GNO: {self.live_gpa.gpa():.2f}   Kredi: {format_number(self.live_gpa.credits)}   "
+            f"AKTS: {format_number(self.live_gpa.ects)}   ({len(self.live_gpa)} ders)")
         
     def get_selected_grade_system(self):
         for system, checkbox in self.grade_systems.items():
@@ -167,111 +249,40 @@ class TranscriptUI(QMainWindow):
             self, "Excel Şablonu Kaydet", "", "Excel Files (*.xlsx)")
             
         if file_name:
-            headers = ["Yarıyıl"]
-            example_data = [
-                ["1"],
-                ["1"],
-                ["2"]
-            ]
-            
-            if self.course_code_checkbox.isChecked():
-                headers.append("Ders Kodu")
-                for row in example_data:
-                    row.append("MAT101" if "1" in row else "FİZ101" if len(row) == 1 else "MAT102")
-                    
-            headers.append("Ders Adı")
-            for row in example_data:
-                row.append("Matematik I" if "MAT101" in row else "Fizik I" if "FİZ101" in row else "Matematik II")
-                
-            if self.credit_checkbox.isChecked():
-                headers.append("Kredi")
-                for row in example_data:
-                    row.append("3")
-                    
-            if self.ects_checkbox.isChecked():
-                headers.append("AKTS")
-                for row in example_data:
-                    row.append("5")
-                    
-            grade_system = self.get_selected_grade_system()
-            if grade_system:
-                if grade_system == 'letter':
-                    headers.append("Harf Notu")
-                    grade_example = "BB"
-                elif grade_system == 'five':
-                    headers.append("Not (5)")
-                    grade_example = "3"
-                elif grade_system == 'ten':
-                    headers.append("Not (10)")
-                    grade_example = "7"
-                elif grade_system == 'hundred':
-                    headers.append("Not (100)")
-                    grade_example = "75"
-                    
-                for row in example_data:
-                    row.append(grade_example)
-                    
-            df = pd.DataFrame(example_data, columns=headers)
+            options = (
+                self.get_selected_grade_system(),
+                self.course_code_checkbox.isChecked(),
+                self.credit_checkbox.isChecked(),
+                self.ects_checkbox.isChecked()
+            )
             
-            try:
-                writer = pd.ExcelWriter(file_name, engine='xlsxwriter')
-                df.to_excel(writer, sheet_name='Dersler', index=False)
-                
-                worksheet = writer.sheets['Dersler']
-                
-                for idx, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(col)
-                    ) + 2
-                    worksheet.set_column(idx, idx, max_length)
-                
-                header_format = writer.book.add_format({
-                    'bold': True,
-                    'bg_color': '#D3D3D3',
-                    'border': 1
-                })
-                
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                
-                writer.close()
-                
-                QMessageBox.information(
-                    self, "Başarılı", 
-                    "Excel şablonu oluşturuldu! Şablonu doldurup içe aktarabilirsiniz."
-                )
-            except Exception as e:
-                QMessageBox.warning(
-                    self, "Hata", 
-                    f"Excel şablonu oluşturulurken hata: {str(e)}"
-                )
+            self.start_task(
+                Worker(write_template_task, file_name, template_headers(*options),
+                       template_rows(*options), description="Excel şablonu"),
+                lambda _: self.statusBar().showMessage(
+                    "Excel şablonu oluşturuldu! Şablonu doldurup içe aktarabilirsiniz."),
+                "Excel şablonu oluşturulurken hata"
+            )
 
     def import_excel(self):
         file_name, _ = QFileDialog.getOpenFileName(
-            self, "Excel Dosyası Seç", "", "Excel Files (*.xlsx *.xls)")
+            self, "Excel Dosyası Seç", "",
+            "Veri Dosyaları (*.xlsx *.csv *.parquet *.arrow);;Excel Files (*.xlsx)")
         if file_name:
-            try:
-                df = pd.read_excel(file_name)
-                self.course_table.setRowCount(0)
-                self.course_table.setColumnCount(len(df.columns))
-                self.course_table.setHorizontalHeaderLabels(df.columns)
-                
-                for idx, row in df.iterrows():
-                    row_position = self.course_table.rowCount()
-                    self.course_table.insertRow(row_position)
-                    for col, value in enumerate(row):
-                        self.course_table.setItem(
-                            row_position, col, QTableWidgetItem(str(value)))
-                            
-                QMessageBox.information(
-                    self, "Başarılı", "Veriler başarıyla içe aktarıldı!")
-            except Exception as e:
-                QMessageBox.warning(
-                    self, "Hata", f"Excel dosyası yüklenirken hata: {str(e)}")
+            self.start_task(
+                Worker(read_table_task, file_name, description="Excel içe aktarma"),
+                self.on_excel_loaded,
+                "Excel dosyası yüklenirken hata"
+            )
+
+    def on_excel_loaded(self, table):
+        headers, columns = table
+        self.course_model.set_columns(headers, columns)
+        self.statusBar().showMessage(
+            f"Veriler başarıyla içe aktarıldı! ({self.course_model.rowCount()} satır)")
                 
     def generate_transcript(self):
-        if self.course_table.rowCount() == 0:
+        if self.course_model.rowCount() == 0:
             QMessageBox.warning(self, "Hata", "Lütfen önce ders verilerini yükleyin!")
             return
             
@@ -302,83 +313,86 @@ class TranscriptUI(QMainWindow):
         if not grade_system:
             QMessageBox.warning(self, "Hata", "Lütfen bir not sistemi seçin!")
             return
-            
-        transcript = TranscriptGenerator()
+
+        file_name, _ = QFileDialog.getSaveFileName(
+            self, "PDF Kaydet", "", "PDF Files (*.pdf)")
+        if not file_name:
+            return
+
+        # Doğrulama, satır okuma, GNO ve çizim iş parçacığında yapılır; tablo o an
+        # kopyalanır ki iş sürerken yapılan düzenlemeler üretimi etkilemesin
+        model = self.course_model
+        columns = {field: index for field, index in self.course_columns().items()
+                   if index < model.columnCount()}
+        snapshot = {index: model.column(index).copy() for index in columns.values()}
+        system = {
+            'grade_system': grade_system,
+            'use_credits': self.credit_checkbox.isChecked(),
+            'use_course_code': self.course_code_checkbox.isChecked(),
+            'use_ects': self.ects_checkbox.isChecked()
+        }
+        # Birden fazla öğrencinin transkripti arka planda sıraya alınabilir
+        self.start_task(
+            Worker(generate_transcript_task, student_info, system, columns, snapshot,
+                   model.rowCount(), file_name, description=student_info['name']),
+            lambda path: self.statusBar().showMessage(
+                f"Transkript PDF olarak kaydedildi! ({path})"),
+            "Transkript oluşturulurken hata",
+            show_error=True
+        )
+
+    def start_task(self, worker, on_finished, error_prefix, show_error=False):
+        # show_error: hata (ör. doğrulama raporu) durum çubuğu yerine ileti kutusunda
+        signals = worker.signals
+        signals.progress.connect(
+            lambda stage, done, total: self.on_task_progress(worker, stage, done, total))
+        signals.finished.connect(on_finished)
+        def on_error(message):
+            self.statusBar().showMessage(f"{error_prefix}: {message.splitlines()[0]}")
+            if show_error:
+                QMessageBox.warning(self, "Hata", f"{error_prefix}:\n{message}")
+
+        signals.error.connect(on_error)
+        signals.cancelled.connect(
+            lambda: self.statusBar().showMessage(f"{worker.description}: iptal edildi"))
+        for signal in (signals.finished, signals.error, signals.cancelled):
+            signal.connect(lambda *_: self.on_task_done(worker))
         
-        # Öğrenci bilgilerini ekle
-        transcript.add_student_info(**student_info)
+        self.active_workers.add(worker)
+        self.update_task_state()
+        self.thread_pool.start(worker)
         
-        # Sistem bilgilerini ekle
-        transcript.set_system_info(
-            grade_system, 
-            self.credit_checkbox.isChecked(),
-            self.course_code_checkbox.isChecked(),
-            self.ects_checkbox.isChecked()
-        )
+    def on_task_progress(self, worker, stage, done, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        label = STAGE_LABELS.get(stage, stage)
+        if total:
+            message = f"{worker.description}: {done}/{total} {label}"
+        else:
+            message = f"{worker.description}: {label} okunuyor..."
+        self.statusBar().showMessage(message)
         
-        # Dersleri ekle
-        try:
-            current_semester = None
-            semester_courses = []
-            
-            for row in range(self.course_table.rowCount()):
-                semester = self.course_table.item(row, 0).text()
-                semester_num = int(semester.split('.')[0] if '.' in semester else semester)
-                
-                if current_semester is None:
-                    current_semester = semester_num
-                
-                if semester_num != current_semester:
-                    # Önceki yarıyıl derslerini ekle
-                    transcript.add_semester_courses(current_semester, semester_courses)
-                    semester_courses = []
-                    current_semester = semester_num
-                
-                col_index = 1
-                course_data = {}
-                
-                if self.course_code_checkbox.isChecked():
-                    course_data['course_code'] = self.course_table.item(row, col_index).text()
-                    col_index += 1
-                    
-                course_data['course_name'] = self.course_table.item(row, col_index).text()
-                col_index += 1
-                
-                if self.credit_checkbox.isChecked():
-                    course_data['credits'] = float(self.course_table.item(row, col_index).text())
-                    col_index += 1
-                    
-                if self.ects_checkbox.isChecked():
-                    course_data['ects'] = float(self.course_table.item(row, col_index).text())
-                    col_index += 1
-                    
-                course_data['grade'] = self.course_table.item(row, col_index).text()
-                
-                semester_courses.append(course_data)
-            
-            # Son yarıyıl derslerini ekle
-            if semester_courses:
-                transcript.add_semester_courses(current_semester, semester_courses)
-                
-            file_name, _ = QFileDialog.getSaveFileName(
-                self, "PDF Kaydet", "", "PDF Files (*.pdf)")
-            if file_name:
-                try:
-                    transcript.generate_pdf(file_name)
-                    QMessageBox.information(
-                        self, "Başarılı", 
-                        "Transkript PDF olarak kaydedildi!"
-                    )
-                except Exception as e:
-                    QMessageBox.warning(
-                        self, "Hata", 
-                        f"PDF oluşturulurken hata: {str(e)}"
-                    )
-        except Exception as e:
-            QMessageBox.warning(
-                self, "Hata", 
-                f"Transkript oluşturulurken hata: {str(e)}"
-            )
+    def on_task_done(self, worker):
+        self.active_workers.discard(worker)
+        self.update_task_state()
+        
+    def update_task_state(self):
+        busy = bool(self.active_workers)
+        self.progress_bar.setVisible(busy)
+        self.cancel_btn.setEnabled(busy)
+        if busy:
+            self.setWindowTitle(f'Transkript Oluşturucu ({len(self.active_workers)} iş)')
+        else:
+            self.setWindowTitle('Transkript Oluşturucu')
+        
+    def cancel_tasks(self):
+        for worker in list(self.active_workers):
+            worker.cancel()
+        
+    def closeEvent(self, event):
+        self.cancel_tasks()
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
@@ -1,10 +1,38 @@
 from fpdf import FPDF
 from datetime import datetime
-import os
+from courses import Course, to_courses
+import gpa_engine
+import grade_scales
+import instrumentation
+import layout
+import output_profiles
+import resource_cache
+import sys
+
+# Öğrenci bilgisi bloğu: (etiket, student_info anahtarı)
+STUDENT_INFO_FIELDS = [
+    ('Adı Soyadı', 'name'),
+    ('Öğrenci No', 'student_id'),
+    ('Fakülte', 'faculty'),
+    ('Bölüm', 'department'),
+    ('Mezuniyet Tarihi', 'graduation_date'),  # Program yerine Mezuniyet Tarihi
+    ('Başlangıç Yılı', 'start_year')
+]
+# Başlıklar (y=9) ve sonrasındaki 25 mm boşluktan sonra
+STUDENT_INFO_Y = 34
+# Dersler, öğrenci bilgileri ve ardından gelen 10 mm boşluktan sonra başlar
+BODY_TOP = STUDENT_INFO_Y + 15
+# Sayfa düzeni değiştiğinde artırılır; render_cache anahtarının parçasıdır
+TEMPLATE_VERSION = 2
 
 class TranscriptGenerator:
-    def __init__(self):
-        self.pdf = FPDF()
+    def __init__(self, recorder=None, grade_conversion=None, output_profile=None):
+        # Çıktı boyutu ayarları (output_profiles): sıkıştırma, font ipuçları, logo
+        self.output_profile = output_profiles.get_profile(output_profile)
+        # Notun yanında gösterilecek karşılığın ölçeği (ör. 'letter': "85 (BA)")
+        self.grade_conversion = grade_conversion
+        # Aşama süreleri/sayaçları (instrumentation); varsayılan kapalı kaydedici
+        self.recorder = recorder or instrumentation.get_recorder()
         self.student_info = {}
         self.courses = []
         self.grade_system = None
@@ -12,10 +40,33 @@ class TranscriptGenerator:
         self.use_course_code = None
         self.use_ects = None
         self.semester_courses = {}
-        
-        # Türkçe karakter desteği için font ayarları
-        self.pdf.add_font("Roboto", "", os.path.join(os.path.dirname(__file__), "Roboto-Regular.ttf"))
-        self.pdf.add_font("Roboto", "B", os.path.join(os.path.dirname(__file__), "Roboto-Bold.ttf"))
+        self.gpa_summary = None
+        # Ders kataloğu (catalog.CourseCatalog): yalnızca kodu verilen derslerin adı/kredisi
+        self.catalog = None
+        self.program = None
+        # Ders eklendikçe güncellenen kredi/puan toplamları
+        self.running_gpa = gpa_engine.RunningGPA()
+        self._new_document()
+
+    def _new_document(self):
+        self.pdf = FPDF()
+        # Türkçe karakter desteği için font ayarları (süreç genelinde önbellekten)
+        resource_cache.install_fonts(self.pdf)
+
+    def reset(self):
+        # Nesneyi bir sonraki öğrenci için hazırlar (generator_pool): öğrenci, ders ve GNO
+        # durumu temizlenir, boş bir belge açılır. Ayarlar (not sistemi, şablon, çıktı
+        # profili, katalog, kaydedici) korunur; çözümlenmiş fontlar süreç önbelleğindedir.
+        # Hiç çizilmemiş belge (ör. önbellek isabeti) olduğu gibi yeniden kullanılır;
+        # çizilmiş belgenin fontları çıktıda alt kümelendiği için yenisi açılır.
+        self.student_info = {}
+        self.courses = []
+        self.semester_courses = {}
+        self.gpa_summary = None
+        self.running_gpa.clear()
+        if self.pdf.page:
+            self._new_document()
+        return self
 
     def add_student_info(self, **kwargs):
         # Varsayılan değerler
@@ -37,234 +88,378 @@ class TranscriptGenerator:
                 
         self.student_info.update(kwargs)
 
+    def set_catalog(self, catalog, program=None):
+        # program verilmezse öğrencinin bölümüne özgü katalog kayıtları kullanılır
+        self.catalog = catalog
+        self.program = program
+
+    def _resolve(self, courses):
+        if self.catalog is None:
+            return to_courses(courses)
+        program = self.program or self.student_info.get('department')
+        return to_courses(self.catalog.resolve(course, program) for course in courses)
+
     def add_course(self, course_code=None, semester=None, **course_data):
-        course = course_data
-        if course_code:
-            course['course_code'] = course_code
-        if semester:
-            course['semester'] = semester
+        course = Course(course_code=course_code or None, semester=semester or None, **course_data)
+        if self.catalog is not None:
+            course = self._resolve([course])[0]
         self.courses.append(course)
+        self._track_course(('course', len(self.courses) - 1), course.semester, course)
         
     def add_courses(self, courses):
+        # Sözlük veya Course kabul edilir, Course olarak saklanır
+        start = len(self.courses)
+        courses = self._resolve(courses)
         self.courses.extend(courses)
+        for i, course in enumerate(courses, start):
+            self._track_course(('course', i), course.semester, course)
 
     def add_semester_courses(self, semester, courses):
+        for i in range(len(self.semester_courses.get(semester, ()))):
+            self.running_gpa.remove(('semester', semester, i))
+        courses = self._resolve(courses)
         self.semester_courses[semester] = courses
+        for i, course in enumerate(courses):
+            self._track_course(('semester', semester, i), semester, course)
+
+    def _track_course(self, key, semester, course):
+        if course.credits is not None and course.grade is not None:
+            self.running_gpa.add(key, semester or 0, course.credits, course.grade,
+                                 course.ects or 0)
 
     def set_system_info(self, grade_system, use_credits, use_course_code=False, use_ects=False):
+        self.running_gpa.set_grade_system(grade_system)
         self.grade_system = grade_system
         self.use_credits = use_credits
         self.use_course_code = use_course_code
         self.use_ects = use_ects
 
-    def calculate_gpa(self):
-        if not self.use_credits or not self.courses:
+    def set_grade_conversion(self, target):
+        # target: ölçek adı ya da grade_scales ölçeği; None dönüşümü kapatır
+        self.grade_conversion = target
+
+    def grade_labels(self):
+        # Yarıyıl -> ders sırasıyla not metinleri; dönüşüm yoksa None.
+        # Tüm notlar tek dizide, tek geçişte dönüştürülür.
+        if not self.grade_conversion or not self.grade_system:
             return None
+        semesters = sorted(self.semester_courses)
+        grades = [course.get('grade', '') for semester in semesters
+                  for course in self.semester_courses[semester]]
+        converted = grade_scales.convert_labels(grades, self.grade_system,
+                                                self.grade_conversion)
+        labels = {}
+        position = 0
+        for semester in semesters:
+            count = len(self.semester_courses[semester])
+            labels[semester] = [
+                f"{grade} ({other})" if other else str(grade)
+                for grade, other in zip(grades[position:position + count],
+                                        converted[position:position + count])
+            ]
+            position += count
+        return labels
 
-        total_credits = 0
-        total_points = 0
+    def scale_definitions(self):
+        # Önbellek anahtarı için: kullanılan ölçeklerin tanımları (fakülteye özgü olabilir)
+        definitions = []
+        for name in (self.grade_system, self.grade_conversion):
+            try:
+                definitions.append(grade_scales.get_scale(name).to_dict() if name else None)
+            except ValueError:
+                definitions.append(name)
+        return definitions
 
-        grade_points = {
-            'AA': 4.0, 'BA': 3.5, 'BB': 3.0, 'CB': 2.5,
-            'CC': 2.0, 'DC': 1.5, 'DD': 1.0, 'FF': 0.0
-        }
+    def set_gpa_summary(self, summary):
+        # Kohort motorunda önceden hesaplanmış sonuç (gpa_engine.CohortGPA.for_student)
+        self.gpa_summary = summary
 
-        for course in self.courses:
-            if 'credits' in course and 'grade' in course:
-                credits = float(course['credits'])
-                grade = course['grade']
-                
-                if self.grade_system == 'letter':
-                    points = grade_points.get(grade, 0)
-                elif self.grade_system == 'five':
-                    points = float(grade) / 1.25
-                elif self.grade_system == 'ten':
-                    points = float(grade) / 2.5
-                elif self.grade_system == 'hundred':
-                    points = float(grade) / 25
-                
-                total_credits += credits
-                total_points += credits * points
+    def compute_gpa_summary(self):
+        if self.gpa_summary is not None:
+            return self.gpa_summary
+        return self.running_gpa.summary()
+
+    def calculate_gpa(self):
+        if not self.use_credits:
+            return None
+        summary = self.compute_gpa_summary()
+        return summary['gpa'] if summary is not None else None
 
-        return total_points / total_credits if total_credits > 0 else 0
+    def document_date(self):
+        # Belgede basılan tarih (render_cache anahtarına da girer)
+        return datetime.now().strftime("%d.%m.%Y")
 
-    def generate_pdf(self, filename):
+    @staticmethod
+    def draw_static_layer(pdf, logo_variant=None):
+        # Her transkriptte aynı olan içerik: logo, başlıklar ve öğrenci bilgisi etiketleri
+        # Logo ekleme (logo_variant: çıktı profiline göre küçültülmüş/yeniden kodlanmış logo)
         try:
-            # PDF oluştur
-            pdf = self.pdf
+            logo_path = resource_cache.install_logo(pdf, logo_variant)
+            if logo_path:
+                pdf.image(logo_path, x=10, y=3, w=resource_cache.LOGO_WIDTH)
+            else:
+                print(f"Logo dosyası bulunamadı: {resource_cache.LOGO_PATH}")
+        except Exception as e:
+            print(f"Logo yüklenirken hata oluştu: {str(e)}")
+
+        # Üniversite adı
+        pdf.set_font('Roboto', 'B', 12)
+        pdf.set_text_color(0, 0, 0)
+        pdf.set_y(8)
+        pdf.cell(0, 6, 'İSTANBUL TEKNİK ÜNİVERSİTESİ', 0, 1, 'C')
+
+        # Belge adı (fakülte satırı öğrenciye göre değişir, altına yazılır)
+        pdf.set_font('Roboto', 'B', 8)
+        pdf.set_y(19)
+        pdf.cell(0, 5, 'TRANSKRİPT BELGESİ', 0, 1, 'C')
+
+        # Öğrenci bilgisi etiketleri - 3 Kolon halinde, her kolonda 2 bilgi
+        pdf.set_font('Roboto', '', 7)
+        pdf.set_text_color(80, 80, 80)
+        col_width = (pdf.w - 20) / 3
+        for i, (label, _) in enumerate(STUDENT_INFO_FIELDS):
+            col = i // 2
+            row = i % 2
+            pdf.set_xy(10 + (col * col_width), STUDENT_INFO_Y + (row * 5))
+            pdf.cell(25, 5, f'{label}:', 0, 0)
+
+    def draw_header_values(self, pdf):
+        # Fakülte adı
+        pdf.set_font('Roboto', 'B', 8)
+        pdf.set_text_color(0, 0, 0)
+        pdf.set_y(14)
+        pdf.cell(0, 5, self.student_info.get('faculty', 'FEN EDEBİYAT FAKÜLTESİ'), 0, 1, 'C')
+
+        # Sadece tarih bilgisi
+        pdf.set_font('Roboto', '', 6)
+        pdf.set_text_color(80, 80, 80)
+        current_time = self.document_date()
+        pdf.set_xy(pdf.w - 45, 5)
+        pdf.cell(35, 4, f'{current_time}', 0, 1, 'R')
+
+    def draw_student_info_values(self, pdf):
+        # Öğrenci bilgisi değerleri, etiketlerin yanına
+        pdf.set_font('Roboto', 'B', 7)
+        col_width = (pdf.w - 20) / 3
+        for i, (_, field) in enumerate(STUDENT_INFO_FIELDS):
+            col = i // 2
+            row = i % 2
+            pdf.set_xy(10 + (col * col_width) + 25, STUDENT_INFO_Y + (row * 5))
+            pdf.cell(col_width - 25, 5, self.student_info.get(field, ''), 0, 0)
+
+    def render_into(self, pdf, bookmark=None, progress=None):
+        # Transkripti verilen belgeye yeni sayfa(lar) olarak çizer.
+        # Birden fazla öğrenci aynı belgeye art arda çizilebilir (cohort_writer).
+        # progress(aşama, tamamlanan, toplam): isteğe bağlı ilerleme bildirimi
+        recorder = self.recorder
+        logo_variant = self.output_profile.logo_variant()
+        with recorder.span('fonts'):
+            resource_cache.install_fonts(pdf)
+        with recorder.span('logo'):
+            resource_cache.get_logo(logo_variant)
+        with recorder.span('static_layer'):
             pdf.add_page()
-            pdf.set_auto_page_break(auto=True, margin=10)
+            # Sayfa sonlarını yerleşim planı belirler
+            pdf.set_auto_page_break(auto=False, margin=10)
+            if bookmark:
+                # Birleşik belgede öğrenci başına yer imi
+                pdf.start_section(bookmark)
             
-            # Logo ekleme
+            self.draw_static_layer(pdf, logo_variant)
+        with recorder.span('header'):
+            self.draw_header_values(pdf)
+        with recorder.span('student_info'):
+            self.draw_student_info_values(pdf)
+        
+        # Yerleşim önceden hesaplanır (layout); sayfa sonları ve satır yükseklikleri hazırdır
+        with recorder.span('gpa'):
+            gpa_summary = self.compute_gpa_summary() if self.use_credits else None
+        gpa = gpa_summary['gpa'] if gpa_summary else None
+        with recorder.span('layout'):
+            plan = layout.layout_transcript(self, BODY_TOP, gpa is not None)
+        semester_summaries = gpa_summary['semesters'] if gpa_summary else {}
+        total_semesters = len(self.semester_courses)
+        done_semesters = 0
+
+        # Yarıyıl tabloları ve alt bilgi (GNO, dekan) sayfalara bölünebildiği için aşama
+        # süreleri plan öğeleri arasında elle açılıp kapatılır
+        semester_span = footer_span = None
+        with recorder.span('body', pages=plan.page_count):
             try:
-                logo_path = os.path.join(os.path.dirname(__file__), 'logo.png')
-                if os.path.exists(logo_path):
-                    pdf.image(logo_path, x=10, y=3, w=40)
-                else:
-                    print(f"Logo dosyası bulunamadı: {logo_path}")
-            except Exception as e:
-                print(f"Logo yüklenirken hata oluştu: {str(e)}")
-            
-            # Üniversite adı
-            pdf.set_font('Roboto', 'B', 12)
-            pdf.set_text_color(0, 0, 0)
-            pdf.set_y(8)
-            pdf.cell(0, 6, 'İSTANBUL TEKNİK ÜNİVERSİTESİ', 0, 1, 'C')
-            
-            # Fakülte adı
-            pdf.set_font('Roboto', 'B', 8)
-            pdf.cell(0, 5, self.student_info.get('faculty', 'FEN EDEBİYAT FAKÜLTESİ'), 0, 1, 'C')
-            
-            # Belge adı
-            pdf.set_font('Roboto', 'B', 8)
-            pdf.cell(0, 5, 'TRANSKRİPT BELGESİ', 0, 1, 'C')
-            
-            # Sadece tarih bilgisi
-            pdf.set_font('Roboto', '', 6)
-            pdf.set_text_color(80, 80, 80)
-            current_time = datetime.now().strftime("%d.%m.%Y")
-            pdf.set_xy(pdf.w - 45, 5)
-            pdf.cell(35, 4, f'{current_time}', 0, 1, 'R')
-            
-            # Başlıklar sonrası boşluk
-            pdf.ln(25)
-            
-            # Öğrenci Bilgileri - 3 Kolon halinde
-            y_start = pdf.get_y()
-            
-            student_info = [
-                ('Adı Soyadı', self.student_info.get('name', '')),
-                ('Öğrenci No', self.student_info.get('student_id', '')),
-                ('Fakülte', self.student_info.get('faculty', '')),
-                ('Bölüm', self.student_info.get('department', '')),
-                ('Mezuniyet Tarihi', self.student_info.get('graduation_date', '')),  # Program yerine Mezuniyet Tarihi
-                ('Başlangıç Yılı', self.student_info.get('start_year', ''))
-            ]
-            
-            # Her kolonda 2 bilgi olacak şekilde düzenle
-            col_width = (pdf.w - 20) / 3
-            for i, (label, value) in enumerate(student_info):
-                col = i // 2
-                row = i % 2
-                x_pos = 10 + (col * col_width)
-                y_pos = y_start + (row * 5)
-                
-                pdf.set_xy(x_pos, y_pos)
-                pdf.set_font('Roboto', '', 7)
-                pdf.cell(25, 5, f'{label}:', 0, 0)
-                pdf.set_font('Roboto', 'B', 7)
-                pdf.cell(col_width - 25, 5, value, 0, 0)
-            
-            # Öğrenci bilgileri ile dersler arası boşluk
-            pdf.ln(10)
+                for page_index, page in enumerate(plan.pages):
+                    if page_index:
+                        pdf.add_page()
+                    for kind, y, data in page:
+                        if kind == 'row':
+                            self.draw_course_row(pdf, y, data, plan.widths)
+                        elif kind == 'semester':
+                            semester, continued = data
+                            summary = None
+                            if not continued:
+                                summary = semester_summaries.get(int(semester))
+                                semester_span = recorder.span(
+                                    'semester', semester=semester,
+                                    rows=len(self.semester_courses[semester]))
+                                semester_span.__enter__()
+                            self.draw_semester_header(pdf, y, semester, summary, continued)
+                        elif kind == 'table_header':
+                            self.draw_table_header(pdf, y, plan.widths)
+                        elif kind == 'semester_end':
+                            semester_span.__exit__(None, None, None)
+                            semester_span = None
+                            done_semesters += 1
+                            recorder.count('course_rows', len(self.semester_courses[data]))
+                            if progress:
+                                progress('semesters', done_semesters, total_semesters)
+                        elif kind == 'continuation':
+                            self.draw_continuation(pdf, y, page_index + 1, plan.page_count)
+                        elif kind in ('gpa', 'dean'):
+                            if footer_span is None:
+                                footer_span = recorder.span('footer')
+                                footer_span.__enter__()
+                            if kind == 'gpa':
+                                self.draw_gpa(pdf, y, gpa)
+                            else:
+                                self.draw_dean(pdf, y)
+            except BaseException:
+                # Yarım kalan aşama hata bilgisiyle kaydedilir
+                for span in (semester_span, footer_span):
+                    if span is not None:
+                        span.__exit__(*sys.exc_info())
+                raise
+            if footer_span is not None:
+                footer_span.__exit__(None, None, None)
 
-            # Dersleri yarıyıllara göre sırala
-            sorted_semesters = sorted(self.semester_courses.keys())
-            page_width = pdf.w - 20
-            
-            for semester_idx, semester in enumerate(sorted_semesters):
-                # Yarıyıl başlığı
-                y_start = pdf.get_y()
-                pdf.set_fill_color(245, 245, 245)
-                pdf.rect(10, y_start, page_width, 6, 'F')
-                
-                pdf.set_font('Roboto', 'B', 8)
-                pdf.set_text_color(0, 0, 0)
-                pdf.cell(0, 6, f'{semester}. Yarıyıl', 0, 1, 'L')
-                
-                courses = self.semester_courses[semester]
-                total_courses = len(courses)
-                courses_per_column = (total_courses + 1) // 2
-                
-                col_width = page_width / 2
-                
-                if self.use_course_code:
-                    code_width = col_width * 0.2
-                    name_width = col_width * 0.6
-                    grade_width = col_width * 0.2
-                else:
-                    name_width = col_width * 0.8
-                    grade_width = col_width * 0.2
-                
-                # Tablo başlıkları
-                pdf.set_font('Roboto', '', 6)
-                pdf.set_text_color(80, 80, 80)
-                
-                x_start = pdf.get_x()
-                if self.use_course_code:
-                    pdf.cell(code_width, 4, 'Ders Kodu', 0)
-                pdf.cell(name_width, 4, 'Ders Adı', 0)
-                pdf.cell(grade_width, 4, 'Not', 0)
-                
-                pdf.set_x(x_start + col_width)
-                if self.use_course_code:
-                    pdf.cell(code_width, 4, 'Ders Kodu', 0)
-                pdf.cell(name_width, 4, 'Ders Adı', 0)
-                pdf.cell(grade_width, 4, 'Not', 0)
-                pdf.ln()
-                
-                # İnce çizgi
-                pdf.set_draw_color(220, 220, 220)
-                pdf.line(10, pdf.get_y(), pdf.w - 10, pdf.get_y())
-                
-                # Dersleri yazdır
+    def page_count(self):
+        # Çizim yapmadan sayfa sayısı (toplu iş planlaması)
+        gpa = self.calculate_gpa()
+        return layout.layout_transcript(self, BODY_TOP, gpa is not None).page_count
+
+    def draw_semester_header(self, pdf, y, semester, summary, continued=False):
+        page_width = pdf.w - 20
+        pdf.set_fill_color(245, 245, 245)
+        pdf.rect(10, y, page_width, layout.SEMESTER_HEADER_HEIGHT, 'F')
+        pdf.set_xy(10, y)
+
+        pdf.set_font('Roboto', 'B', 8)
+        pdf.set_text_color(0, 0, 0)
+        title = f'{semester}. Yarıyıl (devam)' if continued else f'{semester}. Yarıyıl'
+        if summary:
+            # Yarıyıl ortalaması ve kredi toplamı, başlık satırının sağında
+            pdf.cell(0, 6, title, 0, 0, 'L')
+            pdf.set_x(10)
+            pdf.set_font('Roboto', '', 7)
+            pdf.cell(0, 6, f"Yarıyıl Ort.: {summary['gpa']:.2f}   "
+                           f"Kredi: {summary['credits']:g}   "
+                           f"Genel Ort.: {summary['cumulative_gpa']:.2f}",
+                     0, 1, 'R')
+        else:
+            pdf.cell(0, 6, title, 0, 1, 'L')
+
+    def draw_table_header(self, pdf, y, widths):
+        # Tablo başlıkları, iki kolon için
+        pdf.set_font('Roboto', '', 6)
+        pdf.set_text_color(80, 80, 80)
+        for x in (10, 10 + widths.column):
+            pdf.set_xy(x, y)
+            if self.use_course_code:
+                pdf.cell(widths.code, 4, 'Ders Kodu', 0)
+            pdf.cell(widths.name, 4, 'Ders Adı', 0)
+            pdf.cell(widths.grade, 4, 'Not', 0)
+
+        # İnce çizgi
+        line_y = y + layout.TABLE_HEADER_HEIGHT
+        pdf.set_draw_color(220, 220, 220)
+        pdf.line(10, line_y, pdf.w - 10, line_y)
+
+        pdf.set_font('Roboto', '', 7)
+        pdf.set_text_color(0, 0, 0)
+
+    def draw_course_row(self, pdf, y, row, widths):
+        for x, cell in ((10, row.left), (10 + widths.column, row.right)):
+            if cell is None:
+                continue
+            pdf.set_xy(x, y)
+            if self.use_course_code:
+                pdf.set_font('Roboto', 'B', 7)
+                pdf.cell(widths.code, 5, cell.code, 0)
                 pdf.set_font('Roboto', '', 7)
-                pdf.set_text_color(0, 0, 0)
-                
-                for i in range(courses_per_column):
-                    x_start = pdf.get_x()
-                    
-                    if i < len(courses):
-                        course = courses[i]
-                        if self.use_course_code:
-                            pdf.set_font('Roboto', 'B', 7)
-                            pdf.cell(code_width, 5, course.get('course_code', ''), 0)
-                            pdf.set_font('Roboto', '', 7)
-                        pdf.cell(name_width, 5, course.get('course_name', ''), 0)
-                        pdf.set_font('Roboto', 'B', 7)
-                        pdf.cell(grade_width, 5, str(course.get('grade', '')), 0)
-                        pdf.set_font('Roboto', '', 7)
-                    
-                    right_idx = i + courses_per_column
-                    if right_idx < len(courses):
-                        pdf.set_x(x_start + col_width)
-                        course = courses[right_idx]
-                        if self.use_course_code:
-                            pdf.set_font('Roboto', 'B', 7)
-                            pdf.cell(code_width, 5, course.get('course_code', ''), 0)
-                            pdf.set_font('Roboto', '', 7)
-                        pdf.cell(name_width, 5, course.get('course_name', ''), 0)
-                        pdf.set_font('Roboto', 'B', 7)
-                        pdf.cell(grade_width, 5, str(course.get('grade', '')), 0)
-                        pdf.set_font('Roboto', '', 7)
-                    
-                    pdf.ln()
-                
-                # Yarıyıllar arası boşluk
-                if semester_idx < len(sorted_semesters) - 1:
-                    pdf.ln(1)
-            
-            # GPA
-            if pdf.page_no() == 1:  # Sadece ilk sayfada göster
-                if self.use_credits:
-                    gpa = self.calculate_gpa()
-                    if gpa is not None:
-                        pdf.ln(5)
-                        pdf.set_font('Roboto', 'B', 8)
-                        pdf.set_text_color(0, 0, 0)
-                        pdf.cell(0, 6, f'Genel Not Ortalaması: {gpa:.2f}', 0, 1, 'R')
-                
-                # Dekan bilgisi - sadece ilk sayfada
-                pdf.set_y(279)
-                pdf.set_font('Roboto', '', 8)
-                pdf.set_text_color(0, 0, 0)
-                dean_title = self.student_info.get('dean_title', 'Fen Edebiyat Fakültesi Dekanı')
-                pdf.cell(0, 4, dean_title, 0, 1, 'R')
-                pdf.set_font('Roboto', 'B', 8)
-                dean_name = self.student_info.get('dean_name', '')
-                pdf.cell(0, 4, dean_name, 0, 1, 'R')
-
-            pdf.output(filename)
+            name_x = pdf.get_x()
+            pdf.cell(widths.name, 5, cell.name_lines[0], 0)
+            pdf.set_font('Roboto', 'B', 7)
+            pdf.cell(widths.grade, 5, cell.grade, 0)
+            pdf.set_font('Roboto', '', 7)
+            # Sarılan ders adının devam satırları
+            for line_index, line in enumerate(cell.name_lines[1:], 1):
+                pdf.set_xy(name_x, y + line_index * layout.LINE_HEIGHT)
+                pdf.cell(widths.name, 5, line, 0)
+
+    def draw_continuation(self, pdf, y, page_number, page_count):
+        # Devam sayfalarında öğrenci ve sayfa bilgisi
+        pdf.set_font('Roboto', '', 7)
+        pdf.set_text_color(80, 80, 80)
+        pdf.set_xy(10, y)
+        pdf.cell(0, 5, f"{self.student_info.get('name', '')} - "
+                       f"{self.student_info.get('student_id', '')}", 0, 0, 'L')
+        pdf.set_x(10)
+        pdf.cell(0, 5, f'Sayfa {page_number}/{page_count}', 0, 0, 'R')
+
+    def draw_gpa(self, pdf, y, gpa):
+        pdf.set_xy(10, y)
+        pdf.set_font('Roboto', 'B', 8)
+        pdf.set_text_color(0, 0, 0)
+        pdf.cell(0, 6, f'Genel Not Ortalaması: {gpa:.2f}', 0, 1, 'R')
+
+    def draw_dean(self, pdf, y):
+        # Dekan bilgisi - öğrencinin son sayfasında
+        pdf.set_xy(10, y)
+        pdf.set_font('Roboto', '', 8)
+        pdf.set_text_color(0, 0, 0)
+        dean_title = self.student_info.get('dean_title', 'Fen Edebiyat Fakültesi Dekanı')
+        pdf.cell(0, 4, dean_title, 0, 1, 'R')
+        pdf.set_font('Roboto', 'B', 8)
+        dean_name = self.student_info.get('dean_name', '')
+        pdf.cell(0, 4, dean_name, 0, 1, 'R')
+
+    def render_bytes(self, progress=None):
+        # PDF'i bellekte üretir; fpdf'in kendi tamponu kopyalanmadan döner (bytearray)
+        recorder = self.recorder
+        try:
+            # Belge daha önce çizildiyse yeni belge açılır; ikinci çağrı sayfaları eklemez
+            if self.pdf.page:
+                self._new_document()
+            # PDF oluştur
+            pdf = self.pdf
+            with recorder.span('render'):
+                self.render_into(pdf, progress=progress)
+
+            with recorder.span('output'), output_profiles.applied(self.output_profile, pdf):
+                data = pdf.output()
+            if recorder.enabled:
+                recorder.count('documents')
+                recorder.count('pages', pdf.page_no())
+                recorder.count('bytes', len(data))
+            if progress:
+                progress('pages', pdf.page_no(), pdf.page_no())
+            return data
         except Exception as e:
+            recorder.count('errors', error=type(e).__name__)
+            print(f"PDF oluşturulurken hata: {str(e)}")
+            raise
+
+    def render_to(self, stream, progress=None):
+        # Yazılabilir ikili akışa (açık dosya, BytesIO, arşiv girdisi...) yazar; bayt sayısı döner
+        data = self.render_bytes(progress)
+        stream.write(data)
+        return len(data)
+
+    def generate_pdf(self, filename, progress=None):
+        # Dosya ancak PDF bellekte hazır olunca açılır; hata durumunda yarım dosya kalmaz
+        data = self.render_bytes(progress)
+        try:
+            with open(filename, 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            self.recorder.count('errors', error=type(e).__name__)
             print(f"PDF oluşturulurken hata: {str(e)}")
             raise
\ No newline at end of file
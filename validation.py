@@ -0,0 +1,280 @@
+import numpy as np
+
+from grade_scales import get_scale
+from ingestion import COURSE_COLUMNS, GRADE_COLUMNS, parse_number
+
+# Çizimden önce tüm ders tablosu üzerinde tek geçişlik doğrulama.
+# Kolonlar numpy dizileri olarak alınır; her kontrol tekil değerler üzerinde yapılıp
+# (np.unique + ters indeks) satırlara geri dağıtılır. Böylece 50 bin satırlık bir dosyada
+# yalnızca birkaç yüz farklı değer Python tarafında incelenir ve satır başına istisna
+# fırlatılmaz. Tüm hatalar konumlarıyla birlikte tek bir raporda döner.
+
+FIELD_LABELS = {
+    'student_id': 'Öğrenci No',
+    'semester': 'Yarıyıl',
+    'course_code': 'Ders Kodu',
+    'course_name': 'Ders Adı',
+    'credits': 'Kredi',
+    'ects': 'AKTS',
+    'grade': 'Not'
+}
+
+
+class ValidationError:
+    __slots__ = ('row', 'student_id', 'field', 'value', 'message')
+
+    def __init__(self, row, student_id, field, value, message):
+        self.row = row
+        self.student_id = student_id
+        self.field = field
+        self.value = value
+        self.message = message
+
+    def location(self):
+        parts = []
+        if self.student_id:
+            parts.append(f"Öğrenci {self.student_id}")
+        if self.row is not None:
+            parts.append(f"satır {self.row}")
+        if self.field:
+            parts.append(FIELD_LABELS.get(self.field, self.field))
+        return ', '.join(parts)
+
+    def __str__(self):
+        value = '' if self.value is None else f" ({self.value!r})"
+        return f"{self.location()}: {self.message}{value}"
+
+    def to_dict(self):
+        return {'row': self.row, 'student_id': self.student_id, 'field': self.field,
+                'value': self.value, 'message': self.message}
+
+
+class ValidationReport:
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.errors = []
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def counts(self):
+        # Alan -> hata sayısı
+        result = {}
+        for error in self.errors:
+            result[error.field] = result.get(error.field, 0) + 1
+        return result
+
+    def summary(self):
+        if self.ok:
+            return f"{self.row_count} satır doğrulandı, hata yok"
+        counts = ', '.join(f"{FIELD_LABELS.get(field, field or 'kolon')}: {count}"
+                           for field, count in self.counts().items())
+        return f"{self.row_count} satırda {len(self.errors)} hata ({counts})"
+
+    def format(self, limit=30):
+        lines = [self.summary()]
+        lines += [str(error) for error in self.errors[:limit]]
+        if len(self.errors) > limit:
+            lines.append(f"... ve {len(self.errors) - limit} hata daha")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        return {'rows': self.row_count, 'ok': self.ok, 'counts': self.counts(),
+                'errors': [error.to_dict() for error in self.errors]}
+
+
+def _is_null(column):
+    # None, NaN ve boş/boşluk metin
+    column = np.asarray(column)
+    if column.dtype.kind == 'f':
+        return np.isnan(column)
+    if column.dtype.kind in 'iub':
+        return np.zeros(len(column), dtype=bool)
+    column = column.astype(object)
+    text = column.astype(str)
+    return np.equal(column, None) | (column != column) | (np.char.strip(text) == '')
+
+
+def _check_unique(column, check):
+    # check(değer) -> hata mesajı ya da None; her tekil değer için bir kez çağrılır
+    column = np.asarray(column)
+    if column.dtype.kind == 'O':
+        keys = column.astype(str)
+        uniques, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        values = column[first]
+    else:
+        values, inverse = np.unique(column, return_inverse=True)
+    messages = np.array([check(value) for value in values], dtype=object)
+    return messages[inverse.reshape(-1)]
+
+
+def _number(value):
+    if isinstance(value, (np.integer, np.floating)):
+        return float(value)
+    try:
+        return parse_number(value)
+    except ValueError:
+        return None
+
+
+def _semester_message(value):
+    number = _number(value)
+    if number is None:
+        text = str(value).strip()
+        head = text.split('.')[0]
+        if not head.isdigit():
+            return "yarıyıl numarası okunamadı"
+        number = float(head)
+    # 1.5 gibi kesirli değerler sonradan kırpılır ya da yanlış gruplanırdı
+    if number != number or number < 1 or number != int(number):
+        return "yarıyıl 1 veya daha büyük bir tam sayı olmalı"
+    return None
+
+
+def _positive_number_message(value):
+    number = _number(value)
+    if number is None or number != number:
+        return "sayı değil"
+    if number < 0:
+        return "negatif olamaz"
+    return None
+
+
+def _grade_checker(scale):
+    if scale.kind == 'letter':
+        valid = set(scale.grade_points)
+        expected = ', '.join(scale.grade_points)
+
+        def check(value):
+            if str(value).strip() in valid:
+                return None
+            return f"geçerli harf notu değil ({expected})"
+        return check
+
+    def check(value):
+        number = _number(value)
+        if number is None or number != number:
+            return "sayı değil"
+        if not 0 <= number <= scale.maximum:
+            return f"not 0 ile {scale.maximum:g} arasında olmalı"
+        return None
+    return check
+
+
+def required_fields(system):
+    fields = ['semester', 'course_name', 'grade']
+    if system.get('use_course_code'):
+        fields.append('course_code')
+    if system.get('use_credits'):
+        fields.append('credits')
+    if system.get('use_ects'):
+        fields.append('ects')
+    return fields
+
+
+def fields_from_headers(headers, columns, grade_system):
+    # Başlıklı tablo (ingestion.read_table) -> alan -> kolon
+    names = dict(COURSE_COLUMNS)
+    names.update({h: 'grade' for h, s in GRADE_COLUMNS.items() if s == grade_system})
+    return {names[h]: column for h, column in zip(headers, columns) if h in names}
+
+
+def validate(fields, system, rows=None):
+    # fields: alan adı -> kolon dizisi; system: grade_system ve use_* bayrakları
+    # rows: raporda gösterilecek satır numaraları (varsayılan: 1'den başlayan sıra)
+    row_count = len(next(iter(fields.values()))) if fields else 0
+    report = ValidationReport(row_count)
+    grade_system = system.get('grade_system')
+
+    missing = [field for field in required_fields(system) if field not in fields]
+    for field in missing:
+        report.errors.append(ValidationError(None, None, field, None, "kolon bulunamadı"))
+    try:
+        scale = get_scale(grade_system)
+    except ValueError:
+        scale = None
+        report.errors.append(ValidationError(None, None, 'grade', grade_system,
+                                             "bilinmeyen not sistemi"))
+    if not row_count:
+        return report
+
+    rows = np.arange(1, row_count + 1) if rows is None else np.asarray(rows)
+    student_ids = fields.get('student_id')
+    student_ids = (np.asarray(student_ids, dtype=object).astype(str)
+                   if student_ids is not None else None)
+
+    checks = [('semester', _semester_message)]
+    if system.get('use_credits'):
+        checks.append(('credits', _positive_number_message))
+    if system.get('use_ects'):
+        checks.append(('ects', _positive_number_message))
+    if scale is not None:
+        checks.append(('grade', _grade_checker(scale)))
+
+    # (satır indeksi, alan, mesaj) — sonra satır sırasına dizilir
+    found = []
+    for field, check in checks:
+        if field not in fields:
+            continue
+        column = np.asarray(fields[field])
+        null = _is_null(column)
+        for i in np.flatnonzero(null):
+            found.append((i, field, "boş"))
+        messages = np.empty(row_count, dtype=object)
+        present = ~null
+        if present.any():
+            messages[present] = _check_unique(column[present], check)
+        for i in np.flatnonzero(present & np.not_equal(messages, None)):
+            found.append((i, field, messages[i]))
+
+    name_field = 'course_code' if system.get('use_course_code') else 'course_name'
+    if name_field in fields:
+        null = _is_null(fields[name_field])
+        for i in np.flatnonzero(null):
+            found.append((i, name_field, "boş"))
+        # Aynı öğrencinin aynı yarıyılda aynı dersi birden fazla kez alması
+        if 'semester' in fields:
+            keys = np.asarray(fields['semester'], dtype=object).astype(str)
+            keys = np.char.add(np.char.add(keys, '\x00'),
+                               np.char.strip(np.asarray(fields[name_field],
+                                                        dtype=object).astype(str)))
+            if student_ids is not None:
+                keys = np.char.add(np.char.add(student_ids, '\x00'), keys)
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            duplicate = (first[inverse] != np.arange(row_count)) & ~null
+            for i in np.flatnonzero(duplicate):
+                first_row = rows[first[inverse[i]]]
+                found.append((i, name_field,
+                              f"aynı yarıyılda tekrar eden ders (ilk: satır {first_row})"))
+
+    found.sort(key=lambda item: item[0])
+    for i, field, message in found:
+        value = fields[field][i]
+        value = value.item() if hasattr(value, 'item') else value
+        report.errors.append(ValidationError(
+            int(rows[i]), student_ids[i] if student_ids is not None else None,
+            field, None if message == "boş" else value, message))
+    return report
+
+
+def validate_students(system, students):
+    # Toplu iş kohortu ((öğrenci bilgisi, ders satırları) listesi) için: satır numarası
+    # öğrencinin kendi ders listesindeki sıradır
+    student_ids, rows = [], []
+    values = {field: [] for field in COURSE_COLUMNS.values() if field != 'student_id'}
+    values['grade'] = []
+    for student_info, courses in students:
+        for index, row in enumerate(courses, 1):
+            student_ids.append(student_info.get('student_id', ''))
+            rows.append(index)
+            for field, column in values.items():
+                column.append(row.get(field))
+    fields = {'student_id': student_ids}
+    for field, column in values.items():
+        if any(value is not None for value in column):
+            array = np.empty(len(column), dtype=object)
+            array[:] = column
+            fields[field] = array
+    return validate(fields, system, rows)
@@ -0,0 +1,217 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+import resource_cache
+from batch import load_cohort, run_batch
+from ingestion import FILE_FORMATS
+from transcript_generator import TEMPLATE_VERSION
+from validation import validate_students
+
+# İzleme kipi: bir klasördeki kohort dosyaları değiştikçe yalnızca satırları değişen
+# öğrencilerin transkriptleri yeniden üretilir.
+#   - Klasör aralıklarla taranır (dosya değişikliği: mtime + boyut); ek bağımlılık yoktur.
+#   - Art arda kaydetmeler birleştirilir: dosya debounce saniye boyunca değişmeden
+#     kalınca işlenir. Kaydetme sırasında okunamayan dosya bir sonraki turda denenir.
+#   - Her öğrencinin girdisinin (sistem ayarları, öğrenci bilgileri, dersler) özeti
+#     kalıcı bir dizinde (<çıktı>/.watch_index.json) tutulur; yeniden başlatmada
+#     yalnızca özeti değişen öğrenciler üretilir.
+# Kullanım: python watch.py girdiler -o transkriptler -j 4
+
+INDEX_NAME = '.watch_index.json'
+INDEX_VERSION = 1
+WATCHED_EXTENSIONS = tuple(FILE_FORMATS) + ('.json',)
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def student_digest(system, student_info, courses):
+    text = json.dumps([system, student_info, courses], sort_keys=True, ensure_ascii=False,
+                      default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SnapshotIndex:
+    # {"version", "settings", "files": {ad: {"signature", "students": {no: özet}}}}
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.files = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            # Üretim ayarları değiştiyse eski özetler geçersizdir (tam yeniden üretim)
+            if data.get('version') == INDEX_VERSION and data.get('settings') == settings:
+                self.files = data.get('files', {})
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'settings': self.settings,
+                           'files': self.files}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class CohortWatcher:
+    def __init__(self, input_dir, output_dir, workers=None, options=None, debounce=2.0):
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.workers = workers
+        self.options = options or {}
+        self.debounce = debounce
+        # Şablon sürümü ya da font/logo değişince tüm öğrenciler yeniden üretilir
+        # (render_cache anahtarıyla aynı bileşenler)
+        settings = dict(self.options, template=TEMPLATE_VERSION,
+                        assets=resource_cache.assets_digest())
+        self.index = SnapshotIndex(os.path.join(output_dir, INDEX_NAME), settings)
+        # ad -> (imza, imzanın ilk görüldüğü an)
+        self._pending = {}
+
+    def scan(self):
+        # Klasördeki kohort dosyaları -> imza; geçici kayıt dosyaları (~$...) atlanır
+        signatures = {}
+        for name in sorted(os.listdir(self.input_dir)):
+            if name.startswith(('~$', '.')) or not name.lower().endswith(WATCHED_EXTENSIONS):
+                continue
+            try:
+                signatures[name] = file_signature(os.path.join(self.input_dir, name))
+            except FileNotFoundError:
+                continue
+        return signatures
+
+    def poll(self, now=None, force=False):
+        # Değişen dosyaları bekleme listesine alır; debounce süresince değişmeyenleri işler
+        # (force: beklemeden hepsini işler)
+        now = time.monotonic() if now is None else now
+        signatures = self.scan()
+        for name, signature in signatures.items():
+            known = self.index.files.get(name, {}).get('signature')
+            if signature == known:
+                self._pending.pop(name, None)
+                continue
+            pending = self._pending.get(name)
+            if pending is None or pending[0] != signature:
+                self._pending[name] = (signature, now)
+        for name in [n for n in self._pending if n not in signatures]:
+            del self._pending[name]
+
+        processed = []
+        for name, (signature, seen) in list(self._pending.items()):
+            if force or now - seen >= self.debounce:
+                if self.process(name, signature):
+                    del self._pending[name]
+                else:
+                    # Okunamadı (ör. kaydetme sürüyor): bir sonraki değişiklik/turda yeniden
+                    self._pending[name] = (signature, now)
+                processed.append(name)
+        return processed
+
+    def process(self, name, signature):
+        path = os.path.join(self.input_dir, name)
+        try:
+            system, students = load_cohort(path)
+        except Exception as e:
+            log(f"{name} okunamadı: {type(e).__name__}: {e}")
+            return False
+
+        entry = self.index.files.get(name, {})
+        previous = entry.get('students', {})
+        digests = {}
+        changed = []
+        for student_info, courses in students:
+            student_id = student_info['student_id']
+            digest = student_digest(system, student_info, courses)
+            digests[student_id] = digest
+            if previous.get(student_id) != digest:
+                changed.append((student_info, courses))
+        removed = sorted(set(previous) - set(digests))
+
+        results = []
+        if changed:
+            validation = validate_students(system, changed)
+            if not validation.ok:
+                log(f"{name}: {validation.format(20)}")
+            output_dir = os.path.join(self.output_dir, os.path.splitext(name)[0])
+            try:
+                results, summary = run_batch(system, changed, output_dir, self.workers,
+                                             options=self.options)
+            except Exception as e:
+                # Ör. çıktı klasörü yazılamıyor, işçi havuzu çöktü: dizin güncellenmez,
+                # dosya bir sonraki turda yeniden denenir
+                log(f"{name} üretilemedi: {type(e).__name__}: {e}")
+                return False
+            log(f"{name}: {len(changed)}/{len(students)} öğrenci yeniden üretildi "
+                f"({summary['failed']} hatalı, {summary['seconds']:.1f} sn)")
+        else:
+            log(f"{name}: değişen öğrenci yok")
+        if removed:
+            log(f"{name}: dosyadan çıkarılan öğrenciler (PDF'leri silinmedi): "
+                f"{', '.join(removed[:20])}")
+
+        # Hatalı öğrencilerin özeti kaydedilmez; düzeltilince yeniden denenir
+        for result in results:
+            if not result['ok']:
+                digests.pop(result['student_id'], None)
+                log(f"HATA {result['student_id']}: {result['error']}")
+        self.index.files[name] = {'signature': signature, 'students': digests}
+        self.index.save()
+        return True
+
+    def run(self, interval=1.0, once=False):
+        log(f"{self.input_dir} izleniyor -> {self.output_dir}")
+        while True:
+            if once:
+                # Tek tur: bekleyen her dosya hemen işlenir
+                self.poll(force=True)
+                return
+            self.poll()
+            time.sleep(interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Kohort klasörünü izle, değişen öğrencilerin transkriptlerini üret")
+    parser.add_argument('input_dir', help="Kohort dosyalarının (.xlsx, .csv, .json...) klasörü")
+    parser.add_argument('-o', '--output-dir', default='transcripts',
+                        help="PDF'lerin yazılacağı klasör (her dosya için alt klasör)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--interval', type=float, default=1.0, help="Tarama aralığı (sn)")
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help="Dosya bu kadar süre değişmeden kalınca işlenir (sn)")
+    parser.add_argument('--once', action='store_true',
+                        help="Bekleyen değişiklikleri bir kez işle ve çık")
+    args = parser.parse_args(argv)
+
+    watcher = CohortWatcher(args.input_dir, args.output_dir, args.workers,
+                            debounce=args.debounce)
+    try:
+        watcher.run(args.interval, args.once)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
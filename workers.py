@@ -0,0 +1,118 @@
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+# Uzun satır döngülerinde ilerleme (ve iptal denetimi) bu kadar satırda bir
+REPORT_EVERY = 1000
+
+
+class TaskCancelled(BaseException):
+    # asyncio.CancelledError gibi BaseException'dan türer; böylece işin içindeki
+    # "except Exception" blokları iptali hata olarak yakalayıp raporlamaz
+    pass
+
+
+class WorkerSignals(QObject):
+    progress = pyqtSignal(str, int, int)  # aşama, tamamlanan, toplam
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class Worker(QRunnable):
+    # fn(worker, *args, **kwargs) iş parçacığı havuzunda çalışır.
+    # İlerleme worker.report() ile bildirilir; iptal istenmişse report()
+    # TaskCancelled fırlatır ve iş yarıda bırakılır.
+
+    def __init__(self, fn, *args, description='', **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.description = description
+        self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report(self, stage, done, total):
+        self.check_cancelled()
+        self.signals.progress.emit(stage, done, total)
+
+    def run(self):
+        try:
+            self.check_cancelled()
+            result = self.fn(self, *self.args, **self.kwargs)
+        except TaskCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+def read_table_task(worker, file_name):
+    # Satırlar parça parça okunur; her parçada ilerleme bildirilir (ve iptal denetlenir)
+    import ingestion
+
+    worker.report('rows', 0, 0)
+    headers, columns = ingestion.read_table(file_name, progress=worker.report)
+    row_count = len(columns[0]) if columns else 0
+    worker.report('rows', row_count, row_count)
+    return headers, columns
+
+
+def write_template_task(worker, file_name, headers, rows):
+    import excel_template
+
+    worker.report('rows', 0, len(rows))
+    excel_template.write_template(file_name, headers, rows)
+    worker.report('rows', len(rows), len(rows))
+    return file_name
+
+
+def generate_transcript_task(worker, student_info, system, columns, snapshot, row_count,
+                             file_name):
+    # Arayüz iş parçacığı yalnızca tablonun kopyasını alır; doğrulama, satır okuma,
+    # GNO ve çizim burada yapılır. columns: alan -> kolon indeksi, snapshot: indeks -> dizi
+    # Doğrulama hataları iş hatası (error sinyali) olarak döner.
+    from course_model import read_course
+    from transcript_generator import TranscriptGenerator
+    from validation import validate
+
+    worker.report('rows', 0, row_count)
+    report = validate({field: snapshot[index] for field, index in columns.items()}, system)
+    if not report.ok:
+        raise ValueError(report.format())
+
+    transcript = TranscriptGenerator()
+    transcript.add_student_info(**student_info)
+    transcript.set_system_info(system['grade_system'], system['use_credits'],
+                               system['use_course_code'], system['use_ects'])
+    # Ardışık aynı yarıyıl satırları tek grupta eklenir
+    current_semester = None
+    semester_courses = []
+    for row in range(row_count):
+        semester_num, course_data = read_course(snapshot.__getitem__, row, columns)
+        if semester_num != current_semester and semester_courses:
+            transcript.add_semester_courses(current_semester, semester_courses)
+            semester_courses = []
+        current_semester = semester_num
+        semester_courses.append(course_data)
+        if row % REPORT_EVERY == 0:
+            worker.report('rows', row, row_count)
+    if semester_courses:
+        transcript.add_semester_courses(current_semester, semester_courses)
+    worker.report('rows', row_count, row_count)
+
+    transcript.generate_pdf(file_name, progress=worker.report)
+    return file_name